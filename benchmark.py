@@ -0,0 +1,354 @@
+# Banco de pruebas de rendimiento de los tres analizadores.
+# Genera oraciones válidas e inválidas de largo y profundidad controlados a partir de cualquier gramática,
+# agrega casos patológicos (paréntesis muy anidados, gramática ambigua S -> S S | a), mide el tiempo de cada
+# análisis y la memoria pico, y escribe un JSON que se puede comparar con el de una versión anterior.
+#
+# Uso: python benchmark.py > resultados.json
+#      python benchmark.py --gramaticas aritmetica.txt --largos 10 100 1000 --oraciones 50
+#      python benchmark.py --comparar anterior.json > actual.json
+#
+# Los programas que dependen de bibliotecas ausentes (NetworkX, matplotlib) se marcan como omitidos.
+
+import argparse  # Lectura de los argumentos de la línea de comandos
+import json  # Resultados legibles por otros programas
+import platform  # Datos del equipo donde se midió
+import random  # Generación reproducible de oraciones
+import sys  # Salida estándar y límite de recursión
+import time  # Medición de tiempos
+import tracemalloc  # Memoria pico de cada análisis
+
+from nucleo.analizadorEarley import analizarEarley  # Referencia para saber si una oración pertenece al lenguaje
+from nucleo.gramaticaCompilada import GramaticaCompilada, cargarGramaticaCompilada  # Gramáticas compiladas
+from nucleo.normalizacion import normalizarGramatica  # La gramática ambigua en memoria se normaliza aquí
+
+VERSION_FORMATO = 1  # Cambiar si cambia la estructura del JSON
+INFINITO = float('inf')
+
+# Gramática patológica incluida en el banco (Vt, Vxt, S, P): recursiva por la izquierda y ambigua
+NOMBRE_AMBIGUA = 'S -> S S | a'
+AMBIGUA = ({'a'}, {'S'}, 'S', [('S', ['S', 'S']), ('S', ['a'])])
+
+
+def calcularMinimos(Vt, Vxt, P):
+    # Función para calcular, por no terminal, el menor número de terminales y la menor altura de lo que deriva.
+    # Los no terminales que no derivan ninguna cadena quedan en infinito.
+    largo = {A: INFINITO for A in Vxt}
+    altura = {A: INFINITO for A in Vxt}
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            l = sum(largo[s] if s in Vxt else 0 if s == 'ε' else 1 for s in der)
+            h = 1 + max((altura[s] for s in der if s in Vxt), default=0)
+            if l < largo[izq]:
+                largo[izq] = l
+                cambio = True
+            if h < altura[izq]:
+                altura[izq] = h
+                cambio = True
+    return largo, altura
+
+
+class Generador:
+    # Generador de oraciones de una gramática con un largo y una profundidad de árbol objetivo.
+
+    def __init__(self, gramatica, semilla=0):
+        self.gramatica = gramatica
+        self.azar = random.Random(semilla)
+        self.largo, self.altura = calcularMinimos(gramatica.Vt, gramatica.Vxt, gramatica.P)
+        self.opciones = {}  # No terminal -> [(der, largoMinimo, alturaMinima)] solo con producciones productivas
+        for izq, ders in gramatica.porIzquierda.items():
+            self.opciones[izq] = [(der, self._largoMinimo(der), self._alturaMinima(der)) for der in ders
+                                  if self._largoMinimo(der) < INFINITO]
+
+    def _largoMinimo(self, simbolos):
+        return sum(self.largo[s] if s in self.largo else 0 if s == 'ε' else 1 for s in simbolos)
+
+    def _alturaMinima(self, simbolos):
+        return 1 + max((self.altura[s] for s in simbolos if s in self.altura), default=0)
+
+    def oracion(self, largo, profundidad):
+        # Función para generar una lista de terminales derivada por la izquierda desde el símbolo inicial.
+        # Mientras quede presupuesto se prefieren producciones que alargan la oración; al llegar a la
+        # profundidad máxima se cierran las ramas por el camino más bajo.
+        g, azar = self.gramatica, self.azar
+        if self.largo[g.S] == INFINITO:
+            raise ValueError("La gramática no genera ninguna cadena.")
+        salida = []
+        pila = [(g.S, 1)]  # (símbolo, nivel en el árbol); el tope es el símbolo más a la izquierda
+        pendiente = self.largo[g.S]  # Terminales mínimos que faltan por los símbolos de la pila
+        while pila:
+            simbolo, nivel = pila.pop()
+            if simbolo not in self.opciones:  # Terminal o ε
+                if simbolo != 'ε':
+                    salida.append(simbolo)
+                    pendiente -= 1
+                continue
+            pendiente -= self.largo[simbolo]
+            opciones = self.opciones[simbolo]
+            presupuesto = largo - len(salida) - pendiente  # Terminales que caben en este símbolo
+            if nivel >= profundidad:
+                menor = min(h for _, _, h in opciones)
+                candidatas = [o for o in opciones if o[2] == menor]  # Cierra la rama lo antes posible
+            else:
+                caben = [o for o in opciones if o[1] <= presupuesto] or [min(opciones, key=lambda o: o[1])]
+                menor = min(l for _, l, _ in caben)
+                largas = [o for o in caben if o[1] > menor]
+                candidatas = largas if largas and azar.random() < 0.5 else caben
+            der, minimo, _ = azar.choice(candidatas)
+            pendiente += minimo
+            pila.extend((s, nivel + 1) for s in reversed(der))
+        return salida
+
+    def pertenece(self, tokens):
+        # Función para decidir con el analizador de Earley si la oración pertenece al lenguaje.
+        g = self.gramatica
+        return analizarEarley(tokens, g.Vt, g.Vxt, g.S, g.P, g.earley, conBosque=False)[0]
+
+    def invalida(self, largo, profundidad, intentos=20):
+        # Función para obtener una oración que no pertenece al lenguaje alterando una válida (o None si no se logra).
+        terminales = sorted(self.gramatica.Vt)
+        for _ in range(intentos):
+            tokens = self.oracion(largo, profundidad)
+            operacion, i = self.azar.randrange(3), self.azar.randrange(len(tokens) + 1)
+            if operacion == 0 and i < len(tokens):
+                del tokens[i]  # Borra un token
+            elif operacion == 1 or i == len(tokens):
+                tokens.insert(i, self.azar.choice(terminales))  # Inserta un terminal
+            else:
+                tokens[i] = self.azar.choice(terminales)  # Cambia un token
+            if not self.pertenece(tokens):
+                return tokens
+        return None
+
+
+# Adaptadores de cada programa: reciben la gramática compilada y retornan analizar(cadena) -> bool,
+# o None si el programa no se aplica a la gramática. Importan el programa solo cuando se usa.
+
+def _aritmeticaLL1(g):
+    from arbolAritmetica import validarCadena
+    if g.tabla is None:
+        return None  # La gramática no es LL(1)
+    return lambda cadena: validarCadena(cadena, g.Vt, g.Vxt, g.S, g.P, g.tabla)[0]
+
+
+def _aritmeticaRetroceso(g):
+    from arbolAritmetica import validarCadena
+    return lambda cadena: validarCadena(cadena, g.Vt, g.Vxt, g.S, g.P)[0]
+
+
+def _bnfValidar(g):
+    from arbolGramaticaBNF import validarCadena
+    return lambda cadena: validarCadena(cadena, g.Vt, g.Vxt, g.S, g.P)
+
+
+def _bnfConstruir(g):
+    import networkx  # El grafo se arma con NetworkX; sin ella el adaptador se omite
+    from arbolGramaticaBNF import construirArbol
+    return lambda cadena: construirArbol(cadena, g.S, g.P, g.Vt) is not None
+
+
+# Los adaptadores de generarArbolDG reciben la gramática normalizada, igual que su main: el packrat no
+# deriva la recursión por la izquierda y con la tabla LL(1) de la normalizada el análisis es lineal.
+
+def _dgDerivar(g):
+    from generarArbolDG import derivarArbol
+    reglas = {A: [' '.join(der) for der in ders] for A, ders in g.porIzquierda.items()}  # Formato de interpretarGramatica
+    return lambda cadena: derivarArbol(reglas, g.S, g.lexico.tipos(cadena), normalizacion=g.normalizacion,
+                                       tabla=g.tabla)[1]
+
+
+def _dgConstruir(g):
+    import networkx  # El grafo se arma con NetworkX; sin ella el adaptador se omite
+    from generarArbolDG import construirArbol
+    reglas = {A: [' '.join(der) for der in ders] for A, ders in g.porIzquierda.items()}  # Formato de interpretarGramatica
+    return lambda cadena: construirArbol(reglas, g.S, g.lexico.tipos(cadena), normalizacion=g.normalizacion,
+                                         tabla=g.tabla)[2]
+
+
+ANALIZADORES = {
+    'arbolAritmetica.validarCadena[ll1]': _aritmeticaLL1,
+    'arbolAritmetica.validarCadena[retroceso]': _aritmeticaRetroceso,
+    'arbolGramaticaBNF.validarCadena': _bnfValidar,
+    'arbolGramaticaBNF.construirArbol': _bnfConstruir,
+    'generarArbolDG.derivarArbol': _dgDerivar,
+    'generarArbolDG.construirArbol': _dgConstruir,
+}
+USAN_NORMALIZADA = {'generarArbolDG.derivarArbol', 'generarArbolDG.construirArbol'}  # Reciben la gramática normalizada
+
+
+def percentil(ordenados, p):
+    # Función para obtener el percentil p (0-100) de una lista ordenada por el método del rango más cercano.
+    return ordenados[max(0, -(-len(ordenados) * p // 100) - 1)]
+
+
+def medir(analizar, oraciones, esperados, muestrasMemoria=10):
+    # Función para medir un analizador sobre un conjunto de oraciones; retorna el diccionario de resultados.
+    analizar(oraciones[0])  # Calentamiento: importaciones diferidas, cachés y léxicos
+    latencias, aceptadas, incorrectas = [], 0, 0
+    for cadena, esperado in zip(oraciones, esperados):
+        inicio = time.perf_counter()
+        resultado = analizar(cadena)
+        latencias.append(time.perf_counter() - inicio)
+        aceptadas += bool(resultado)
+        incorrectas += bool(resultado) != esperado
+    total = sum(latencias)
+    tokens = sum(len(cadena.split()) for cadena in oraciones)  # Las oraciones generadas separan los tokens con espacios
+
+    # La memoria se mide aparte porque tracemalloc hace más lento cada análisis
+    pico = 0
+    tracemalloc.start()
+    try:
+        for cadena in oraciones[:muestrasMemoria]:
+            tracemalloc.reset_peak()
+            analizar(cadena)
+            pico = max(pico, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+
+    latencias.sort()
+    return {
+        'oraciones': len(oraciones),
+        'tokens': tokens,
+        'aceptadas': aceptadas,
+        'incorrectas': incorrectas,  # Resultados que no coinciden con el analizador de Earley
+        'segundos': total,
+        'oracionesPorSegundo': len(oraciones) / total if total else None,
+        'tokensPorSegundo': tokens / total if total else None,
+        'latenciaMs': {f'p{p}': percentil(latencias, p) * 1000 for p in (50, 90, 99)} | {'max': latencias[-1] * 1000},
+        'memoriaPicoBytes': pico,
+    }
+
+
+def generarCasos(nombre, gramatica, largos, profundidad, cantidad, semilla):
+    # Generador de casos (gramatica, caso, largo, oraciones, esperados) de una gramática cargada.
+    generador = Generador(gramatica, semilla)
+    for largo in largos:
+        validas = [generador.oracion(largo, profundidad) for _ in range(cantidad)]
+        yield nombre, 'validas', largo, [' '.join(t) for t in validas], [True] * len(validas)
+        invalidas = [t for t in (generador.invalida(largo, profundidad) for _ in range(cantidad)) if t is not None]
+        if invalidas:
+            yield nombre, 'invalidas', largo, [' '.join(t) for t in invalidas], [False] * len(invalidas)
+
+
+def casosPatologicos(conAritmetica, largos, largosAmbigua):
+    # Generador de casos patológicos: paréntesis anidados (válidos y sin cerrar) con aritmetica.txt
+    # y a^n con la gramática ambigua S -> S S | a, que tiene un número catalán de árboles.
+    if conAritmetica:
+        for largo in largos:
+            yield 'aritmetica.txt', 'parentesisAnidados', largo, [' '.join('(' * largo + '1' + ')' * largo)], [True]
+            yield 'aritmetica.txt', 'parentesisSinCerrar', largo, [' '.join('(' * largo + '1')], [False]
+    for largo in largosAmbigua:
+        yield NOMBRE_AMBIGUA, 'ambiguaSS', largo, [' '.join('a' * largo)], [True]
+
+
+def ejecutar(args):
+    # Función para correr todos los casos contra todos los analizadores; retorna el documento JSON.
+    gramaticas = {archivo: cargarGramaticaCompilada(archivo, usarCache=not args.sin_cache) for archivo in args.gramaticas}
+    casos = []
+    for archivo, gramatica in gramaticas.items():
+        casos.extend(generarCasos(archivo, gramatica, args.largos, args.profundidad, args.oraciones, args.semilla))
+    casos.extend(casosPatologicos('aritmetica.txt' in gramaticas, args.largos, args.largos_ambigua))
+    gramaticas[NOMBRE_AMBIGUA] = GramaticaCompilada(*AMBIGUA)
+    nombres = args.analizadores or list(ANALIZADORES)
+    normalizadas = {}  # Archivo -> gramática normalizada con normalizar={} como en generarArbolDG.main
+    if USAN_NORMALIZADA.intersection(nombres):
+        normalizadas = {archivo: cargarGramaticaCompilada(archivo, usarCache=not args.sin_cache, normalizar={})
+                        for archivo in args.gramaticas}
+        ambigua = normalizarGramatica(*AMBIGUA)
+        normalizadas[NOMBRE_AMBIGUA] = GramaticaCompilada(ambigua.Vt, ambigua.Vxt, ambigua.S, ambigua.P, ambigua)
+
+    resultados = []
+    for nombre in nombres:
+        excedidos = set()  # (gramatica, caso) que ya superaron el límite de tiempo en un largo menor
+        for archivo, caso, largo, oraciones, esperados in casos:
+            fila = {'analizador': nombre, 'gramatica': archivo, 'caso': caso, 'largo': largo}
+            try:
+                analizar = ANALIZADORES[nombre](normalizadas[archivo] if nombre in USAN_NORMALIZADA
+                                                else gramaticas[archivo])
+            except ImportError as e:
+                resultados.append({**fila, 'omitido': f"dependencia ausente: {e.name}"})
+                continue
+            if analizar is None:
+                resultados.append({**fila, 'omitido': "no aplica a esta gramática"})
+                continue
+            if (archivo, caso) in excedidos:
+                resultados.append({**fila, 'omitido': "límite de tiempo superado con un largo menor"})
+                continue
+            try:
+                medicion = medir(analizar, oraciones, esperados)
+            except ImportError as e:  # Dependencia que el programa carga recién al analizar
+                resultados.append({**fila, 'omitido': f"dependencia ausente: {e.name}"})
+                continue
+            except RecursionError:
+                resultados.append({**fila, 'error': f"RecursionError (límite {sys.getrecursionlimit()})"})
+                continue
+            if medicion['segundos'] > args.limite:
+                excedidos.add((archivo, caso))
+            resultados.append({**fila, **medicion})
+            print(f"{nombre} {archivo} {caso} {largo}: {medicion['segundos']:.3f} s", file=sys.stderr)
+
+    return {
+        'version': VERSION_FORMATO,
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parametros': {'gramaticas': args.gramaticas, 'largos': args.largos, 'largosAmbigua': args.largos_ambigua,
+                       'profundidad': args.profundidad,
+                       'oraciones': args.oraciones, 'semilla': args.semilla},
+        'resultados': resultados,
+    }
+
+
+def comparar(anterior, actual, umbral):
+    # Función para comparar la mediana de latencia con una ejecución anterior; retorna las filas más lentas.
+    clave = lambda r: (r['analizador'], r['gramatica'], r['caso'], r['largo'])
+    previos = {clave(r): r for r in anterior['resultados'] if 'latenciaMs' in r}
+    regresiones = []
+    for r in actual['resultados']:
+        previo = previos.get(clave(r))
+        if previo is None or 'latenciaMs' not in r or not previo['latenciaMs']['p50']:
+            continue
+        razon = r['latenciaMs']['p50'] / previo['latenciaMs']['p50']
+        if razon > umbral:
+            regresiones.append((clave(r), razon))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mide el rendimiento de los analizadores y escribe los resultados en JSON.")
+    parser.add_argument('--gramaticas', nargs='+', default=['aritmetica.txt', 'gramatica.txt', 'pruebas.txt'],
+                        help="archivos de gramática de los que se generan oraciones")
+    parser.add_argument('--analizadores', nargs='+', choices=list(ANALIZADORES), help="analizadores a medir (todos por defecto)")
+    parser.add_argument('--largos', nargs='+', type=int, default=[10, 100, 1000], help="largos objetivo en tokens")
+    parser.add_argument('--largos-ambigua', nargs='+', type=int, default=[8, 16, 32, 64],
+                        help="largos de a^n con la gramática ambigua (el bosque crece en forma cúbica)")
+    parser.add_argument('--profundidad', type=int, default=40, help="profundidad máxima del árbol de las oraciones generadas")
+    parser.add_argument('--oraciones', type=int, default=20, help="oraciones por conjunto")
+    parser.add_argument('--semilla', type=int, default=0, help="semilla del generador")
+    parser.add_argument('--limite', type=float, default=10.0,
+                        help="segundos por conjunto a partir de los cuales no se prueban largos mayores")
+    parser.add_argument('--comparar', help="JSON de una ejecución anterior con el que se comparan las latencias")
+    parser.add_argument('--umbral', type=float, default=1.25, help="razón de latencia a partir de la cual hay regresión")
+    parser.add_argument('--sin-cache', action='store_true', help="no leer ni escribir la caché de gramáticas compiladas")
+    args = parser.parse_args(argv)
+
+    try:
+        documento = ejecutar(args)
+        json.dump(documento, sys.stdout, ensure_ascii=False, indent=1)
+        sys.stdout.write('\n')
+        if args.comparar:
+            with open(args.comparar, 'r', encoding='utf-8') as f:
+                regresiones = comparar(json.load(f), documento, args.umbral)
+            for clave, razon in regresiones:
+                print(f"Regresión: {' / '.join(map(str, clave))} es {razon:.2f} veces más lento", file=sys.stderr)
+            if regresiones:
+                return 2  # Distinto del código de error para poder usarlo en integración continua
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)  # Maneja errores de lectura o de gramática
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+# Comprobación del arranque: importa el núcleo y cada programa en un intérprete nuevo, mide cuánto tarda
+# la importación y verifica que no se cargue matplotlib ni NetworkX y que importar no ejecute nada
+# (sin salida y sin pedir datos por la entrada estándar).
+#
+# Uso: python comprobarArranque.py
+#      python comprobarArranque.py --limite 20 --repeticiones 10
+
+import argparse  # Lectura de los argumentos de la línea de comandos
+import os  # Directorio de los módulos
+import subprocess  # Intérpretes nuevos para cada medición
+import sys  # Intérprete actual
+
+PROHIBIDOS = ('matplotlib', 'networkx', 'pygraphviz')  # Solo se cargan al dibujar
+MODULOS = ('nucleo', 'arbolAritmetica', 'arbolGramaticaBNF', 'generarArbolDG', 'validarLote', 'benchmark')
+
+PRUEBA = """import sys, time
+inicio = time.perf_counter()
+import {modulo}
+fin = time.perf_counter()
+print(fin - inicio, ','.join(m for m in {prohibidos!r} if m in sys.modules))
+"""
+
+
+def medirImportacion(modulo, repeticiones=5):
+    # Función para importar el módulo en intérpretes nuevos; retorna (menor tiempo en ms, módulos prohibidos cargados).
+    # Se toma el menor tiempo porque las demás mediciones solo agregan ruido del sistema.
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    tiempos, cargados = [], set()
+    for _ in range(repeticiones):
+        proceso = subprocess.run([sys.executable, '-c', PRUEBA.format(modulo=modulo, prohibidos=PROHIBIDOS)],
+                                 cwd=directorio, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+        lineas = proceso.stdout.splitlines()
+        if proceso.returncode != 0 or len(lineas) != 1:  # Falló o escribió algo al importarse
+            raise RuntimeError(f"Importar '{modulo}' no está libre de efectos:\n{proceso.stdout}{proceso.stderr}")
+        tiempo, _, prohibidos = lineas[0].partition(' ')
+        tiempos.append(float(tiempo) * 1000)
+        cargados.update(filter(None, prohibidos.split(',')))
+    return min(tiempos), sorted(cargados)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica que el núcleo se importe rápido y sin bibliotecas de graficación.")
+    parser.add_argument('--limite', type=float, default=30.0, help="milisegundos máximos para importar el núcleo")
+    parser.add_argument('--repeticiones', type=int, default=5, help="importaciones por módulo (se toma la más rápida)")
+    args = parser.parse_args(argv)
+
+    correcto = True
+    for modulo in MODULOS:
+        try:
+            tiempo, cargados = medirImportacion(modulo, args.repeticiones)
+        except RuntimeError as e:
+            print(f"ERROR {e}")
+            correcto = False
+            continue
+        problemas = [f"carga {', '.join(cargados)}"] if cargados else []
+        if modulo == 'nucleo' and tiempo > args.limite:
+            problemas.append(f"supera el límite de {args.limite:.0f} ms")
+        print(f"{'ERROR' if problemas else 'ok'} {modulo}: {tiempo:.1f} ms {'; '.join(problemas)}".rstrip())
+        correcto = correcto and not problemas
+    return 0 if correcto else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
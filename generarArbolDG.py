@@ -1,105 +1,111 @@
-import networkx as nx  # Importar la biblioteca NetworkX para la creación de grafos
-import matplotlib.pyplot as plt  # Importar Matplotlib para la visualización de gráficos
-from networkx.drawing.nx_agraph import graphviz_layout  # Importar la función para el diseño de gráficos con Graphviz
+# NetworkX y Matplotlib se importan solo al construir o dibujar el grafo
+from nucleo.analizadorEarley import analizarEarley  # Bosque compartido con todas las derivaciones
+from nucleo.analizadorPackrat import derivarMemorizado  # Derivación con memorización por (no terminal, posición)
+from nucleo.derivaciones import INFINITO, Derivaciones  # Conteo de árboles sin enumerarlos
+from nucleo.disenoArbol import posicionesGrafo  # Diseño ordenado del árbol sin Graphviz
+from nucleo.gramaticaCompilada import cargarGramaticaCompilada  # Gramática normalizada con caché en disco
+from nucleo.lexico import ErrorLexico  # Error del léxico compartido de coincidencia más larga
 
-# Función para leer las reglas gramaticales del archivo
-def interpretarGramatica(archivo):
-    reglasGramaticales = {}  # Diccionario para almacenar las reglas de la gramática
-    with open(archivo, 'r') as f:  # Abrir el archivo de la gramática en modo lectura
-        for linea in f:  # Iterar sobre cada línea del archivo
-            linea = linea.strip()  # Eliminar espacios en blanco al inicio y al final de la línea
-            if '->' in linea:  # Verificar si la línea contiene una producción
-                parteIzquierda, parteDerecha = linea.split('->')  # Separar la parte izquierda y derecha de la producción
-                parteIzquierda = parteIzquierda.strip()  # Eliminar espacios de la parte izquierda
-                parteDerecha = [token.strip() for token in parteDerecha.split('|')]  # Separar y limpiar las producciones de la parte derecha
-                
-                # Agregar la producción al diccionario de reglas
-                if parteIzquierda in reglasGramaticales:
-                    reglasGramaticales[parteIzquierda].extend(parteDerecha)  # Extender la lista de producciones
-                else:
-                    reglasGramaticales[parteIzquierda] = parteDerecha  # Crear una nueva entrada en el diccionario
-    return reglasGramaticales  # Retornar el diccionario con las reglas gramaticales
+# Función para derivar la cadena y elegir su árbol, sin NetworkX; retorna (árbol, si la cadena es válida)
+# Las reglas no pueden tener recursión por la izquierda (se lanza RecursionIzquierda): main las normaliza antes.
+# Con normalizacion (una GramaticaNormalizada) el árbol se reporta con las producciones originales
+# y con medidor (un Medidor de nucleo.medicion) se registran expansiones, fallos, profundidad y tiempo.
+# Con tabla (la tabla LL(1) de las reglas) cada par sigue solo la producción que elige la tabla y el análisis es lineal
+def derivarArbol(reglas, nodoInicial, tokens, tamanoCache=None, normalizacion=None, medidor=None, tabla=None):
+    finales = derivarMemorizado(reglas, nodoInicial, tokens, tamanoCache, medidor, tabla)  # Derivaciones desde el símbolo inicial
+    valida = len(tokens) in finales  # Solo es válida si alguna derivación cubre toda la cadena
+    if valida:
+        subArbol = finales[len(tokens)]  # Derivación que cubre toda la cadena
+    elif finales:
+        subArbol = finales[max(finales)]  # Si no, la que cubre el prefijo más largo
+    else:
+        subArbol = (nodoInicial, ())  # Ninguna derivación: solo el nodo inicial
+    if normalizacion is not None:
+        subArbol = normalizacion.arbolOriginal(subArbol)  # Volver a las producciones del archivo
+    return subArbol, valida  # Árbol como tuplas (simbolo, hijos)
 
-# Función para generar el árbol basado en las reglas y la cadena ingresada
-def construirArbol(reglas, nodoInicial, tokens):
-    arbol = nx.DiGraph()  # Crear un grafo dirigido para el árbol
-    derivacion = []  # Lista para guardar la derivación y validar la entrada
-    indiceToken = 0  # Índice para recorrer los tokens ingresados por el usuario
-    
-    def expandirNodo(nodo, profundidad):
-        nonlocal indiceToken  # Permitir que la función interna acceda a la variable externa
-        if nodo in reglas and indiceToken <= len(tokens):  # Aceptar incluso si llegamos al final de los tokens
-            for produccion in reglas[nodo]:  # Iterar sobre las producciones de la regla actual
-                simbolos = produccion.split()  # Separar los símbolos en la producción
-                subArbolValido = True  # Bandera para verificar la validez del subárbol
-                for simbolo in simbolos:  # Iterar sobre los símbolos en la producción
-                    if simbolo == 'ε':  # Manejo del vacío
-                        arbol.add_node('ε', layer=profundidad)  # Agregar nodo vacío al árbol
-                        arbol.add_edge(nodo, 'ε')  # Crear un borde desde el nodo padre al símbolo vacío
-                        derivacion.append('ε')  # Agregar el vacío a la derivación
-                        continue  # Continuar con el siguiente símbolo de la producción
-
-                    if indiceToken >= len(tokens):  # Salir si ya no hay más tokens por procesar
-                        break
+# Función para convertir el árbol de tuplas en un grafo de NetworkX
+def convertirGrafo(subArbol):
+    import networkx as nx  # Importar la biblioteca NetworkX para la creación de grafos
 
-                    if simbolo == tokens[indiceToken]:  # Verificar si el símbolo coincide con el token actual
-                        arbol.add_node(simbolo, layer=profundidad)  # Agregar el símbolo como nodo en el árbol
-                        arbol.add_edge(nodo, simbolo)  # Crear un borde desde el nodo padre al símbolo
-                        derivacion.append(simbolo)  # Agregar el símbolo a la lista de derivación
-                        indiceToken += 1  # Avanzar al siguiente token
-                    elif simbolo in reglas:  # Si el símbolo es un no terminal
-                        arbol.add_node(simbolo, layer=profundidad)  # Agregar el símbolo como nodo en el árbol
-                        arbol.add_edge(nodo, simbolo)  # Crear un borde desde el nodo padre al símbolo
-                        derivacion.append(simbolo)  # Agregar el símbolo a la lista de derivación
-                        expandirNodo(simbolo, profundidad + 1)  # Expandir el nodo no terminal
-                    else:
-                        subArbolValido = False  # Marcar el subárbol como no válido
-                        break  # Romper el bucle si no se puede expandir
-                    
-                # Si generamos un subárbol válido que cubre la parte de la cadena, dejar de expandir
-                if subArbolValido and indiceToken == len(tokens):
-                    break
-
-    arbol.add_node(nodoInicial, layer=0)  # Agregar el nodo inicial al árbol
-    derivacion.append(nodoInicial)  # Agregar el nodo inicial a la lista de derivación
-    expandirNodo(nodoInicial, 1)  # Llamar a la función para expandir el nodo inicial
+    arbol = nx.DiGraph()  # Crear un grafo dirigido para el árbol
+    derivacion = []  # Lista con los símbolos del árbol en preorden, para validar la entrada
+    pila = [(subArbol, None, 0)]  # Pila de (subárbol, nodo padre, profundidad)
+    while pila:
+        (simbolo, hijos), padre, profundidad = pila.pop()
+        nodo = len(derivacion)  # Identificador único del nodo
+        arbol.add_node(nodo, label=simbolo, layer=profundidad)  # Agregar el símbolo como nodo en el árbol
+        if padre is not None:
+            arbol.add_edge(padre, nodo)  # Crear un borde desde el nodo padre al símbolo
+        derivacion.append(simbolo)  # Agregar el símbolo a la lista de derivación
+        for hijo in reversed(hijos):
+            pila.append((hijo, nodo, profundidad + 1))  # En orden inverso para recorrer de izquierda a derecha
     return arbol, derivacion  # Retornar el árbol y la lista de derivación
 
+# Función para generar el árbol basado en las reglas y la cadena ingresada; retorna (grafo, derivación, válida)
+def construirArbol(reglas, nodoInicial, tokens, tamanoCache=None, normalizacion=None, medidor=None, tabla=None):
+    subArbol, valida = derivarArbol(reglas, nodoInicial, tokens, tamanoCache, normalizacion, medidor, tabla)  # Análisis sin NetworkX
+    arbol, derivacion = convertirGrafo(subArbol)  # Solo la conversión al grafo necesita NetworkX
+    return arbol, derivacion, valida
+
 # Función para visualizar el árbol
 def visualizarArbol(arbol):
-    pos = graphviz_layout(arbol, prog='dot')  # Obtener posiciones de los nodos usando Graphviz
+    import matplotlib.pyplot as plt  # Importar Matplotlib para la visualización de gráficos
+    import networkx as nx
+
+    pos = posicionesGrafo(arbol)  # Obtener posiciones de los nodos por niveles, con los padres centrados
     plt.figure(figsize=(8, 6))  # Configurar el tamaño de la figura
-    nx.draw(arbol, pos, with_labels=True, node_color='lightblue', font_size=10, node_size=3000, font_weight='bold')  # Dibujar el árbol
+    etiquetas = nx.get_node_attributes(arbol, 'label')  # Los nodos se muestran con su símbolo
+    nx.draw(arbol, pos, labels=etiquetas, with_labels=True, node_color='lightblue', font_size=10, node_size=3000, font_weight='bold')  # Dibujar el árbol
     plt.title("Árbol de derivación gramatical")  # Título del gráfico
     plt.show()  # Mostrar el gráfico
 
-# Función para validar si la cadena ingresada corresponde a la derivación
-def esCadenaValida(tokens, derivacion, reglas):
-    # Filtrar los tokens que no son no terminales de la derivación
-    derivacionSinTerminales = [token for token in derivacion if token not in reglas and token != 'ε']
-    return tokens == derivacionSinTerminales[:len(tokens)]  # Comparar los tokens con la derivación filtrada
+# Función para informar cuántos árboles de derivación tiene la cadena (solo si es ambigua)
+def reportarAmbiguedad(gramatica, tokens):
+    # El bosque de Earley se construye una vez y se cuenta sin enumerar los árboles
+    aceptada, bosque, _ = analizarEarley(tokens, gramatica.Vt, gramatica.Vxt, gramatica.S, gramatica.P, gramatica.earley)
+    if not aceptada:
+        return
+    cantidad = Derivaciones(bosque).total()
+    if cantidad == INFINITO:
+        print("La cadena tiene infinitos árboles de derivación (la gramática tiene ciclos A =>+ A).")
+    elif cantidad > 1:
+        print(f"La gramática es ambigua para esta cadena: tiene {cantidad} árboles de derivación; se muestra uno.")
 
 # Función principal
 def main():
     archivoGramatica = 'pruebas.txt'  # Nombre y ruta del archivo de gramática
-    reglasGramaticales = interpretarGramatica(archivoGramatica)  # Leer las reglas gramaticales del archivo
+
+    # El análisis corre sobre la gramática sin recursión por la izquierda y factorizada (el packrat no
+    # deriva la recursión por la izquierda); los árboles se reportan con las reglas del archivo
+    gramatica = cargarGramaticaCompilada(archivoGramatica, normalizar={})
+    original = cargarGramaticaCompilada(archivoGramatica)  # La gramática tal cual, para contar sus derivaciones
+    reglasNormalizadas = {A: [' '.join(der) for der in ders] for A, ders in gramatica.porIzquierda.items()}
     
     # Definir el nodo de inicio (variable inicial de la gramática)
-    nodoInicial = 'S'  # Esto puede cambiar dependiendo de tu gramática
+    nodoInicial = gramatica.S  # La primera regla del archivo (o una nueva si la normalización la agrega)
+
+    lexico = gramatica.lexico  # Léxico compilado con los terminales de la gramática
     
     while True:  # Bucle para permitir múltiples entradas
         entradaUsuario = input("Ingrese una cadena para analizar (o 'salir' para terminar): ")  # Solicitar entrada al usuario
         if entradaUsuario.lower() == 'salir':  # Verificar si el usuario quiere salir
             break  # Romper el bucle si el usuario escribe 'salir'
         
-        tokens = entradaUsuario.split()  # Dividir la cadena en tokens
+        try:
+            tokens = lexico.tipos(entradaUsuario)  # Dividir la cadena en tokens
+        except ErrorLexico as e:
+            print(f"La cadena no es válida según la gramática. {e}")  # Carácter que no forma ningún terminal
+            continue
         
         # Generar el árbol sintáctico
-        arbol, derivacion = construirArbol(reglasGramaticales, nodoInicial, tokens)  # Llamar a la función para construir el árbol
+        arbol, _, valida = construirArbol(reglasNormalizadas, nodoInicial, tokens, normalizacion=gramatica.normalizacion,
+                                          tabla=gramatica.tabla)  # Lineal si la gramática normalizada es LL(1)
         
         # Validar la cadena ingresada
-        if esCadenaValida(tokens, derivacion, reglasGramaticales):  # Verificar la validez de la cadena
+        if valida:  # Alguna derivación cubre la cadena completa
             print("La cadena es válida según la gramática.")  # Mensaje si la cadena es válida
+            reportarAmbiguedad(original, tokens)  # Cuántas derivaciones tiene, si hay más de una
         else:
             print("La cadena no es válida según la gramática.")  # Mensaje si la cadena no es válida
         
@@ -0,0 +1,18 @@
+# Núcleo de análisis sin dependencias de graficación: lectura y compilación de gramáticas, léxico,
+# normalización, analizadores (LL(1), Earley, retroceso, packrat), conteo de derivaciones, árbol compacto,
+# instrumentación, sesión incremental y diseño de árboles.
+# Importarlo no tiene efectos secundarios; matplotlib solo se carga al guardar un PNG.
+
+from .analizadorEarley import Bosque, analizarEarley, extraerArbol  # Analizador general
+from .analizadorLL1 import ConflictoLL1, analizarLL1, construirTablaLL1  # Analizador predictivo
+from .analizadorPackrat import RecursionIzquierda, derivarMemorizado  # Analizador con memorización
+from .analizadorRetroceso import analizarRetroceso  # Analizador con retroceso
+from .arbolCompacto import NINGUNO, ArbolCompacto, TablaSimbolos  # Árbol de derivación en arreglos
+from .derivaciones import INFINITO, Derivaciones, contarDerivaciones  # Conteo y muestreo de árboles del bosque
+from .disenoArbol import disenarArbol, guardarImagen, guardarPNG, guardarSVG, pngDisponible  # Diseño y dibujo de árboles
+from .gramaticaCompilada import GramaticaCompilada, cargarGramaticaCompilada  # Gramática compilada con caché
+from .lectorGramatica import cargarGramatica, interpretarGramatica, leerGramatica  # Lectura de archivos
+from .lexico import ErrorLexico, Lexico, obtenerLexico  # Léxico compartido
+from .medicion import Medicion, Medidor, SumideroJSON, SumideroMemoria, SumideroPerfil  # Instrumentación opcional
+from .normalizacion import GramaticaNormalizada, normalizarGramatica  # Transformaciones de la gramática
+from .sesionIncremental import SesionIncremental  # Reanálisis incremental
@@ -0,0 +1,338 @@
+# Analizador de Earley para gramáticas libres de contexto generales.
+# Acepta cualquier gramática (recursiva por la izquierda, ambigua o con producciones vacías),
+# trabaja en tiempo cúbico en el peor caso y devuelve un bosque de análisis compartido (SPPF)
+# binarizado que sirve tanto para validar la cadena como para construir el árbol.
+# Con los ítems de Leo la recursión por la derecha (E' -> + T E') ocupa espacio y tiempo lineales: de cada
+# camino de reducción determinista solo se agrega la cima y el resto lo recupera el bosque cuando lo necesita.
+
+from .analizadorLL1 import EPSILON, calcularAnulables  # Cálculo de anulables compartido con el motor LL(1)
+from .arbolCompacto import NINGUNO, ArbolCompacto  # Árbol de derivación en arreglos paralelos
+from .medicion import contar  # Contadores de la instrumentación opcional
+
+
+class Bosque:
+    # Bosque de análisis compartido y empaquetado.
+    # Los nodos de símbolo tienen clave (simbolo, i, j) y sus alternativas son pares (produccion, nodoItem);
+    # los nodos intermedios tienen clave (estado, i, j) y sus alternativas son pares (izquierdo, derecho).
+    __slots__ = ('raiz', 'nodos', 'producciones', 'estados', 'tokens')
+
+    def __init__(self, raiz, nodos, producciones, estados, tokens):
+        self.raiz = raiz  # Clave del nodo raíz (S, 0, n)
+        self.nodos = nodos  # Diccionario clave -> lista de alternativas empaquetadas
+        self.producciones = producciones  # Producciones (izq, der) sin el símbolo ε
+        self.estados = estados  # Reglas punteadas (produccion, punto)
+        self.tokens = tokens  # Tokens analizados
+
+
+def prepararGramatica(Vxt, P, anulables=None):
+    # Función para numerar las reglas punteadas de la gramática; se pueden pasar los anulables ya calculados.
+    producciones = [(izq, tuple(s for s in der if s != EPSILON)) for izq, der in P]  # Quita los ε explícitos
+    porIzquierda = {}  # No terminal -> estados iniciales de sus producciones
+    estados = []  # Lista de reglas punteadas (produccion, punto)
+    for p, (izq, der) in enumerate(producciones):
+        porIzquierda.setdefault(izq, []).append(len(estados))  # Estado con el punto al inicio
+        for punto in range(len(der) + 1):
+            estados.append((p, punto))  # El estado e + 1 es siempre el mismo ítem con el punto avanzado
+    siguiente = [producciones[p][1][d] if d < len(producciones[p][1]) else None for p, d in estados]  # Símbolo tras el punto
+    if anulables is None:
+        anulables = calcularAnulables(Vxt, P)  # No terminales que derivan ε
+    return producciones, estados, siguiente, porIzquierda, anulables
+
+
+def reconocer(tokens, S, gramatica, medicion=None):
+    # Función para construir los conjuntos de Earley; cada ítem se codifica como estado * ancho + origen.
+    # Retorna (conjuntos, leo, posicionError); leo guarda los caminos que se saltaron (ver cimaLeo).
+    # Con una Medicion se cuentan las predicciones de cada no terminal y los ítems de cada conjunto.
+    producciones, estados, siguiente, porIzquierda, anulables = gramatica
+    n = len(tokens)  # Cantidad de tokens
+    ancho = n + 1  # Base para codificar el origen dentro del entero del ítem
+    conjuntos = [set() for _ in range(n + 1)]  # Conjuntos de ítems por posición
+    esperando = []  # Por posición: símbolo -> ítems cuyo punto está antes de ese símbolo
+    conjuntos[0].update(e * ancho for e in porIzquierda.get(S, ()))  # Predicción inicial del símbolo S
+    cimas = {}  # (k, A) -> ítem completo en la cima de su camino determinista, o None si no hay camino
+    pasos = {}  # (k, A) -> (ítem completo que se saltó, clave del paso siguiente o None)
+    simbolosCamino = {}  # (k, A) -> lados izquierdos de los ítems del camino desde ese paso
+    registros = []  # Por posición: claves (k, A) cuyo camino se saltó en ese conjunto
+
+    def cimaLeo(k, A):
+        # Función para obtener la cima del camino de reducción determinista de A completado con origen k < j.
+        # Si en el conjunto k un único ítem [B -> β•A, i] espera A, completar A completa [B -> βA•, i], que a su
+        # vez completa B desde i, y así sucesivamente (Leo); el camino se recorre sin recursión y se memoriza.
+        camino = []  # (clave, ítem completo, lado izquierdo) de los pasos aún sin cima
+        clave = (k, A)
+        while clave not in cimas:
+            k, A = clave
+            espera = esperando[k].get(A, ())
+            if len(espera) != 1 or siguiente[espera[0] // ancho + 1] is not None:
+                cimas[clave] = None  # Varios ítems esperan A o A no es el último símbolo
+                break
+            e, i = divmod(espera[0], ancho)
+            B = producciones[estados[e][0]][0]
+            camino.append((clave, espera[0] + ancho, B))
+            if i == k or (i == 0 and B == S):  # Prefijo vacío (sigue cuando se complete) o S desde 0, que decide la aceptación
+                clave = None
+                break
+            clave = (i, B)
+        cima = cimas[clave] if clave is not None else None
+        for paso, completado, B in reversed(camino):
+            if cima is None:  # El camino termina en este paso
+                cima, clave, simbolos = completado, None, frozenset((B,))
+            else:
+                simbolos = simbolosCamino[clave]
+                if B not in simbolos:
+                    simbolos = simbolos | {B}
+            cimas[paso] = cima
+            pasos[paso] = (completado, clave)
+            simbolosCamino[paso] = simbolos
+            clave = paso
+        return cima
+
+    for j in range(n + 1):
+        conjunto = conjuntos[j]  # Conjunto que se completa en esta posición
+        pendientes = list(conjunto)  # Ítems por procesar
+        esperaJ = {}  # Ítems que esperan cada símbolo en la posición j
+        esperando.append(esperaJ)
+        registrosJ = set()  # Caminos de Leo saltados en esta posición
+        registros.append(registrosJ)
+        predichos = set()  # No terminales ya predichos en esta posición
+
+        while pendientes:
+            item = pendientes.pop()
+            e, origen = divmod(item, ancho)  # Decodifica el ítem
+            X = siguiente[e]  # Símbolo después del punto
+            if X is None:  # Ítem completo: avanza a quienes esperaban este no terminal
+                A = producciones[estados[e][0]][0]
+                cima = cimaLeo(origen, A) if origen < j else None  # El conjunto j aún no está cerrado
+                if cima is not None:  # Solo se agrega la cima del camino determinista
+                    registrosJ.add((origen, A))
+                    if cima not in conjunto:
+                        conjunto.add(cima)
+                        pendientes.append(cima)
+                    continue
+                for espera in esperando[origen].get(A, ()):
+                    nuevo = espera + ancho  # Mismo origen, punto avanzado (estado + 1)
+                    if nuevo not in conjunto:
+                        conjunto.add(nuevo)
+                        pendientes.append(nuevo)
+                continue
+
+            esperaJ.setdefault(X, []).append(item)  # Registra el ítem como esperando X
+            if X in porIzquierda:  # X es no terminal: predicción
+                if X not in predichos:
+                    predichos.add(X)
+                    if medicion is not None:
+                        contar(medicion.expansiones, X)  # Una predicción por no terminal y posición
+                    for inicial in porIzquierda[X]:
+                        nuevo = inicial * ancho + j
+                        if nuevo not in conjunto:
+                            conjunto.add(nuevo)
+                            pendientes.append(nuevo)
+                if X in anulables:  # Aycock-Horspool: se salta el no terminal anulable sin esperar su completado
+                    nuevo = item + ancho
+                    if nuevo not in conjunto:
+                        conjunto.add(nuevo)
+                        pendientes.append(nuevo)
+
+        if medicion is not None:
+            medicion.consumidos = j
+            medicion.extras['items'] = medicion.extras.get('items', 0) + len(conjunto)
+        if j < n:  # Lectura del token j
+            token = tokens[j]
+            if token not in porIzquierda:  # Un token nunca se confunde con un no terminal
+                conjuntos[j + 1].update(item + ancho for item in esperaJ.get(token, ()))
+            if not conjuntos[j + 1]:
+                return conjuntos[:j + 1], None, j  # Ningún ítem sobrevive: error en el token j
+
+    aceptada = any((e + len(producciones[estados[e][0]][1])) * ancho in conjuntos[n]
+                   for e in porIzquierda.get(S, ()))  # Algún ítem completo de S con origen 0 (siempre es una cima)
+    return conjuntos, (registros, pasos, simbolosCamino), None if aceptada else n
+
+
+def construirBosque(tokens, S, gramatica, conjuntos, leo):
+    # Función para construir el bosque compartido a partir de los conjuntos de una cadena aceptada.
+    # leo son los caminos deterministas que reconocer saltó; sus ítems se recuperan solo donde el bosque los pide.
+    producciones, estados, siguiente, porIzquierda, _ = gramatica
+    registros, pasos, simbolosCamino = leo
+    n = len(tokens)
+    ancho = n + 1
+
+    completados = {}  # Posición j -> no terminal -> ítems completos de ese no terminal en el conjunto j
+    recuperados = {}  # (X, j) -> ítems completos de X en j, incluidos los de los caminos saltados
+
+    def completos(X, j):
+        # Función para obtener los ítems completos de X en el conjunto j (índices perezosos).
+        if (X, j) in recuperados:
+            return recuperados[(X, j)]
+        if j not in completados:
+            indice = {}
+            for item in conjuntos[j]:
+                if siguiente[item // ancho] is None:  # Ítem completo
+                    indice.setdefault(producciones[estados[item // ancho][0]][0], set()).add(item)
+            completados[j] = indice
+        items = completados[j].get(X, set())
+        for clave in registros[j]:  # Solo se recorren los caminos que contienen algún ítem de X
+            while clave is not None and X in simbolosCamino[clave]:
+                completado, clave = pasos[clave]
+                if producciones[estados[completado // ancho][0]][0] == X:
+                    if items is completados[j].get(X):
+                        items = set(items)  # No se modifica el índice de los ítems reales
+                    items.add(completado)
+        recuperados[(X, j)] = items
+        return items
+
+    origenesCompletos = {}  # (X, j) -> orígenes k tales que X deriva tokens[k:j]
+    posiciones = {}  # Ítem que espera un no terminal -> conjuntos donde aparece (índice de todo el análisis)
+
+    def origenes(X, j):
+        # Función para obtener los orígenes de los ítems completos de X en el conjunto j.
+        if (X, j) not in origenesCompletos:
+            origenesCompletos[(X, j)] = {item % ancho for item in completos(X, j)}
+        return origenesCompletos[(X, j)]
+
+    def posicionesPrefijo(item):
+        # Función para obtener los conjuntos donde aparece un ítem que espera un no terminal.
+        if not posiciones:  # Se indexa una sola vez, en tiempo lineal en la cantidad de ítems
+            for k, conjunto in enumerate(conjuntos):
+                for otro in conjunto:
+                    if siguiente[otro // ancho] in porIzquierda:
+                        posiciones.setdefault(otro, []).append(k)
+        return posiciones.get(item, ())
+
+    raiz = (S, 0, n)  # Nodo raíz del bosque
+    nodos = {}  # Clave -> alternativas
+    pendientes = [raiz]  # Nodos por expandir
+    while pendientes:
+        clave = pendientes.pop()
+        if clave in nodos:  # Nodo ya expandido (compartido)
+            continue
+        X, i, j = clave
+        alternativas = []
+
+        if isinstance(X, str):  # Nodo de símbolo: una alternativa por producción completada
+            items = completos(X, j)
+            for e in porIzquierda[X]:
+                largo = len(producciones[estados[e][0]][1])
+                if (e + largo) * ancho + i in items:
+                    hijo = (e + largo, i, j) if largo else None  # Las producciones vacías no tienen nodo ítem
+                    alternativas.append((estados[e][0], hijo))
+                    if hijo:
+                        pendientes.append(hijo)
+        else:  # Nodo ítem: se divide en el prefijo (punto - 1) y el último símbolo
+            anterior = X - 1  # Estado con el punto un símbolo atrás
+            simbolo = siguiente[anterior]  # Símbolo que cubre el tramo derecho
+            primero = estados[anterior][1] == 0  # El prefijo es vacío
+            if simbolo not in porIzquierda:  # El terminal ocupa el último token y el prefijo llega justo antes
+                k = j - 1
+                llega = j > i and tokens[k] == simbolo and (k == i if primero else anterior * ancho + i in conjuntos[k])
+                cortes = [k] if llega else []
+            elif primero:
+                cortes = [i] if i in origenes(simbolo, j) else []  # Sin prefijo el símbolo empieza en i
+            else:  # Cortes k donde llega el prefijo y empieza el no terminal; se recorre el lado más chico
+                desde = origenes(simbolo, j)
+                prefijos = posicionesPrefijo(anterior * ancho + i)
+                if len(prefijos) <= len(desde):
+                    cortes = sorted(k for k in prefijos if k <= j and k in desde)
+                else:
+                    cortes = sorted(k for k in desde if k >= i and anterior * ancho + i in conjuntos[k])
+            for k in cortes:
+                izquierdo = None if primero else (anterior, i, k)
+                derecho = (simbolo, k, j)
+                alternativas.append((izquierdo, derecho))
+                if izquierdo:
+                    pendientes.append(izquierdo)
+                if simbolo in porIzquierda:
+                    pendientes.append(derecho)
+        nodos[clave] = alternativas
+
+    return Bosque(raiz, nodos, producciones, estados, tokens)
+
+
+def hijosAlternativa(clave, alternativa):
+    # Función para listar los nodos hijos de una alternativa empaquetada.
+    if isinstance(clave[0], str):
+        return (alternativa[1],) if alternativa[1] else ()  # Nodo de símbolo: el nodo ítem de la producción
+    return tuple(h for h in alternativa if h)  # Nodo ítem: prefijo y último símbolo
+
+
+def elegirAlternativas(bosque):
+    # Función para elegir en cada nodo una alternativa bien fundada (que no dependa de sí misma).
+    # Es el algoritmo de Knuth por contadores: un nodo se resuelve cuando una de sus alternativas
+    # tiene todos sus hijos resueltos, así los ciclos del bosque nunca se recorren.
+    nodos = bosque.nodos
+    padres = {}  # Hijo -> lista de (padre, índice de alternativa)
+    faltantes = {}  # (padre, índice) -> hijos aún sin resolver
+    listos = []  # Cola de nodos resueltos
+    eleccion = {}  # Nodo -> índice de la alternativa elegida
+
+    for clave, alternativas in nodos.items():
+        for indice, alternativa in enumerate(alternativas):
+            hijos = [h for h in hijosAlternativa(clave, alternativa) if h in nodos]  # Las hojas ya están resueltas
+            faltantes[(clave, indice)] = len(hijos)
+            for h in hijos:
+                padres.setdefault(h, []).append((clave, indice))
+            if not hijos and clave not in eleccion:
+                eleccion[clave] = indice
+                listos.append(clave)
+
+    while listos:
+        hijo = listos.pop()
+        for padre, indice in padres.get(hijo, ()):
+            faltantes[(padre, indice)] -= 1
+            if faltantes[(padre, indice)] == 0 and padre not in eleccion:
+                eleccion[padre] = indice  # Primera alternativa con todos sus hijos resueltos
+                listos.append(padre)
+    return eleccion
+
+
+def extraerArbol(bosque, arbol=None):
+    # Función para extraer un árbol de derivación del bosque en un ArbolCompacto (nuevo o el recibido, vaciado).
+    if arbol is None:
+        arbol = ArbolCompacto()
+    else:
+        arbol.limpiar()
+    eleccion = elegirAlternativas(bosque)
+    nodos = bosque.nodos
+    pila = [(bosque.raiz, NINGUNO)]  # Pila explícita de (clave, nodo padre) para soportar árboles muy profundos
+    while pila:
+        clave, padre = pila.pop()
+        if clave not in nodos:  # Hoja terminal
+            arbol.agregarNodo(clave[0], padre)
+            continue
+        alternativa = nodos[clave][eleccion[clave]]
+        if isinstance(clave[0], str):  # Nodo de símbolo
+            nodo = arbol.agregarNodo(clave[0], padre)
+            if alternativa[1] is None:
+                arbol.agregarNodo(EPSILON, nodo)  # Producción vacía
+            else:
+                pila.append((alternativa[1], nodo))  # Los hijos salen del nodo ítem
+        else:  # Nodo ítem: primero el prefijo y luego el último símbolo
+            izquierdo, derecho = alternativa
+            pila.append((derecho, padre))
+            if izquierdo:
+                pila.append((izquierdo, padre))
+    return arbol
+
+
+def analizarEarley(tokens, V, Vxt, S, P, gramatica=None, conBosque=True, medidor=None):
+    # Función para analizar una lista de tokens; retorna (aceptada, bosque, posicionError).
+    # Se puede pasar la gramática ya preparada con prepararGramatica para no repetir el trabajo;
+    # con conBosque=False solo se reconoce la cadena y el bosque es None.
+    # Con un Medidor se registran las predicciones, los ítems y los nodos del bosque (no hay retrocesos).
+    if gramatica is None:
+        gramatica = prepararGramatica(Vxt, P)
+    medicion = medidor.iniciar('earley', tokens) if medidor is not None else None
+    aceptada = None  # Queda en None si el análisis lanza una excepción
+    try:
+        conjuntos, leo, posicionError = reconocer(tokens, S, gramatica, medicion)
+        bosque = None
+        if posicionError is None and conBosque:
+            bosque = construirBosque(tokens, S, gramatica, conjuntos, leo)
+            if medicion is not None:
+                medicion.extras['nodosBosque'] = len(bosque.nodos)
+        aceptada = posicionError is None
+    finally:
+        if medicion is not None:
+            medidor.terminar(medicion, aceptada)  # Se registra aunque falle
+    if posicionError is not None:
+        return False, None, posicionError  # Cadena rechazada
+    return True, bosque, None  # Sin bosque si solo se pidió el veredicto
@@ -0,0 +1,190 @@
+# Motor de análisis predictivo LL(1) dirigido por tabla.
+# Calcula una sola vez los conjuntos PRIMEROS/SIGUIENTES y la tabla M[A, a] y luego
+# analiza cada cadena en una única pasada lineal con una pila explícita (sin retroceso).
+
+from .arbolCompacto import ArbolCompacto  # Árbol de derivación en arreglos paralelos
+from .medicion import contar  # Contadores de la instrumentación opcional
+
+FIN = '$'  # Marcador de fin de cadena usado en la tabla y como preanálisis tras el último token
+EPSILON = 'ε'  # Símbolo que representa la cadena vacía en las producciones
+
+
+class ConflictoLL1(ValueError):
+    # Error que se lanza cuando la gramática no es LL(1); guarda la lista de conflictos encontrados.
+    def __init__(self, conflictos):
+        self.conflictos = conflictos  # Lista de tuplas (noTerminal, terminal, produccionExistente, produccionNueva)
+        lineas = [f"  M[{A}, {a}]: '{A} -> {' '.join(d1)}' choca con '{A} -> {' '.join(d2)}'"
+                  for A, a, d1, d2 in conflictos]  # Una línea por celda en conflicto
+        super().__init__("La gramática no es LL(1). Conflictos en la tabla de análisis:\n" + "\n".join(lineas))
+
+
+def calcularAnulables(Vxt, P):
+    # Función para calcular los no terminales que derivan la cadena vacía.
+    anulables = set()  # Conjunto de no terminales anulables
+    cambio = True  # Bandera del punto fijo
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            if izq not in anulables and all(s == EPSILON or s in anulables for s in der):  # Todo el lado derecho es anulable
+                anulables.add(izq)  # Marca el no terminal como anulable
+                cambio = True
+    return anulables  # Retorna el conjunto de anulables
+
+
+def primerosSecuencia(secuencia, primeros, anulables):
+    # Función para calcular PRIMEROS de una secuencia de símbolos; indica además si la secuencia es anulable.
+    resultado = set()  # Terminales que pueden iniciar la secuencia
+    for simbolo in secuencia:
+        if simbolo == EPSILON:  # El vacío no aporta terminales
+            continue
+        resultado |= primeros.get(simbolo, {simbolo})  # Un símbolo sin entrada se trata como terminal
+        if simbolo not in anulables:  # Si el símbolo no es anulable la secuencia termina aquí
+            return resultado, False
+    return resultado, True  # Toda la secuencia es anulable
+
+
+def calcularPrimeros(Vt, Vxt, P, anulables):
+    # Función para calcular el conjunto PRIMEROS de cada símbolo de la gramática.
+    primeros = {A: set() for A in Vxt}  # PRIMEROS de los no terminales, inicialmente vacíos
+    for a in Vt:
+        primeros[a] = {a}  # PRIMEROS de un terminal es él mismo
+    cambio = True  # Bandera del punto fijo
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            nuevos, _ = primerosSecuencia(der, primeros, anulables)  # PRIMEROS del lado derecho
+            if not nuevos <= primeros[izq]:  # Hay terminales nuevos
+                primeros[izq] |= nuevos
+                cambio = True
+    return primeros  # Retorna el diccionario de PRIMEROS
+
+
+def calcularSiguientes(Vxt, S, P, anulables, primeros):
+    # Función para calcular el conjunto SIGUIENTES de cada no terminal.
+    siguientes = {A: set() for A in Vxt}  # SIGUIENTES de los no terminales, inicialmente vacíos
+    siguientes[S].add(FIN)  # El fin de cadena sigue al símbolo inicial
+    cambio = True  # Bandera del punto fijo
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            for i, simbolo in enumerate(der):
+                if simbolo not in Vxt:  # Solo interesan los no terminales
+                    continue
+                nuevos, anulable = primerosSecuencia(der[i + 1:], primeros, anulables)  # Lo que puede venir después
+                if anulable:
+                    nuevos = nuevos | siguientes[izq]  # Si el resto es anulable hereda SIGUIENTES del lado izquierdo
+                if not nuevos <= siguientes[simbolo]:  # Hay terminales nuevos
+                    siguientes[simbolo] |= nuevos
+                    cambio = True
+    return siguientes  # Retorna el diccionario de SIGUIENTES
+
+
+def construirTablaLL1(Vt, Vxt, S, P, conjuntos=None):
+    # Función para construir la tabla de análisis predictivo M[A, a] -> lado derecho.
+    # conjuntos permite pasar (anulables, primeros, siguientes) ya calculados.
+    if conjuntos is None:
+        anulables = calcularAnulables(Vxt, P)  # No terminales anulables
+        primeros = calcularPrimeros(Vt, Vxt, P, anulables)  # Conjuntos PRIMEROS
+        siguientes = calcularSiguientes(Vxt, S, P, anulables, primeros)  # Conjuntos SIGUIENTES
+    else:
+        anulables, primeros, siguientes = conjuntos
+
+    tabla = {}  # Tabla de análisis: (noTerminal, terminal) -> lado derecho
+    conflictos = []  # Celdas con más de una producción
+    for izq, der in P:
+        objetivos, anulable = primerosSecuencia(der, primeros, anulables)  # Terminales que eligen esta producción
+        if anulable:
+            objetivos = objetivos | siguientes[izq]  # Las producciones anulables se eligen con SIGUIENTES
+        for a in sorted(objetivos):  # Orden fijo para que el reporte de conflictos sea reproducible
+            if (izq, a) in tabla and tabla[(izq, a)] != der:  # La celda ya estaba ocupada por otra producción
+                conflictos.append((izq, a, tabla[(izq, a)], der))
+            else:
+                tabla[(izq, a)] = der  # Registra la producción en la celda
+
+    if conflictos:
+        raise ConflictoLL1(conflictos)  # La gramática no es LL(1)
+    return tabla  # Retorna la tabla de análisis
+
+
+def derivarLL1(tokens, inicio, simbolo, tabla, Vt, arbol, longitudes=None, medicion=None, reutilizar=None, hojas=None):
+    # Función para analizar un símbolo desde tokens[inicio] hasta vaciar su pila, sin exigir el fin de la cadena.
+    # El subárbol se agrega a arbol como una raíz nueva; retorna (valido, posicion, raiz), donde posicion es
+    # el token siguiente al símbolo o, si falla, el token del error.
+    # Si se pasa longitudes (un arreglo alineado con los nodos del árbol) se guarda cuántos tokens cubre cada nodo.
+    # Si se pasa una Medicion se cuentan las expansiones y el tamaño máximo de la pila (no hay recursión ni retrocesos).
+    # Si se pasa reutilizar(simbolo, nodo, posicion), se consulta antes de expandir cada no terminal: si retorna
+    # una cantidad de tokens mayor que 0, el nodo ya quedó con un subárbol hecho y el análisis salta esos tokens.
+    # Si se pasa hojas (una lista o arreglo), se agrega en orden el nodo de cada token consumido.
+    raiz = arbol.agregarNodo(simbolo)
+    if longitudes is not None:
+        longitudes.append(0)
+    pila = [(simbolo, raiz)]  # Pila explícita de (símbolo, nodo del árbol que le corresponde)
+    i = inicio  # Índice del token actual
+    n = len(tokens)  # Cantidad de tokens
+
+    while pila:
+        simbolo, nodo = pila.pop()  # Símbolo en la cima de la pila
+        if simbolo is None:  # Cierre de un no terminal: ya se conoce su longitud
+            cerrado, desde = nodo
+            longitudes[cerrado] = i - desde
+            continue
+        actual = tokens[i] if i < n else FIN  # Token de preanálisis
+
+        if simbolo in Vt:  # Terminal: debe coincidir con el token actual
+            if simbolo != actual:
+                return False, i, raiz  # Token inesperado
+            if longitudes is not None:
+                longitudes[nodo] = 1
+            if hojas is not None:
+                hojas.append(nodo)
+            i += 1  # Consume el token
+            continue
+
+        if reutilizar is not None:
+            cubiertos = reutilizar(simbolo, nodo, i)
+            if cubiertos:
+                i += cubiertos  # Subárbol reutilizado en lugar de expandir el símbolo
+                continue
+
+        der = tabla.get((simbolo, actual))  # Producción elegida por la tabla
+        if der is None:
+            return False, i, raiz  # No hay producción para este token
+        if medicion is not None:
+            contar(medicion.expansiones, simbolo)
+            medicion.profundidadMaxima = max(medicion.profundidadMaxima, len(pila) + len(der))
+
+        if longitudes is not None:
+            pila.append((None, (nodo, i)))  # Se cierra después de todos sus hijos
+        if der == [EPSILON]:
+            arbol.agregarNodo(EPSILON, nodo)  # Hoja para la producción vacía
+            if longitudes is not None:
+                longitudes.append(0)
+            continue
+        nuevos = [arbol.agregarNodo(s, nodo) for s in der]  # Un hijo por cada símbolo del lado derecho, en orden
+        if longitudes is not None:
+            longitudes.extend([0] * len(nuevos))
+        for s, hijo in zip(reversed(der), reversed(nuevos)):
+            pila.append((s, hijo))  # Se apilan en orden inverso para procesar de izquierda a derecha
+
+    return True, i, raiz
+
+
+def analizarLL1(tokens, tabla, Vt, S, arbol=None, medidor=None):
+    # Función para analizar una lista de tokens con la tabla LL(1) en una sola pasada.
+    # Retorna (valido, arbol, posicionError); el árbol se escribe en un ArbolCompacto (nuevo o el recibido, vaciado).
+    # Con un Medidor se registran las expansiones de cada no terminal y el tamaño máximo de la pila.
+    if arbol is None:
+        arbol = ArbolCompacto()
+    else:
+        arbol.limpiar()  # Reutiliza los arreglos de un análisis anterior
+    medicion = medidor.iniciar('ll1', tokens) if medidor is not None else None
+    valido, posicion = None, 0  # valido queda en None si el análisis lanza una excepción
+    try:
+        valido, posicion, _ = derivarLL1(tokens, 0, S, tabla, Vt, arbol, None, medicion)  # Deriva S desde el primer token
+    finally:
+        if medicion is not None:
+            medicion.consumidos = posicion
+            medidor.terminar(medicion, valido and posicion == len(tokens))  # Se registra aunque falle
+    if not valido or posicion != len(tokens):
+        return False, None, posicion  # Token inesperado o tokens sobrantes
+    return True, arbol, None  # Se consumió toda la cadena
@@ -0,0 +1,123 @@
+# Analizador con memorización (packrat) sobre reglas en el formato de interpretarGramatica
+# (no terminal -> lista de producciones como cadenas separadas por espacios).
+# Cada par (no terminal, posición) se deriva una sola vez; lo usa generarArbolDG.
+
+from collections import OrderedDict  # Memoria de derivaciones con descarte de las menos usadas
+
+from .analizadorLL1 import FIN  # Preanálisis después del último token
+from .medicion import contar  # Contadores de la instrumentación opcional
+
+
+class RecursionIzquierda(ValueError):
+    # Error que se lanza cuando un par (no terminal, posición) se vuelve a pedir mientras se deriva: la gramática
+    # tiene recursión por la izquierda (quizá a través de símbolos anulables) y hay que normalizarla antes.
+    def __init__(self, noTerminal, posicion):
+        self.noTerminal = noTerminal  # No terminal que se alcanza a sí mismo sin consumir tokens
+        self.posicion = posicion  # Token en el que se detectó
+        super().__init__(f"La gramática tiene recursión por la izquierda en {noTerminal} (token {posicion}); "
+                         "normalícela (normalizarGramatica) antes de usar el analizador packrat.")
+
+# Función para derivar con memorización (packrat) cada par (no terminal, posición) una sola vez
+def derivarMemorizado(reglas, nodoInicial, tokens, tamanoCache=None, medidor=None, tabla=None):
+    # Retorna un diccionario posiciónFinal -> subárbol para nodoInicial desde el token 0.
+    # Los subárboles son tuplas inmutables (simbolo, hijos), así una alternativa fallida no deja nada que deshacer
+    # y un mismo subárbol se comparte entre todas las alternativas que lo usan.
+    # tamanoCache limita las entradas memorizadas (las menos usadas se descartan y se recalculan si hacen falta).
+    # Lanza RecursionIzquierda si la gramática la tiene: el par pendiente no tiene aún sus derivaciones.
+    # Cada par guarda todas las posiciones finales a las que llega, que en una lista como E' -> + T E' | ε son
+    # tantas como términos le siguen. Con tabla (la tabla LL(1) de las mismas reglas, como GramaticaCompilada.tabla)
+    # cada par prueba solo la producción que elige su primer token: llega a una sola posición y el análisis es lineal.
+    # Con un Medidor se cuentan expansiones, producciones fallidas, aciertos de la memoria y la profundidad.
+    memoria = OrderedDict()  # (no terminal, posición) -> {posiciónFinal: subárbol}, en orden de uso
+    enCurso = set()  # Pares que se están derivando (volver a pedir uno es recursión por la izquierda)
+    producciones = {A: [(produccion, produccion.split()) for produccion in lista] for A, lista in reglas.items()}
+    if tabla is not None:
+        porLadoDerecho = {(A, tuple(simbolos)): [(produccion, simbolos)]
+                          for A, lista in producciones.items() for produccion, simbolos in lista}
+        elegidas = {clave: porLadoDerecho[(clave[0], tuple(der))] for clave, der in tabla.items()}  # (A, token) -> [producción]
+    medicion = medidor.iniciar('packrat', tokens) if medidor is not None else None
+    if medicion is not None:
+        medicion.extras['aciertosMemoria'] = 0
+        medicion.extras['finalesMemorizados'] = 0  # Posiciones finales guardadas entre todos los pares
+
+    def consultar(clave):
+        # Función para obtener las derivaciones memorizadas de un par; retorna None si falta derivarlo.
+        if clave in memoria:  # Ya se evaluó este par
+            memoria.move_to_end(clave)  # Marca la entrada como usada recientemente
+            if medicion is not None:
+                medicion.extras['aciertosMemoria'] += 1
+            return memoria[clave]
+        if clave in enCurso:  # Sus derivaciones dependen de sí mismas: el resultado sería incompleto
+            raise RecursionIzquierda(*clave)
+        return None
+
+    def derivar(noTerminal, posicion):
+        # Generador que deriva un par: pide con yield cada par que no está en la memoria y recibe sus derivaciones,
+        # así el anidamiento queda en la pila explícita y no en la de Python. Retorna posiciónFinal -> subárbol.
+        resultados = {}  # posiciónFinal -> subárbol; gana la primera producción que llega a cada posición
+        if tabla is None:
+            candidatas = producciones[noTerminal]
+        else:  # Solo la producción de la tabla para el token actual (ninguna si no hay)
+            candidatas = elegidas.get((noTerminal, tokens[posicion] if posicion < len(tokens) else FIN), ())
+        for produccion, simbolos in candidatas:  # Iterar sobre las producciones en orden
+            if medicion is not None:
+                contar(medicion.expansiones, noTerminal)
+            parciales = {posicion: ()}  # posición alcanzada -> hijos reconocidos hasta ahí
+            for simbolo in simbolos:  # Iterar sobre los símbolos en la producción
+                if simbolo == 'ε':  # Manejo del vacío: no consume tokens
+                    parciales = {p: hijos + (('ε', ()),) for p, hijos in parciales.items()}
+                    continue
+                siguientes = {}
+                for p, hijos in parciales.items():
+                    if simbolo in producciones:  # Si el símbolo es un no terminal
+                        derivados = consultar((simbolo, p))
+                        if derivados is None:
+                            derivados = yield (simbolo, p)  # Se deriva el par y se retoma aquí con el resultado
+                        for fin, subArbol in derivados.items():
+                            siguientes.setdefault(fin, hijos + (subArbol,))
+                    elif p < len(tokens) and simbolo == tokens[p]:  # Si el terminal coincide con el token actual
+                        siguientes.setdefault(p + 1, hijos + ((simbolo, ()),))
+                parciales = siguientes
+                if not parciales:  # La producción no puede continuar
+                    break
+            for fin, hijos in parciales.items():
+                resultados.setdefault(fin, (noTerminal, hijos))
+            if medicion is not None:
+                if parciales:
+                    medicion.consumidos = max(medicion.consumidos, max(parciales))
+                else:
+                    contar(medicion.retrocesos, f"{noTerminal} -> {produccion}")  # La producción no llegó a ninguna posición
+        return resultados
+
+    def empezar(clave):
+        # Función para apilar el marco que deriva un par.
+        enCurso.add(clave)
+        pila.append((clave, derivar(*clave)))
+        if medicion is not None:
+            medicion.profundidadMaxima = max(medicion.profundidadMaxima, len(pila))  # Marcos anidados
+
+    finales = None  # Queda en None si el análisis lanza una excepción
+    pila = []  # Marcos (par, generador) en curso; el tope es el que se está derivando
+    try:
+        empezar((nodoInicial, 0))
+        enviado = None  # Derivaciones del par recién terminado, para el marco que lo pidió
+        while pila:
+            clave, marco = pila[-1]
+            try:
+                pedido = marco.send(enviado)
+            except StopIteration as fin:  # El par terminó: se memoriza y se entrega al marco anterior
+                pila.pop()
+                enCurso.discard(clave)
+                memoria[clave] = enviado = fin.value  # Cada par se evalúa una sola vez mientras siga en la memoria
+                if medicion is not None:
+                    medicion.extras['finalesMemorizados'] += len(enviado)
+                if tamanoCache is not None and len(memoria) > tamanoCache:
+                    memoria.popitem(last=False)  # Descarta la entrada usada hace más tiempo
+                continue
+            empezar(pedido)
+            enviado = None
+        finales = enviado
+    finally:
+        if medicion is not None:
+            medidor.terminar(medicion, None if finales is None else len(tokens) in finales)  # Se registra aunque falle
+    return finales
@@ -0,0 +1,67 @@
+# Analizador descendente con retroceso: prueba las producciones de cada no terminal en el orden del archivo
+# y deshace el árbol de las alternativas que fallan. Sirve para gramáticas que no son LL(1) pero no
+# para las recursivas por la izquierda (la recursión no termina).
+
+from .arbolCompacto import NINGUNO, ArbolCompacto  # Árbol de derivación en arreglos paralelos
+from .medicion import contar, nombreProduccion  # Contadores de la instrumentación opcional
+
+
+def analizarRetroceso(tokens, Vt, Vxt, S, P, arbol=None, medidor=None):
+    # Función para analizar la lista de tokens; retorna (valido, arbol) y el árbol es None si no es válida.
+    # El árbol se escribe en un ArbolCompacto; se puede pasar uno para reutilizar sus arreglos.
+    # Con un Medidor se cuentan expansiones, retrocesos y la profundidad de la recursión.
+    if arbol is None:
+        arbol = ArbolCompacto()  # Árbol nuevo para esta cadena
+    else:
+        arbol.limpiar()  # Reutiliza los arreglos de un análisis anterior
+    reglas = {}  # Producciones indexadas por lado izquierdo, para no recorrer P en cada expansión
+    for izq, der in P:
+        reglas.setdefault(izq, []).append(der)
+
+    medicion = medidor.iniciar('retroceso', tokens) if medidor is not None else None
+
+    def derivar(actual, posicion, nivel):
+        # actual es la lista de símbolos pendientes, cada uno con el nodo padre que lo recibe
+        # nivel es la cantidad de llamadas anidadas, solo para la medición
+        if not actual:  # Si no hay más símbolos para derivar
+            return posicion == len(tokens)  # Es válida si se consumió toda la cadena
+
+        (simboloActual, padre), resto = actual[0], actual[1:]  # Obtiene el símbolo actual
+
+        if simboloActual in Vt:  # Si el símbolo es terminal
+            if posicion < len(tokens) and simboloActual == tokens[posicion]:  # Verifica si coincide con el token actual
+                arbol.agregarNodo(simboloActual, padre)  # Crea la hoja bajo su padre
+                if medicion is not None:
+                    medicion.consumidos = max(medicion.consumidos, posicion + 1)
+                    medicion.profundidadMaxima = max(medicion.profundidadMaxima, nivel + 1)
+                return derivar(resto, posicion + 1, nivel + 1)  # Continúa con los siguientes símbolos
+            return False  # Si no coincide, retorna falso
+
+        if simboloActual in Vxt:  # Si el símbolo es no terminal
+            for der in reglas.get(simboloActual, ()):  # Revisa solo las producciones del símbolo
+                marca = len(arbol)  # Punto al que se regresa si la alternativa falla
+                if medicion is not None:
+                    contar(medicion.expansiones, simboloActual)
+                    medicion.profundidadMaxima = max(medicion.profundidadMaxima, nivel + 1)
+                subarbol = arbol.agregarNodo(simboloActual, padre)  # Crea el nodo para el símbolo
+                if der == ['ε']:  # Si la producción es epsilon
+                    arbol.agregarNodo('ε', subarbol)  # Hoja para la producción vacía
+                    nuevoActual = resto  # No agrega símbolos pendientes
+                else:
+                    nuevoActual = [(s, subarbol) for s in der] + resto  # Combina la producción con los símbolos restantes
+                if derivar(nuevoActual, posicion, nivel + 1):
+                    return True  # Si es válido, retorna verdadero
+                arbol.truncar(marca)  # Descarta los nodos de la alternativa fallida
+                if medicion is not None:
+                    contar(medicion.retrocesos, nombreProduccion(simboloActual, der))
+            return False  # Si no hay producciones válidas, retorna falso
+
+        return False  # Si no es ni terminal ni no terminal, retorna falso
+
+    valido = None  # Queda en None si la recursión lanza una excepción
+    try:
+        valido = derivar([(S, NINGUNO)], 0, 0)  # Comienza la derivación desde el símbolo inicial
+    finally:
+        if medicion is not None:
+            medidor.terminar(medicion, valido)  # Se registra aunque se agote la recursión
+    return valido, arbol if valido else None  # Retorna si es válida y el árbol de derivación
@@ -0,0 +1,199 @@
+# Almacenamiento compacto de árboles de derivación en arreglos paralelos.
+# Cada nodo es un índice entero; los símbolos se internan como enteros pequeños y los hijos
+# se enlazan con primerHijo/siguienteHermano, por lo que los nodos pueden tener cualquier cantidad de hijos.
+
+from array import array  # Arreglos de enteros sin un objeto de Python por elemento
+
+NINGUNO = -1  # Índice que indica la ausencia de padre, hijo o hermano
+
+
+class TablaSimbolos:
+    # Tabla que asigna a cada símbolo un entero pequeño; puede compartirse entre muchos árboles.
+    __slots__ = ('simbolos', 'indice')
+
+    def __init__(self, simbolos=()):
+        self.simbolos = []  # Entero -> símbolo
+        self.indice = {}  # Símbolo -> entero
+        for simbolo in simbolos:
+            self.internar(simbolo)
+
+    def internar(self, simbolo):
+        # Función para obtener el entero del símbolo, agregándolo si es nuevo.
+        numero = self.indice.get(simbolo)
+        if numero is None:
+            numero = len(self.simbolos)  # Siguiente entero libre
+            self.indice[simbolo] = numero
+            self.simbolos.append(simbolo)
+        return numero
+
+    def __getitem__(self, numero):
+        return self.simbolos[numero]  # Símbolo correspondiente al entero
+
+    def __len__(self):
+        return len(self.simbolos)
+
+
+class ArbolCompacto:
+    # Árbol n-ario guardado en arreglos paralelos; los identificadores de nodo empiezan en 0 en cada árbol.
+    __slots__ = ('simbolos', 'simbolo', 'padre', 'primerHijo', 'siguienteHermano', 'ultimoHijo')
+
+    def __init__(self, simbolos=None):
+        self.simbolos = simbolos if simbolos is not None else TablaSimbolos()  # Tabla de símbolos (compartible)
+        self.simbolo = array('i')  # Símbolo internado de cada nodo
+        self.padre = array('i')  # Índice del padre de cada nodo
+        self.primerHijo = array('i')  # Índice del primer hijo de cada nodo
+        self.siguienteHermano = array('i')  # Índice del siguiente hermano de cada nodo
+        self.ultimoHijo = array('i')  # Índice del último hijo, para agregar hijos en tiempo constante
+
+    def __len__(self):
+        return len(self.simbolo)  # Cantidad de nodos
+
+    def agregarNodo(self, simbolo, padre=NINGUNO):
+        # Función para agregar un nodo como último hijo de padre; retorna su índice.
+        nodo = len(self.simbolo)  # El índice del nodo es su posición en los arreglos
+        self.simbolo.append(self.simbolos.internar(simbolo))
+        self.padre.append(padre)
+        self.primerHijo.append(NINGUNO)
+        self.siguienteHermano.append(NINGUNO)
+        self.ultimoHijo.append(NINGUNO)
+        if padre != NINGUNO:
+            anterior = self.ultimoHijo[padre]  # Último hijo actual del padre
+            if anterior == NINGUNO:
+                self.primerHijo[padre] = nodo  # Es el primer hijo
+            else:
+                self.siguienteHermano[anterior] = nodo  # Se enlaza después del último hermano
+            self.ultimoHijo[padre] = nodo
+        return nodo
+
+    def etiqueta(self, nodo):
+        # Función para obtener el símbolo (texto) de un nodo.
+        return self.simbolos[self.simbolo[nodo]]
+
+    def hijos(self, nodo):
+        # Generador de los hijos de un nodo en orden.
+        hijo = self.primerHijo[nodo]
+        while hijo != NINGUNO:
+            yield hijo
+            hijo = self.siguienteHermano[hijo]
+
+    def reemplazar(self, viejo, nuevo):
+        # Función para poner el subárbol suelto nuevo en el lugar de viejo; viejo queda desconectado del árbol.
+        padre = self.padre[viejo]
+        self.padre[nuevo] = padre
+        self.siguienteHermano[nuevo] = self.siguienteHermano[viejo]
+        if self.primerHijo[padre] == viejo:
+            self.primerHijo[padre] = nuevo
+        else:
+            hermano = self.primerHijo[padre]  # Busca el hermano anterior a viejo
+            while self.siguienteHermano[hermano] != viejo:
+                hermano = self.siguienteHermano[hermano]
+            self.siguienteHermano[hermano] = nuevo
+        if self.ultimoHijo[padre] == viejo:
+            self.ultimoHijo[padre] = nuevo
+        self.padre[viejo] = NINGUNO
+        self.siguienteHermano[viejo] = NINGUNO
+
+    def intercambiar(self, x, y):
+        # Función para intercambiar de lugar dos subárboles con padre, de padres distintos y ninguno dentro del otro.
+        padreX, padreY = self.padre[x], self.padre[y]
+        anteriorX, anteriorY = self._hermanoAnterior(x), self._hermanoAnterior(y)
+        siguienteX, siguienteY = self.siguienteHermano[x], self.siguienteHermano[y]
+        self._enlazar(y, padreX, anteriorX, siguienteX)
+        self._enlazar(x, padreY, anteriorY, siguienteY)
+
+    def _hermanoAnterior(self, nodo):
+        # Función para obtener el hermano anterior de un nodo (NINGUNO si es el primer hijo).
+        anterior, hermano = NINGUNO, self.primerHijo[self.padre[nodo]]
+        while hermano != nodo:
+            anterior, hermano = hermano, self.siguienteHermano[hermano]
+        return anterior
+
+    def _enlazar(self, nodo, padre, anterior, siguiente):
+        # Función para poner nodo como hijo de padre entre los hermanos anterior y siguiente.
+        self.padre[nodo] = padre
+        self.siguienteHermano[nodo] = siguiente
+        if anterior == NINGUNO:
+            self.primerHijo[padre] = nodo
+        else:
+            self.siguienteHermano[anterior] = nodo
+        if siguiente == NINGUNO:
+            self.ultimoHijo[padre] = nodo
+
+    def aListas(self, nodo=0):
+        # Función para convertir el subárbol en listas anidadas [simbolo, hijos] (por ejemplo para JSON).
+        resultado = [self.etiqueta(nodo), []]
+        pila = [(nodo, resultado)]  # Recorrido iterativo para soportar árboles muy profundos
+        while pila:
+            actual, destino = pila.pop()
+            for hijo in self.hijos(actual):
+                lista = [self.etiqueta(hijo), []]
+                destino[1].append(lista)
+                pila.append((hijo, lista))
+        return resultado
+
+    def aTuplas(self, nodo=0):
+        # Función para convertir el subárbol en tuplas inmutables (simbolo, hijos), el formato del analizador packrat.
+        etiquetas, simbolo = self.simbolos.simbolos, self.simbolo
+        primerHijo, siguienteHermano = self.primerHijo, self.siguienteHermano
+        orden = [nodo]  # Nodos del subárbol por niveles: al recorrerlos al revés los hijos van antes que el padre
+        for actual in orden:
+            hijo = primerHijo[actual]
+            while hijo != NINGUNO:
+                orden.append(hijo)
+                hijo = siguienteHermano[hijo]
+        tuplas = {}  # Nodo -> tupla ya construida
+        for actual in reversed(orden):
+            hijos = []
+            hijo = primerHijo[actual]
+            while hijo != NINGUNO:
+                hijos.append(tuplas.pop(hijo))
+                hijo = siguienteHermano[hijo]
+            tuplas[actual] = (etiquetas[simbolo[actual]], tuple(hijos))
+        return tuplas[nodo]
+
+    def agregarTuplas(self, tupla, padre=NINGUNO):
+        # Función para copiar un árbol de tuplas (simbolo, hijos) como último hijo de padre; retorna el índice de su raíz.
+        raiz = self.agregarNodo(tupla[0], padre)
+        internar = self.simbolos.internar
+        pila = [(tupla[1], raiz)]  # (hijos por copiar, nodo destino); los hermanos se escriben juntos y enlazados
+        while pila:
+            hijos, destino = pila.pop()
+            if not hijos:
+                continue
+            primero = len(self.simbolo)  # Los hijos ocupan índices consecutivos
+            for hijo in hijos:
+                self.simbolo.append(internar(hijo[0]))
+            cantidad = len(hijos)
+            self.padre.extend([destino] * cantidad)
+            self.primerHijo.extend([NINGUNO] * cantidad)
+            self.ultimoHijo.extend([NINGUNO] * cantidad)
+            self.siguienteHermano.extend(range(primero + 1, primero + cantidad))
+            self.siguienteHermano.append(NINGUNO)
+            self.primerHijo[destino] = primero
+            self.ultimoHijo[destino] = primero + cantidad - 1
+            pila.extend((hijo[1], primero + k) for k, hijo in enumerate(hijos))
+        return raiz
+
+    def truncar(self, marca):
+        # Función para descartar todos los nodos creados desde marca (len(arbol) guardado antes).
+        # Solo se recorren los nodos descartados, así deshacer una alternativa fallida es proporcional a lo que creó.
+        for nodo in range(marca, len(self.simbolo)):
+            padre = self.padre[nodo]
+            if padre != NINGUNO and padre < marca and self.ultimoHijo[padre] >= marca:  # Padre que sobrevive
+                previo = NINGUNO  # Último hijo del padre anterior a la marca
+                hijo = self.primerHijo[padre]
+                while hijo != NINGUNO and hijo < marca:
+                    previo = hijo
+                    hijo = self.siguienteHermano[hijo]
+                self.ultimoHijo[padre] = previo
+                if previo == NINGUNO:
+                    self.primerHijo[padre] = NINGUNO
+                else:
+                    self.siguienteHermano[previo] = NINGUNO
+        for arreglo in (self.simbolo, self.padre, self.primerHijo, self.siguienteHermano, self.ultimoHijo):
+            del arreglo[marca:]
+
+    def limpiar(self):
+        # Función para vaciar el árbol de una sola vez y reutilizarlo en el siguiente análisis.
+        for arreglo in (self.simbolo, self.padre, self.primerHijo, self.siguienteHermano, self.ultimoHijo):
+            del arreglo[:]
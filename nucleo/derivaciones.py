@@ -0,0 +1,188 @@
+# Conteo, recorrido y muestreo de los árboles de derivación guardados en el bosque de Earley.
+# El bosque comparte los subárboles comunes, así que contar se hace con programación dinámica sobre sus
+# nodos (enteros de Python, sin límite de tamaño) y cada árbol se obtiene a partir de su número de orden
+# sin enumerar los anteriores: recorrerlos es perezoso y muestrear uno es elegir un número al azar.
+
+from .analizadorEarley import elegirAlternativas, hijosAlternativa  # Alternativas bien fundadas del bosque
+from .analizadorLL1 import EPSILON  # Hoja de las producciones vacías
+
+INFINITO = float('inf')  # Cantidad de derivaciones cuando el bosque tiene ciclos (A =>+ A)
+
+NODO, CERRAR, HOJA = 0, 1, 2  # Tipos de tarea al armar un árbol
+
+
+def componentesFuertes(nodos, hijosDe):
+    # Función para calcular las componentes fuertemente conexas (Tarjan iterativo).
+    # Retorna (componente de cada nodo, lista de componentes); cada componente aparece después de las que alcanza.
+    indice, bajo = {}, {}
+    pilaTarjan, enPila = [], set()
+    componente, componentes = {}, []
+    for inicio in nodos:
+        if inicio in indice:
+            continue
+        indice[inicio] = bajo[inicio] = len(indice)
+        pilaTarjan.append(inicio)
+        enPila.add(inicio)
+        trabajo = [(inicio, iter(hijosDe[inicio]))]  # Pila explícita en lugar de recursión
+        while trabajo:
+            nodo, hijos = trabajo[-1]
+            for hijo in hijos:
+                if hijo not in indice:  # Se baja al hijo y se retoma este nodo después
+                    indice[hijo] = bajo[hijo] = len(indice)
+                    pilaTarjan.append(hijo)
+                    enPila.add(hijo)
+                    trabajo.append((hijo, iter(hijosDe[hijo])))
+                    break
+                if hijo in enPila:
+                    bajo[nodo] = min(bajo[nodo], indice[hijo])
+            else:  # Todos los hijos vistos
+                trabajo.pop()
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    bajo[padre] = min(bajo[padre], bajo[nodo])
+                if bajo[nodo] == indice[nodo]:  # nodo es la raíz de una componente
+                    miembros = []
+                    while True:
+                        miembro = pilaTarjan.pop()
+                        enPila.discard(miembro)
+                        componente[miembro] = len(componentes)
+                        miembros.append(miembro)
+                        if miembro == nodo:
+                            break
+                    componentes.append(miembros)
+    return componente, componentes
+
+
+class Derivaciones:
+    # Árboles de derivación de una cadena aceptada, a partir de su bosque de Earley.
+    # total() es la cantidad exacta de árboles (INFINITO si una derivación puede repetirse en ciclo).
+    # En un bosque con ciclos, arbol(), arboles() y muestra() se limitan a las alternativas que no vuelven
+    # a su propia componente hacia un nodo resuelto después (orden de Knuth), que dejan al menos un árbol por nodo.
+    __slots__ = ('bosque', 'elegibles', 'cuentas', 'ciclico')
+
+    def __init__(self, bosque):
+        self.bosque = bosque
+        self.elegibles = {}  # Nodo -> [(alternativa, cantidad de árboles que aporta)]
+        self.cuentas = {}  # Nodo -> cantidad de árboles (entero exacto)
+        self.ciclico = not self._contarSinCiclos()
+        if self.ciclico:
+            self._contarConCiclos()
+
+    def _contarSinCiclos(self):
+        # Función para contar en postorden desde la raíz; retorna False apenas encuentra un ciclo.
+        nodos, cuentas, elegibles = self.bosque.nodos, self.cuentas, self.elegibles
+        enCurso = set()  # Nodos expandidos sin contar: exactamente los ancestros del tope de la pila
+        pila = [self.bosque.raiz]
+        while pila:
+            clave = pila[-1]
+            if clave in cuentas:  # Subárbol compartido ya contado
+                pila.pop()
+                continue
+            simbolo = isinstance(clave[0], str)
+            if clave not in enCurso:  # Primera visita: se apilan los hijos sin contar
+                enCurso.add(clave)
+                for alternativa in nodos[clave]:
+                    for hijo in ((alternativa[1],) if simbolo else alternativa):
+                        if hijo in nodos and hijo not in cuentas:
+                            if hijo in enCurso:
+                                return False  # El hijo es un ancestro: hay un ciclo
+                            pila.append(hijo)
+                continue
+            pila.pop()  # Segunda visita: todos los hijos están contados
+            enCurso.discard(clave)
+            if simbolo:
+                lista = [(alternativa, cuentas[alternativa[1]] if alternativa[1] else 1) for alternativa in nodos[clave]]
+            else:
+                lista = [(alternativa, (cuentas[alternativa[0]] if alternativa[0] else 1) * cuentas.get(alternativa[1], 1))
+                         for alternativa in nodos[clave]]
+            elegibles[clave] = lista
+            cuentas[clave] = sum(cantidad for _, cantidad in lista)
+        return True
+
+    def _contarConCiclos(self):
+        # Función para contar sin las alternativas que cierran ciclos: por componentes fuertes, y dentro de
+        # cada una en el orden en que el algoritmo de Knuth resuelve los nodos.
+        bosque = self.bosque
+        nodos, cuentas, elegibles = bosque.nodos, self.cuentas, self.elegibles
+        cuentas.clear()
+        elegibles.clear()
+        hijosDe = {clave: [h for alternativa in alternativas for h in hijosAlternativa(clave, alternativa) if h in nodos]
+                   for clave, alternativas in nodos.items()}
+        componente, componentes = componentesFuertes(nodos, hijosDe)
+        posicion = {clave: i for i, clave in enumerate(elegirAlternativas(bosque))}  # Orden de resolución
+        for miembros in componentes:  # Las componentes alcanzadas ya están contadas
+            for clave in sorted(miembros, key=posicion.__getitem__):
+                lista = []
+                for alternativa in nodos[clave]:
+                    hijos = [h for h in hijosAlternativa(clave, alternativa) if h in nodos]
+                    if any(componente[h] == componente[clave] and posicion[h] >= posicion[clave] for h in hijos):
+                        continue  # Alternativa que cierra un ciclo
+                    cantidad = 1
+                    for h in hijos:
+                        cantidad *= cuentas[h]
+                    lista.append((alternativa, cantidad))
+                elegibles[clave] = lista
+                cuentas[clave] = sum(cantidad for _, cantidad in lista)
+
+    def total(self):
+        # Función para obtener la cantidad de árboles de derivación de la cadena.
+        return INFINITO if self.ciclico else self.cuentas[self.bosque.raiz]
+
+    def ambigua(self):
+        # Función para saber si la cadena tiene más de un árbol de derivación.
+        return self.total() > 1
+
+    def cantidadRecorrible(self):
+        # Función para obtener cuántos árboles recorren arboles() y muestra() (igual a total() sin ciclos).
+        return self.cuentas[self.bosque.raiz]
+
+    def arbol(self, numero):
+        # Función para obtener el árbol número (desde 0) como tuplas (simbolo, hijos), sin armar los anteriores.
+        # Cada nodo reparte el número entre sus alternativas según cuántos árboles aporta cada una.
+        if not 0 <= numero < self.cuentas[self.bosque.raiz]:
+            raise IndexError(f"El árbol {numero} no existe; hay {self.cuentas[self.bosque.raiz]}.")
+        nodos, cuentas, elegibles = self.bosque.nodos, self.cuentas, self.elegibles
+        valores = []  # Subárboles ya armados; cada nodo de símbolo toma los suyos del final
+        tareas = [(NODO, self.bosque.raiz, numero)]  # Pila explícita para soportar árboles muy profundos
+        while tareas:
+            tipo, clave, resto = tareas.pop()
+            if tipo == CERRAR:  # clave es el símbolo y resto la posición de su primer hijo en valores
+                hijos = tuple(valores[resto:])
+                del valores[resto:]
+                valores.append((clave, hijos))
+                continue
+            if tipo == HOJA or clave not in nodos:  # Terminal o ε
+                valores.append((clave[0] if tipo == NODO else clave, ()))
+                continue
+            for alternativa, cantidad in elegibles[clave]:  # Alternativa que contiene al árbol buscado
+                if resto < cantidad:
+                    break
+                resto -= cantidad
+            if isinstance(clave[0], str):  # Nodo de símbolo: sus hijos salen del nodo ítem
+                tareas.append((CERRAR, clave[0], len(valores)))
+                tareas.append((NODO, alternativa[1], resto) if alternativa[1] else (HOJA, EPSILON, 0))
+            else:  # Nodo ítem: el prefijo va antes que el último símbolo, así que se apila después
+                izquierdo, derecho = alternativa
+                cantidadDerecho = cuentas.get(derecho, 1)
+                restoIzquierdo, restoDerecho = divmod(resto, cantidadDerecho)
+                tareas.append((NODO, derecho, restoDerecho))
+                if izquierdo:
+                    tareas.append((NODO, izquierdo, restoIzquierdo))
+        return valores[0]
+
+    def arboles(self, inicio=0):
+        # Generador perezoso de los árboles en orden, desde el número inicio; cada uno se arma al pedirlo.
+        for numero in range(inicio, self.cuentas[self.bosque.raiz]):
+            yield self.arbol(numero)
+
+    def muestra(self, aleatorio=None):
+        # Función para elegir un árbol uniformemente al azar; aleatorio es un random.Random para repetir resultados.
+        if aleatorio is None:
+            import random  # Solo se carga al muestrear
+            aleatorio = random
+        return self.arbol(aleatorio.randrange(self.cuentas[self.bosque.raiz]))
+
+
+def contarDerivaciones(bosque):
+    # Función para contar los árboles de derivación de un bosque (INFINITO si tiene ciclos).
+    return Derivaciones(bosque).total()
@@ -0,0 +1,222 @@
+# Diseño ordenado de árboles (Reingold-Tilford en la versión de Walker con las mejoras de Buchheim,
+# Jünger y Leipert) y dibujo sin ventana a SVG o PNG.
+# El diseño es determinista y de tiempo lineal: los padres quedan centrados sobre sus hijos, los hermanos
+# conservan su orden y los subárboles se acercan tanto como lo permite la separación mínima.
+# Todo es iterativo, así que sirve para derivaciones de miles de niveles.
+#
+# El árbol se describe con una lista hijos[nodo] -> lista de hijos de izquierda a derecha y una lista de
+# etiquetas; hay funciones para obtenerlas de un ArbolCompacto o de un grafo de NetworkX.
+
+from .arbolCompacto import NINGUNO  # Nodo ausente
+
+ALTO_NIVEL = 60  # Píxeles entre niveles
+ANCHO_CARACTER = 7.5  # Ancho aproximado de un carácter de la fuente de 12 px
+MARGEN = 20  # Píxeles alrededor del dibujo
+
+
+def escape(texto):
+    # Función para escribir texto dentro del SVG (xml.sax.saxutils arrastra urllib y tarda en importarse).
+    return texto.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def disenarArbol(hijos, raiz=0, separacion=1.0):
+    # Función para calcular la posición (x, nivel) de cada nodo alcanzable desde la raíz; los demás quedan en None.
+    # x está en unidades de separación entre hermanos y el menor x es 0.
+    n = len(hijos)
+    padre, numero = [NINGUNO] * n, [0] * n  # Padre de cada nodo y su posición entre sus hermanos
+    recorrido, pila = [], [raiz]  # Preorden de derecha a izquierda; al revés es el posorden de izquierda a derecha
+    while pila:
+        v = pila.pop()
+        recorrido.append(v)
+        for i, w in enumerate(hijos[v]):
+            padre[w], numero[w] = v, i
+        pila.extend(hijos[v])
+
+    prelim, mod = [0.0] * n, [0.0] * n  # Posición preliminar y corrimiento acumulado para los descendientes
+    cambio, corrimiento = [0.0] * n, [0.0] * n  # Corrimientos pendientes que se reparten entre hermanos
+    hilo = [NINGUNO] * n  # Enlace al siguiente nodo del contorno cuando el nodo es hoja
+    ancestro = list(range(n))
+    porDefecto = [h[0] if h else NINGUNO for h in hijos]  # Ancestro por defecto mientras se ubican los hijos
+
+    def izquierdaSiguiente(v):
+        return hijos[v][0] if hijos[v] else hilo[v]  # Siguiente nodo del contorno izquierdo
+
+    def derechaSiguiente(v):
+        return hijos[v][-1] if hijos[v] else hilo[v]  # Siguiente nodo del contorno derecho
+
+    for v in reversed(recorrido):  # Primera pasada: de las hojas hacia la raíz
+        p = padre[v]
+        izquierdo = hijos[p][numero[v] - 1] if p != NINGUNO and numero[v] > 0 else NINGUNO  # Hermano izquierdo
+        hs = hijos[v]
+        if hs:
+            s = c = 0.0
+            for w in reversed(hs):  # Aplica los corrimientos pendientes de los hijos
+                prelim[w] += s
+                mod[w] += s
+                c += cambio[w]
+                s += corrimiento[w] + c
+            medio = (prelim[hs[0]] + prelim[hs[-1]]) / 2  # Centro sobre los hijos
+            if izquierdo != NINGUNO:
+                prelim[v] = prelim[izquierdo] + separacion
+                mod[v] = prelim[v] - medio
+            else:
+                prelim[v] = medio
+        elif izquierdo != NINGUNO:
+            prelim[v] = prelim[izquierdo] + separacion
+
+        if izquierdo == NINGUNO:
+            continue
+        # Separa el subárbol de v de los subárboles de sus hermanos izquierdos recorriendo los contornos
+        vir = vor = v  # Contorno interior y exterior derechos (subárbol de v)
+        vil, vol = izquierdo, hijos[p][0]  # Contorno interior y exterior izquierdos
+        sir = sor = mod[v]
+        sil, sol = mod[vil], mod[vol]
+        while True:
+            siguienteIl, siguienteIr = derechaSiguiente(vil), izquierdaSiguiente(vir)
+            if siguienteIl == NINGUNO or siguienteIr == NINGUNO:
+                break
+            vil, vir = siguienteIl, siguienteIr
+            vol, vor = izquierdaSiguiente(vol), derechaSiguiente(vor)
+            ancestro[vor] = v
+            desplazar = (prelim[vil] + sil) - (prelim[vir] + sir) + separacion
+            if desplazar > 0:
+                a = ancestro[vil] if padre[ancestro[vil]] == p else porDefecto[p]
+                subarboles = numero[v] - numero[a]  # Reparte el corrimiento entre los hermanos intermedios
+                cambio[v] -= desplazar / subarboles
+                corrimiento[v] += desplazar
+                cambio[a] += desplazar / subarboles
+                prelim[v] += desplazar
+                mod[v] += desplazar
+                sir += desplazar
+                sor += desplazar
+            sil += mod[vil]
+            sir += mod[vir]
+            sol += mod[vol]
+            sor += mod[vor]
+        if derechaSiguiente(vil) != NINGUNO and derechaSiguiente(vor) == NINGUNO:
+            hilo[vor] = derechaSiguiente(vil)
+            mod[vor] += sil - sor
+        if izquierdaSiguiente(vir) != NINGUNO and izquierdaSiguiente(vol) == NINGUNO:
+            hilo[vol] = izquierdaSiguiente(vir)
+            mod[vol] += sir - sol
+            porDefecto[p] = v
+
+    posiciones = [None] * n
+    pila = [(raiz, 0.0, 0)]  # Segunda pasada: (nodo, corrimiento acumulado, nivel)
+    while pila:
+        v, m, nivel = pila.pop()
+        posiciones[v] = (prelim[v] + m, nivel)
+        pila.extend((w, m + mod[v], nivel + 1) for w in hijos[v])
+    menor = min(x for x, _ in (p for p in posiciones if p is not None))
+    return [None if p is None else (p[0] - menor, p[1]) for p in posiciones]
+
+
+def desdeArbolCompacto(arbol):
+    # Función para obtener las listas (hijos, etiquetas) de un ArbolCompacto; la raíz es el nodo 0.
+    return [list(arbol.hijos(nodo)) for nodo in range(len(arbol))], [arbol.etiqueta(nodo) for nodo in range(len(arbol))]
+
+
+def desdeGrafo(grafo):
+    # Función para obtener (hijos, etiquetas, nodos, raiz) de un árbol de NetworkX con el atributo 'label'.
+    # Los hijos quedan en el orden en que se agregaron las aristas; nodos[i] es el nodo original del índice i.
+    nodos = list(grafo.nodes)
+    indice = {nodo: i for i, nodo in enumerate(nodos)}
+    hijos = [[indice[h] for h in grafo.successors(nodo)] for nodo in nodos]
+    etiquetas = [grafo.nodes[nodo].get('label', nodo) for nodo in nodos]
+    raiz = next(i for i, nodo in enumerate(nodos) if grafo.in_degree(nodo) == 0)
+    return hijos, etiquetas, nodos, raiz
+
+
+def posicionesGrafo(grafo):
+    # Función para obtener el diccionario nodo -> (x, y) que usa nx.draw, con la raíz arriba.
+    hijos, _, nodos, raiz = desdeGrafo(grafo)
+    posiciones = disenarArbol(hijos, raiz)
+    return {nodos[i]: (p[0], -p[1]) for i, p in enumerate(posiciones) if p is not None}
+
+
+def _medidas(etiquetas, posiciones):
+    # Función para calcular la escala horizontal en píxeles y el tamaño total del dibujo.
+    largo = max((len(str(etiquetas[i])) for i, p in enumerate(posiciones) if p is not None), default=1)
+    anchoNodo = max(24.0, largo * ANCHO_CARACTER + 12)  # Los nodos más anchos separan más las columnas
+    escala = anchoNodo + 10
+    ancho = max(p[0] for p in posiciones if p is not None) * escala + anchoNodo + 2 * MARGEN
+    alto = max(p[1] for p in posiciones if p is not None) * ALTO_NIVEL + 2 * MARGEN + 24
+    return anchoNodo, escala, ancho, alto
+
+
+def guardarSVG(hijos, etiquetas, archivo, raiz=0, titulo=None, posiciones=None):
+    # Función para dibujar el árbol en un archivo SVG sin ninguna biblioteca externa.
+    posiciones = posiciones or disenarArbol(hijos, raiz)
+    anchoNodo, escala, ancho, alto = _medidas(etiquetas, posiciones)
+    arriba = MARGEN + (24 if titulo else 0)
+    centro = lambda p: (MARGEN + anchoNodo / 2 + p[0] * escala, arriba + 12 + p[1] * ALTO_NIVEL)
+
+    partes = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho:.0f}" height="{alto + (24 if titulo else 0):.0f}" '
+              'font-family="sans-serif" font-size="12">\n']
+    if titulo:
+        partes.append(f'<text x="{ancho / 2:.1f}" y="{MARGEN + 6}" text-anchor="middle" font-size="14">{escape(titulo)}</text>\n')
+    trazos = []  # Todas las aristas en un solo camino
+    for v, p in enumerate(posiciones):
+        if p is not None:
+            x, y = centro(p)
+            for w in hijos[v]:
+                xh, yh = centro(posiciones[w])
+                trazos.append(f'M{x:.1f} {y + 10:.1f}L{xh:.1f} {yh - 10:.1f}')
+    partes.append(f'<path d="{"".join(trazos)}" stroke="#555" fill="none"/>\n')
+    partes.append('<g fill="lightblue" stroke="#333">\n')
+    for v, p in enumerate(posiciones):
+        if p is not None:
+            x, y = centro(p)
+            partes.append(f'<rect x="{x - anchoNodo / 2:.1f}" y="{y - 10:.1f}" width="{anchoNodo:.1f}" height="20" rx="10"/>\n')
+    partes.append('</g>\n<g text-anchor="middle" dominant-baseline="central">\n')
+    for v, p in enumerate(posiciones):
+        if p is not None:
+            x, y = centro(p)
+            partes.append(f'<text x="{x:.1f}" y="{y:.1f}">{escape(str(etiquetas[v]))}</text>\n')
+    partes.append('</g>\n</svg>\n')
+    with open(archivo, 'w', encoding='utf-8') as f:
+        f.write(''.join(partes))
+
+
+def pngDisponible():
+    # Función para saber si se pueden guardar PNG (matplotlib instalado) sin llegar a importar matplotlib.
+    from importlib.util import find_spec
+    return find_spec('matplotlib') is not None
+
+
+def guardarPNG(hijos, etiquetas, archivo, raiz=0, titulo=None, posiciones=None, dpi=100):
+    # Función para dibujar el árbol en un archivo PNG con matplotlib sin pyplot ni ventana (lienzo Agg).
+    # Las aristas van en una sola colección y los nodos en un solo diagrama de dispersión.
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # Solo se necesita para PNG
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    posiciones = posiciones or disenarArbol(hijos, raiz)
+    anchoNodo, escala, ancho, alto = _medidas(etiquetas, posiciones)
+    tamano = (min(ancho / dpi, 650.0), min(alto / dpi, 650.0))  # Agg no admite más de 65536 píxeles por lado
+    figura = Figure(figsize=tamano, dpi=dpi)
+    FigureCanvasAgg(figura)
+    ejes = figura.add_axes((0, 0, 1, 1))
+    ejes.axis('off')
+
+    puntos = [(v, p[0] * escala, -p[1] * ALTO_NIVEL) for v, p in enumerate(posiciones) if p is not None]
+    coordenadas = {v: (x, y) for v, x, y in puntos}
+    ejes.add_collection(LineCollection([(coordenadas[v], coordenadas[w]) for v, _, _ in puntos for w in hijos[v]],
+                                       colors='#555', linewidths=1, zorder=1))
+    ejes.scatter([x for _, x, _ in puntos], [y for _, _, y in puntos], s=(anchoNodo * 72 / dpi) ** 2 / 2,
+                 c='lightblue', edgecolors='#333', zorder=2)
+    for v, x, y in puntos:
+        ejes.text(x, y, str(etiquetas[v]), ha='center', va='center', fontsize=9, zorder=3)
+    ejes.set_xlim(-anchoNodo / 2 - MARGEN, ancho - anchoNodo / 2 - MARGEN)
+    ejes.set_ylim(-(alto - MARGEN - 12), MARGEN + 12)
+    if titulo:
+        figura.suptitle(titulo)
+    figura.savefig(archivo)
+
+
+def guardarImagen(hijos, etiquetas, archivo, raiz=0, titulo=None):
+    # Función para guardar el árbol en SVG o PNG según la extensión del archivo.
+    if archivo.lower().endswith('.png'):
+        guardarPNG(hijos, etiquetas, archivo, raiz, titulo)
+    else:
+        guardarSVG(hijos, etiquetas, archivo, raiz, titulo)
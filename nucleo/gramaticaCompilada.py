@@ -0,0 +1,117 @@
+# Gramática compilada: todo lo que los analizadores calculan a partir del archivo de gramática,
+# hecho una sola vez y guardado en una caché en disco indexada por el hash del contenido del archivo.
+# Los arranques siguientes con el mismo archivo cargan las tablas listas en lugar de recalcularlas.
+# La clave también incluye una huella del código que calcula y define lo que se guarda, así una caché
+# escrita por otra versión del núcleo no se usa aunque nadie haya cambiado VERSION_CACHE.
+
+import os  # Rutas y reemplazo atómico del archivo de caché
+import sys  # Módulos cargados, para la huella del código
+
+from .analizadorEarley import prepararGramatica  # Reglas punteadas del analizador de Earley
+from .analizadorLL1 import (EPSILON, ConflictoLL1, calcularAnulables, calcularPrimeros,
+                           calcularSiguientes, construirTablaLL1)  # Conjuntos y tabla LL(1)
+from .arbolCompacto import TablaSimbolos  # Internado de símbolos compartido con los árboles
+from .lectorGramatica import cargarGramatica  # Lectura del archivo en cualquiera de sus formatos
+from .lexico import Lexico  # Léxico compilado a partir de los terminales
+from .normalizacion import normalizarGramatica  # Transformaciones con vuelta a la gramática original
+
+VERSION_CACHE = 4  # Formato del archivo de caché; los cambios del código ya los detecta huellaCodigo
+MODULOS_HUELLA = ('analizadorEarley', 'analizadorLL1', 'arbolCompacto', 'gramaticaCompilada', 'lectorGramatica',
+                  'lexico', 'normalizacion')  # Módulos del núcleo cuyo código determina el contenido de la caché
+_huella = None  # Huella calculada una sola vez por proceso
+
+
+class GramaticaCompilada:
+    # Gramática con las producciones indexadas por lado izquierdo, los símbolos internados como enteros
+    # y los conjuntos de anulables, PRIMEROS y SIGUIENTES, la tabla LL(1), las reglas de Earley y el léxico precalculados.
+    # Si la gramática se normalizó, normalizacion guarda cómo reportar los árboles con las producciones originales.
+    __slots__ = ('Vt', 'Vxt', 'S', 'P', 'simbolos', 'porIzquierda', 'anulables', 'primeros', 'siguientes',
+                 'tabla', 'conflictos', 'earley', 'lexico', 'normalizacion')
+
+    def __init__(self, Vt, Vxt, S, P, normalizacion=None):
+        self.Vt, self.Vxt, self.S, self.P = Vt, Vxt, S, P  # Componentes de la gramática que se analiza
+        self.normalizacion = normalizacion  # GramaticaNormalizada o None si es la del archivo
+        self.simbolos = TablaSimbolos([EPSILON] + sorted(Vt) + sorted(Vxt))  # Enteros estables para cada símbolo
+        self.porIzquierda = {A: [] for A in sorted(Vxt)}  # No terminal -> lados derechos en el orden del archivo
+        for izq, der in P:
+            self.porIzquierda[izq].append(der)
+        self.anulables = calcularAnulables(Vxt, P)
+        self.primeros = calcularPrimeros(Vt, Vxt, P, self.anulables)
+        self.siguientes = calcularSiguientes(Vxt, S, P, self.anulables, self.primeros)
+        try:
+            self.tabla = construirTablaLL1(Vt, Vxt, S, P, (self.anulables, self.primeros, self.siguientes))
+            self.conflictos = []
+        except ConflictoLL1 as e:
+            self.tabla = None  # La gramática no es LL(1)
+            self.conflictos = e.conflictos  # Se guardan para reportarlos sin recalcular
+        self.earley = prepararGramatica(Vxt, P, self.anulables)
+        self.lexico = Lexico(Vt)  # Léxico de coincidencia más larga para los terminales
+
+    def errorLL1(self):
+        # Función para obtener el error con el reporte de conflictos, o None si la gramática es LL(1).
+        return ConflictoLL1(self.conflictos) if self.conflictos else None
+
+
+def huellaCodigo():
+    # Función para obtener el hash del código fuente de MODULOS_HUELLA (las clases guardadas y lo que las calcula).
+    global _huella
+    if _huella is None:
+        import hashlib
+        resumen = hashlib.sha256()
+        for nombre in MODULOS_HUELLA:
+            with open(sys.modules[f"{__package__}.{nombre}"].__file__, 'rb') as f:
+                resumen.update(f.read())
+        _huella = resumen.hexdigest()[:16]
+    return _huella
+
+
+def directorioCachePorDefecto():
+    # Función para obtener el directorio de la caché: $ARBOL_CACHE o ~/.cache/arbolGramatical.
+    return os.environ.get('ARBOL_CACHE') or os.path.join(os.path.expanduser('~'), '.cache', 'arbolGramatical')
+
+
+def cargarGramaticaCompilada(archivo, directorioCache=None, usarCache=True, normalizar=None):
+    # Función para obtener la gramática compilada del archivo, desde la caché si ya se compiló antes.
+    # normalizar es None (gramática tal cual) o un diccionario con las opciones de normalizarGramatica;
+    # cada combinación de opciones tiene su propia entrada en la caché.
+    import hashlib  # Hash del contenido; se importan aquí para que importar el núcleo sea inmediato
+    import pickle  # Serialización de la gramática compilada
+    import tempfile  # Archivo temporal para escribir la caché
+
+    with open(archivo, 'rb') as f:
+        clave = hashlib.sha256(f.read()).hexdigest()  # Hash del contenido, no del nombre ni de la fecha
+    if normalizar is not None:
+        opciones = repr(sorted(normalizar.items())).encode()
+        clave += '-n' + hashlib.sha256(opciones).hexdigest()[:16]  # Las opciones también distinguen la entrada
+    nombre = f"v{VERSION_CACHE}-{huellaCodigo()}-{clave}.pickle"  # Otra versión del código usa otro archivo
+    ruta = os.path.join(directorioCache or directorioCachePorDefecto(), nombre)
+
+    if usarCache:
+        try:
+            with open(ruta, 'rb') as f:
+                version, gramatica = pickle.load(f)
+            if (version == VERSION_CACHE and isinstance(gramatica, GramaticaCompilada)
+                    and (gramatica.normalizacion is None) == (normalizar is None)):
+                return gramatica  # Tablas listas, sin leer ni analizar la gramática
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+            pass  # Caché ausente, dañada o de otra versión: se recompila
+
+    if normalizar is None:
+        gramatica = GramaticaCompilada(*cargarGramatica(archivo))  # Lee, valida y compila la gramática
+    else:
+        normalizada = normalizarGramatica(*cargarGramatica(archivo), **normalizar)  # Transforma la gramática leída
+        gramatica = GramaticaCompilada(normalizada.Vt, normalizada.Vxt, normalizada.S, normalizada.P, normalizada)
+    if usarCache:
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    pickle.dump((VERSION_CACHE, gramatica), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporal, ruta)  # Reemplazo atómico: otro proceso nunca ve un archivo a medias
+            except OSError:
+                os.unlink(temporal)  # No deja archivos temporales a medias
+                raise
+        except OSError:
+            pass  # Sin permisos de escritura: se trabaja sin caché
+    return gramatica
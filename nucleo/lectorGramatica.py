@@ -0,0 +1,82 @@
+# Lectura y validación de archivos de gramática, sin dependencias de graficación.
+# Lo comparten los programas interactivos y el modo por lotes.
+
+def leerGramatica(archivoGramatica):
+    # Función para leer la gramática desde un archivo
+    with open(archivoGramatica, 'r') as archivo:
+        Vt = set()  # Conjunto de terminales
+        Vxt = set()  # Conjunto de no terminales
+        P = []  # Lista de producciones
+        S = None  # Símbolo inicial
+
+        for linea in archivo:
+            linea = linea.strip()  # Elimina espacios en blanco al inicio y al final
+            if linea.startswith('Vt:'):
+                Vt = set(linea.replace('Vt:', '').strip().split())  # Asigna los terminales
+            elif linea.startswith('Vxt:'):
+                Vxt = set(linea.replace('Vxt:', '').strip().split())  # Asigna los no terminales
+            elif linea.startswith('S:'):
+                S = linea.replace('S:', '').strip()  # Asigna el símbolo inicial
+            elif linea.startswith('P:'):
+                break  # Termina la lectura de la sección de gramática
+
+        for linea in archivo:
+            linea = linea.strip()  # Elimina espacios en blanco al inicio y al final
+            if '->' in linea:  # Verifica si la línea contiene una producción
+                izquierda, derecha = linea.split('->')  # Divide en lado izquierdo y derecho
+                izquierda = izquierda.strip()  # Limpia el lado izquierdo
+                derecha = derecha.strip().split()  # Limpia y divide el lado derecho
+                P.append((izquierda, derecha))  # Agrega la producción a la lista
+
+        # Verifica si la gramática está completa
+        if not (Vt and Vxt and S and P):
+            raise ValueError("La gramática no está completa o el formato es incorrecto.")
+        return Vt, Vxt, S, P  # Retorna los componentes de la gramática
+
+def validarGramatica(Vt, Vxt, S, P):
+    # Función para validar los componentes de la gramática
+    if S not in Vxt:
+        raise ValueError("El símbolo inicial no está en el conjunto de no terminales.")  # Verifica símbolo inicial
+    for izq, der in P:
+        if izq not in Vxt:
+            raise ValueError(f"El lado izquierdo de la producción '{izq} -> {' '.join(der)}' no es un no terminal.")  # Verifica lado izquierdo
+        for simbolo in der:
+            if simbolo != 'ε' and simbolo not in Vt and simbolo not in Vxt:
+                raise ValueError(f"El símbolo '{simbolo}' en la producción '{izq} -> {' '.join(der)}' no es válido.")  # Verifica símbolos en producción
+
+# Función para leer las reglas gramaticales del archivo
+def interpretarGramatica(archivo):
+    reglasGramaticales = {}  # Diccionario para almacenar las reglas de la gramática
+    with open(archivo, 'r') as f:  # Abrir el archivo de la gramática en modo lectura
+        for linea in f:  # Iterar sobre cada línea del archivo
+            linea = linea.strip()  # Eliminar espacios en blanco al inicio y al final de la línea
+            if '->' in linea:  # Verificar si la línea contiene una producción
+                parteIzquierda, parteDerecha = linea.split('->')  # Separar la parte izquierda y derecha de la producción
+                parteIzquierda = parteIzquierda.strip()  # Eliminar espacios de la parte izquierda
+                parteDerecha = [token.strip() for token in parteDerecha.split('|')]  # Separar y limpiar las producciones de la parte derecha
+                
+                # Agregar la producción al diccionario de reglas
+                if parteIzquierda in reglasGramaticales:
+                    reglasGramaticales[parteIzquierda].extend(parteDerecha)  # Extender la lista de producciones
+                else:
+                    reglasGramaticales[parteIzquierda] = parteDerecha  # Crear una nueva entrada en el diccionario
+    return reglasGramaticales  # Retornar el diccionario con las reglas gramaticales
+
+# Función para cargar una gramática en cualquiera de los dos formatos de archivo
+def cargarGramatica(archivo):
+    # Los archivos con encabezados Vt:/Vxt:/S:/P: se leen con leerGramatica; los de reglas con '|'
+    # (como pruebas.txt) se leen con interpretarGramatica y el símbolo inicial es el de la primera regla
+    with open(archivo, 'r') as f:
+        conEncabezados = any(linea.strip().startswith('Vt:') for linea in f)  # Detecta el formato del archivo
+    if conEncabezados:
+        Vt, Vxt, S, P = leerGramatica(archivo)
+    else:
+        reglas = interpretarGramatica(archivo)
+        if not reglas:
+            raise ValueError("La gramática no está completa o el formato es incorrecto.")
+        Vxt = set(reglas)  # Los no terminales son los lados izquierdos
+        S = next(iter(reglas))  # La primera regla define el símbolo inicial
+        P = [(izq, produccion.split()) for izq, producciones in reglas.items() for produccion in producciones]
+        Vt = {s for _, der in P for s in der if s not in Vxt and s != 'ε'}  # El resto de símbolos son terminales
+    validarGramatica(Vt, Vxt, S, P)  # Verifica la consistencia de la gramática
+    return Vt, Vxt, S, P  # Retorna los componentes de la gramática
@@ -0,0 +1,51 @@
+# Analizador léxico compartido por los tres analizadores.
+# Compila el conjunto de terminales Vt en una sola expresión regular con un grupo por terminal,
+# ordenados de más largo a más corto para que gane la coincidencia más larga, y produce tokens
+# (tipo, inicio, fin): el tipo es el mismo objeto del terminal en Vt y las posiciones apuntan al texto
+# original, así que no se copia ningún fragmento de la entrada.
+
+import re  # Expresión regular combinada
+from functools import lru_cache  # Un léxico compilado por conjunto de terminales
+
+
+class ErrorLexico(ValueError):
+    # Error que se lanza cuando un carácter no inicia ningún terminal; guarda su posición en el texto.
+    def __init__(self, posicion, caracter):
+        self.posicion = posicion  # Posición del carácter inesperado
+        super().__init__(f"Carácter inesperado '{caracter}' en la posición {posicion}.")
+
+
+class Lexico:
+    # Léxico de coincidencia más larga para un conjunto de terminales literales; los espacios separan tokens.
+    __slots__ = ('terminales', 'patron')
+
+    def __init__(self, Vt):
+        self.terminales = sorted(Vt, key=lambda t: (-len(t), t))  # Primero los más largos
+        alternativas = ''.join(f'({re.escape(t)})|' for t in self.terminales)  # Un grupo por terminal
+        self.patron = re.compile(alternativas + r'(\s+)|(.)', re.DOTALL)  # Luego espacios y cualquier otro carácter
+        # Grupo len + 1: espacios (se saltan); grupo len + 2: carácter inválido
+
+    def tokenizar(self, texto, inicio=0):
+        # Generador de tokens (tipo, inicio, fin) desde la posición inicio del texto.
+        terminales = self.terminales
+        espacios = len(terminales) + 1  # Número del grupo de espacios
+        for m in self.patron.finditer(texto, inicio):
+            grupo = m.lastindex
+            if grupo <= len(terminales):
+                yield terminales[grupo - 1], m.start(), m.end()
+            elif grupo != espacios:
+                raise ErrorLexico(m.start(), m.group())  # Ningún terminal empieza aquí
+
+    def tipos(self, texto):
+        # Función para obtener solo la lista de tipos de token, que es lo que consumen los analizadores.
+        return [tipo for tipo, _, _ in self.tokenizar(texto)]
+
+
+@lru_cache(maxsize=32)
+def _lexicoCongelado(terminales):
+    return Lexico(terminales)
+
+
+def obtenerLexico(Vt):
+    # Función para obtener el léxico de un conjunto de terminales, compilándolo solo la primera vez.
+    return _lexicoCongelado(frozenset(Vt))
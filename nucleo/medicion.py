@@ -0,0 +1,162 @@
+# Instrumentación opcional de los analizadores: por cada análisis registra las expansiones de cada
+# no terminal, los retrocesos de cada producción, la profundidad máxima (comparada con el límite de
+# recursión de Python), los tokens consumidos y el tiempo. Los analizadores reciben medidor=None por
+# omisión y en ese caso solo comprueban una condición por expansión.
+# Las mediciones terminadas se entregan a uno o más sumideros: en memoria, JSON por líneas o cProfile.
+# Cada sumidero tiene iniciar() antes del análisis, detener() apenas termina (antes de que cualquier
+# sumidero registre nada, así el perfil no incluye la escritura de JSON), registrar(medicion) y cerrar().
+
+import sys  # Límite de recursión del intérprete
+import time  # Reloj de alta resolución
+
+
+class Medicion:
+    # Contadores de un análisis. Las claves de retrocesos son producciones escritas como 'A -> α'.
+    __slots__ = ('motor', 'etiqueta', 'tokens', 'expansiones', 'retrocesos', 'profundidadMaxima',
+                 'limiteRecursion', 'consumidos', 'extras', 'valido', 'segundos', 'inicio')
+
+    def __init__(self, motor, tokens, etiqueta=None):
+        self.motor = motor  # Analizador que se midió
+        self.etiqueta = etiqueta  # Dato del llamador para reconocer el análisis (por ejemplo el número de línea)
+        self.tokens = len(tokens)  # Tokens de la entrada
+        self.expansiones = {}  # No terminal -> veces que se aplicó alguna de sus producciones
+        self.retrocesos = {}  # Producción -> veces que falló y se descartó
+        self.profundidadMaxima = 0  # Mayor anidamiento de llamadas (o de la pila explícita)
+        self.limiteRecursion = sys.getrecursionlimit()
+        self.consumidos = 0  # Tokens reconocidos (el avance más lejano si la cadena no es válida)
+        self.extras = {}  # Contadores propios de cada analizador
+        self.valido = None  # None si el análisis terminó con una excepción
+        self.segundos = 0.0
+        self.inicio = time.perf_counter()
+
+    def aDiccionario(self):
+        # Función para obtener la medición como diccionario listo para JSON.
+        return {'motor': self.motor, 'etiqueta': self.etiqueta, 'valido': self.valido, 'tokens': self.tokens,
+                'consumidos': self.consumidos, 'segundos': self.segundos, 'profundidadMaxima': self.profundidadMaxima,
+                'limiteRecursion': self.limiteRecursion, 'expansiones': self.expansiones,
+                'retrocesos': self.retrocesos, **self.extras}
+
+
+class Medidor:
+    # Lo que reciben los analizadores: crea una Medicion por análisis y la entrega a los sumideros.
+    # etiqueta se copia en cada medición nueva; el llamador la cambia entre análisis si le sirve.
+    def __init__(self, *sumideros):
+        self.sumideros = list(sumideros)
+        self.etiqueta = None
+
+    def iniciar(self, motor, tokens):
+        # Función para empezar a medir un análisis; retorna la Medicion que el analizador va llenando.
+        for sumidero in self.sumideros:
+            sumidero.iniciar()
+        return Medicion(motor, tokens, self.etiqueta)  # El reloj empieza después de preparar los sumideros
+
+    def terminar(self, medicion, valido):
+        # Función para cerrar la medición y entregarla a los sumideros.
+        medicion.segundos = time.perf_counter() - medicion.inicio
+        for sumidero in self.sumideros:
+            sumidero.detener()  # Todos dejan de medir antes de que el primero registre
+        medicion.valido = valido
+        for sumidero in self.sumideros:
+            sumidero.registrar(medicion)
+
+    def cerrar(self):
+        # Función para cerrar los sumideros que tienen archivos abiertos.
+        for sumidero in self.sumideros:
+            sumidero.cerrar()
+
+
+def contar(contadores, clave):
+    # Función para sumar uno al contador de clave.
+    contadores[clave] = contadores.get(clave, 0) + 1
+
+
+def nombreProduccion(izq, der):
+    # Función para escribir una producción como clave de los contadores.
+    return f"{izq} -> {' '.join(der)}"
+
+
+class SumideroMemoria:
+    # Guarda las mediciones en una lista y las resume.
+    def __init__(self):
+        self.mediciones = []
+
+    def iniciar(self):
+        pass
+
+    def detener(self):
+        pass
+
+    def registrar(self, medicion):
+        self.mediciones.append(medicion)
+
+    def cerrar(self):
+        pass
+
+    def resumen(self, cantidad=10):
+        # Función para sumar todas las mediciones; retorna un diccionario con los no terminales más
+        # expandidos y las producciones con más retrocesos primero.
+        expansiones, retrocesos = {}, {}
+        for medicion in self.mediciones:
+            for clave, valor in medicion.expansiones.items():
+                expansiones[clave] = expansiones.get(clave, 0) + valor
+            for clave, valor in medicion.retrocesos.items():
+                retrocesos[clave] = retrocesos.get(clave, 0) + valor
+        mayores = lambda contadores: sorted(contadores.items(), key=lambda par: -par[1])[:cantidad]
+        return {'analisis': len(self.mediciones),
+                'segundos': sum(medicion.segundos for medicion in self.mediciones),
+                'profundidadMaxima': max((medicion.profundidadMaxima for medicion in self.mediciones), default=0),
+                'limiteRecursion': sys.getrecursionlimit(),
+                'expansiones': mayores(expansiones), 'retrocesos': mayores(retrocesos)}
+
+
+class SumideroJSON:
+    # Escribe una línea JSON por análisis en un archivo (ruta, que se abre para agregar, o archivo abierto).
+    def __init__(self, archivo):
+        import json  # Solo se carga si se escribe JSON
+        self.json = json
+        self.propio = isinstance(archivo, str)  # Solo se cierra el archivo que abrió el sumidero
+        self.archivo = open(archivo, 'a', encoding='utf-8') if self.propio else archivo
+
+    def iniciar(self):
+        pass
+
+    def detener(self):
+        pass
+
+    def registrar(self, medicion):
+        self.archivo.write(self.json.dumps(medicion.aDiccionario(), ensure_ascii=False) + '\n')
+
+    def cerrar(self):
+        if self.propio:
+            self.archivo.close()
+
+
+class SumideroPerfil:
+    # Perfila con cProfile solo el tiempo dentro de los análisis; el resultado se lee con pstats o se
+    # guarda con guardar() en el formato de 'python -m cProfile -o'.
+    def __init__(self, archivo=None):
+        import cProfile  # Solo se carga si se perfila
+        self.perfil = cProfile.Profile()
+        self.archivo = archivo  # Ruta donde cerrar() guarda el perfil, si se da
+
+    def iniciar(self):
+        self.perfil.enable()
+
+    def detener(self):
+        self.perfil.disable()
+
+    def registrar(self, medicion):
+        pass
+
+    def estadisticas(self):
+        # Función para obtener el perfil acumulado como pstats.Stats.
+        import pstats
+        return pstats.Stats(self.perfil)
+
+    def guardar(self, archivo):
+        # Función para escribir el perfil en un archivo que leen pstats, snakeviz y otras herramientas.
+        self.perfil.dump_stats(archivo)
+
+    def cerrar(self):
+        if self.archivo is not None:
+            self.guardar(self.archivo)
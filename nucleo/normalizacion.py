@@ -0,0 +1,500 @@
+# Normalización de gramáticas al cargarlas: elimina la recursión por la izquierda (directa e indirecta),
+# factoriza prefijos comunes y, si se pide, quita símbolos inútiles, producciones unitarias y producciones ε
+# o convierte a la forma normal de Chomsky (FNC).
+# Cada etapa guarda, para cada producción nueva, una plantilla que indica cómo rehacer el subárbol de la
+# etapa anterior; aplicando las etapas al revés, un árbol de la gramática normalizada se reporta en
+# términos de las producciones originales del usuario.
+#
+# Los árboles son tuplas (simbolo, hijos), las mismas del analizador packrat. Las plantillas son tuplas:
+#   ('hijo', i)                 valor del hijo i (un subárbol de la etapa anterior, o nada si era una cola)
+#   ('nodo', A, partes)         nodo A cuyos hijos son los valores de las partes, concatenados
+#   ('constante', arboles)      subárboles fijos (las derivaciones vacías que se quitaron)
+#   ('izquierda',)              lo acumulado a la izquierda de una cola de recursión eliminada
+#   ('aplicarCola', i, parte)   la parte pasa por la cadena de colas que empieza en el hijo i
+#   ('cola', parte, i)          eslabón de una cola: nuevo acumulado y posición del eslabón siguiente
+#   ('colaFin',)                fin de la cadena de colas
+#   ('delegar', k)              los hijos del hijo k (un auxiliar) se suman a los primeros k y decide su plantilla
+# Una producción sin plantilla se copia tal cual (identidad).
+
+from .analizadorLL1 import EPSILON, calcularAnulables  # Símbolo vacío y no terminales anulables
+from .arbolCompacto import ArbolCompacto  # Árboles que también se pueden reportar en la gramática original
+
+VACIO = (EPSILON,)  # Lado derecho de una producción ε
+OPCIONES = ('inutiles', 'epsilon', 'unitarias', 'recursionIzquierda', 'factorizar', 'fnc')  # Parámetros de normalizarGramatica
+HOJA_VACIA = (EPSILON, ())  # Hoja ε de un árbol
+
+
+class Etapa:
+    # Una transformación ya hecha: plantillas de las producciones nuevas y los auxiliares que solo tienen
+    # sentido dentro de su padre (colas y prefijos factorizados), que por eso no se evalúan solos.
+    __slots__ = ('nombre', 'plantillas', 'dependientes', 'conPlantilla')
+
+    def __init__(self, nombre, plantillas, dependientes=()):
+        self.nombre = nombre  # Nombre de la transformación, para reportes
+        self.plantillas = plantillas  # (izquierda, derecha) -> plantilla
+        self.dependientes = frozenset(dependientes)
+        self.conPlantilla = frozenset(izq for izq, _ in plantillas)  # Los demás no terminales se copian directo
+
+    def plantilla(self, nodo):
+        # Función para obtener la plantilla de la producción usada en un nodo, o None si es la identidad.
+        simbolo, hijos = nodo
+        return self.plantillas.get((simbolo, tuple(hijo[0] for hijo in hijos)))
+
+    def evaluar(self, expresion, hijos, valores, izquierda=()):
+        # Función para calcular la tupla de subárboles de la etapa anterior que describe la expresión.
+        while expresion[0] == 'delegar':  # El auxiliar recibe los hijos ya vistos y continúa con los suyos
+            k = expresion[1]
+            delegado = hijos[k]
+            hijos = hijos[:k] + list(delegado[1])
+            expresion = self.plantilla(delegado)
+        tipo = expresion[0]
+        if tipo == 'hijo':
+            hijo = hijos[expresion[1]]
+            return valores[id(hijo)] if hijo[1] else (hijo,)  # Las hojas se copian
+        if tipo == 'nodo':
+            partes = tuple(arbol for parte in expresion[2] for arbol in self.evaluar(parte, hijos, valores, izquierda))
+            return ((expresion[1], partes),)
+        if tipo == 'constante':
+            return expresion[1]
+        if tipo == 'izquierda':
+            return izquierda
+        # 'aplicarCola': se recorre la cadena de colas de forma iterativa, sin importar su largo
+        acumulado = self.evaluar(expresion[2], hijos, valores, izquierda)
+        cola = hijos[expresion[1]]
+        while True:
+            eslabon = self.plantilla(cola)
+            if eslabon[0] == 'colaFin':
+                return acumulado
+            acumulado = self.evaluar(eslabon[1], list(cola[1]), valores, acumulado)
+            cola = cola[1][eslabon[2]]
+
+    def reconstruir(self, arbol):
+        # Función para convertir un árbol de esta etapa en el árbol equivalente de la etapa anterior.
+        valores = {}  # id(nodo) -> tupla de subárboles de la etapa anterior
+        hechos, expandidos = set(), set()  # Nodos ya evaluados (o saltados) y nodos con los hijos apilados
+        dependientes, conPlantilla = self.dependientes, self.conPlantilla
+        pila = [arbol] if arbol[1] else []  # Postorden con pila explícita; los subárboles compartidos se evalúan una vez
+        while pila:
+            nodo = pila[-1]
+            clave = id(nodo)
+            if clave in hechos:  # Subárbol compartido ya evaluado desde otro padre
+                pila.pop()
+                continue
+            simbolo, hijos = nodo
+            if clave not in expandidos:  # Primera visita: se apilan los hijos pendientes
+                expandidos.add(clave)
+                pila.extend(hijo for hijo in hijos if hijo[1] and id(hijo) not in hechos)
+                continue
+            pila.pop()  # Segunda visita: todos los hijos están evaluados
+            hechos.add(clave)
+            if simbolo in dependientes:  # Los dependientes los evalúa su padre
+                continue
+            plantilla = self.plantilla(nodo) if simbolo in conPlantilla else None
+            if plantilla is None:
+                valores[clave] = ((simbolo, tuple(a for hijo in hijos for a in (valores[id(hijo)] if hijo[1] else (hijo,)))),)
+            else:
+                valores[clave] = self.evaluar(plantilla, list(hijos), valores)
+        return valores[id(arbol)][0] if arbol[1] else arbol
+
+
+class GramaticaNormalizada:
+    # Gramática transformada junto con la original y las etapas para volver a ella.
+    __slots__ = ('Vt', 'Vxt', 'S', 'P', 'original', 'etapas')
+
+    def __init__(self, Vt, Vxt, S, P, original, etapas):
+        self.Vt, self.Vxt, self.S, self.P = Vt, Vxt, S, P  # Gramática sobre la que se analiza
+        self.original = original  # (Vt, Vxt, S, P) tal como se leyó
+        self.etapas = etapas  # Transformaciones aplicadas, en orden
+
+    def arbolOriginal(self, arbol):
+        # Función para reportar un árbol de la gramática normalizada con las producciones originales.
+        # Acepta tuplas (simbolo, hijos) o un ArbolCompacto y retorna el mismo tipo.
+        compacto = isinstance(arbol, ArbolCompacto)
+        tupla = arbol.aTuplas() if compacto else arbol
+        for etapa in reversed(self.etapas):
+            tupla = etapa.reconstruir(tupla)
+        if not compacto:
+            return tupla
+        resultado = ArbolCompacto(arbol.simbolos)  # Comparte la tabla de símbolos
+        resultado.agregarTuplas(tupla)
+        return resultado
+
+
+def identidad(izq, der):
+    # Función para escribir explícitamente la plantilla que copia la producción tal cual.
+    return ('nodo', izq, tuple(('hijo', i) for i in range(len(der))))
+
+
+def desplazar(expresion, desde, cantidad):
+    # Función para sumar cantidad a las posiciones de hijo mayores o iguales que desde.
+    tipo = expresion[0]
+    if tipo == 'hijo' or tipo == 'delegar':
+        return (tipo, expresion[1] + cantidad) if expresion[1] >= desde else expresion
+    if tipo == 'nodo':
+        return ('nodo', expresion[1], tuple(desplazar(parte, desde, cantidad) for parte in expresion[2]))
+    if tipo == 'aplicarCola':
+        i = expresion[1] + cantidad if expresion[1] >= desde else expresion[1]
+        return ('aplicarCola', i, desplazar(expresion[2], desde, cantidad))
+    return expresion  # 'constante' e 'izquierda' no dependen de los hijos
+
+
+def sustituir(expresion, i, reemplazo, largo):
+    # Función para poner reemplazo en lugar del hijo i, cuando ese hijo se expandió en largo símbolos.
+    # Las posiciones del reemplazo son relativas a i y las de los hijos siguientes se corren largo - 1.
+    tipo = expresion[0]
+    if tipo == 'hijo':
+        if expresion[1] == i:
+            return desplazar(reemplazo, 0, i)
+        return ('hijo', expresion[1] + largo - 1) if expresion[1] > i else expresion
+    if tipo == 'nodo':
+        return ('nodo', expresion[1], tuple(sustituir(parte, i, reemplazo, largo) for parte in expresion[2]))
+    if tipo == 'aplicarCola':  # La cola nunca es el hijo sustituido (es el último símbolo)
+        j = expresion[1] + largo - 1 if expresion[1] > i else expresion[1]
+        return ('aplicarCola', j, sustituir(expresion[2], i, reemplazo, largo))
+    return expresion
+
+
+def constanteVacia(plantilla):
+    # Función para evaluar de una vez la plantilla de una producción ε, cuyo único hijo es la hoja ε.
+    hoja = HOJA_VACIA
+    return ('constante', Etapa('', {}).evaluar(plantilla, [hoja], {id(hoja): (hoja,)}))
+
+
+def nuevoSimbolo(base, usados):
+    # Función para crear un no terminal nuevo a partir de base agregando apóstrofos hasta que no choque.
+    nombre = base
+    while nombre in usados:
+        nombre += "'"
+    usados.add(nombre)
+    return nombre
+
+
+def agrupar(P):
+    # Función para ordenar las producciones por lado izquierdo, conservando el orden del archivo.
+    porIzquierda = {}
+    for izq, der in P:
+        porIzquierda.setdefault(izq, []).append(tuple(der))
+    return porIzquierda
+
+
+def cerrarEtapa(nombre, producciones, dependientes=()):
+    # Función para convertir {A: [(derecha, plantilla)]} en la lista P y la etapa, sin guardar identidades.
+    P, plantillas = [], {}
+    for izq, lista in producciones.items():
+        for der, plantilla in lista:
+            P.append((izq, list(der)))
+            if plantilla is not None and (izq in dependientes or plantilla != identidad(izq, der)):
+                plantillas[(izq, der)] = plantilla
+    return P, Etapa(nombre, plantillas, dependientes)
+
+
+def eliminarInutiles(Vt, Vxt, S, P):
+    # Función para quitar los no terminales que no generan ninguna cadena o no se alcanzan desde S.
+    # No cambia la forma de los árboles, así que no agrega etapa. Los terminales se conservan para el léxico.
+    productivos = set()
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            if izq not in productivos and all(s == EPSILON or s in Vt or s in productivos for s in der):
+                productivos.add(izq)
+                cambio = True
+    if S not in productivos:
+        raise ValueError(f"La gramática no genera ninguna cadena desde '{S}'.")
+    P = [(izq, der) for izq, der in P if izq in productivos and all(s not in Vxt or s in productivos for s in der)]
+    alcanzables, pendientes = {S}, [S]
+    porIzquierda = agrupar(P)
+    while pendientes:
+        for der in porIzquierda.get(pendientes.pop(), ()):
+            for s in der:
+                if s in Vxt and s not in alcanzables:
+                    alcanzables.add(s)
+                    pendientes.append(s)
+    P = [(izq, der) for izq, der in P if izq in alcanzables]
+    return Vt, {A for A in Vxt if A in alcanzables}, S, P, None
+
+
+def eliminarEpsilon(Vt, Vxt, S, P):
+    # Función para quitar las producciones ε: cada lado derecho se repite sin cada combinación de anulables.
+    # Lo que se quita se reporta con una derivación vacía fija del símbolo.
+    anulables = calcularAnulables(Vxt, P)
+    if not anulables:
+        return Vt, Vxt, S, P, None
+    vacios = {}  # No terminal anulable -> un árbol que deriva la cadena vacía
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            if izq not in vacios and all(s == EPSILON or s in vacios for s in der):
+                vacios[izq] = (izq, tuple(HOJA_VACIA if s == EPSILON else vacios[s] for s in der))
+                cambio = True
+
+    usados = set(Vt) | set(Vxt)
+    producciones = {}  # No terminal -> [(derecha, plantilla)], sin repetidos
+    vistas = set()
+    nuevoInicial = S
+    if S in anulables and any(S in der for _, der in P):  # S debe seguir derivando ε sin aparecer a la derecha
+        nuevoInicial = nuevoSimbolo(S, usados)
+        producciones[nuevoInicial] = [((S,), ('hijo', 0)), (VACIO, ('constante', (vacios[S],)))]
+    elif S in anulables:
+        producciones[S] = [(VACIO, ('constante', (vacios[S],)))]
+        vistas.add((S, VACIO))
+    for izq, der in P:
+        if list(der) == [EPSILON]:
+            continue
+        posiciones = [i for i, s in enumerate(der) if s in anulables]
+        for mascara in range(1 << len(posiciones)):  # Cada combinación de anulables que se quitan
+            quitadas = {posiciones[b] for b in range(len(posiciones)) if mascara >> b & 1}
+            nueva = tuple(s for i, s in enumerate(der) if i not in quitadas)
+            if not nueva or (izq, nueva) in vistas:
+                continue
+            vistas.add((izq, nueva))
+            partes, j = [], 0
+            for i, s in enumerate(der):
+                if i in quitadas:
+                    partes.append(('constante', (vacios[s],)))
+                else:
+                    partes.append(('hijo', j))
+                    j += 1
+            producciones.setdefault(izq, []).append((nueva, ('nodo', izq, tuple(partes))))
+    P, etapa = cerrarEtapa('epsilon', producciones)
+    return Vt, Vxt | {nuevoInicial}, nuevoInicial, P, etapa
+
+
+def eliminarUnitarias(Vt, Vxt, S, P):
+    # Función para quitar las producciones A -> B: A hereda los lados derechos no unitarios de cada B
+    # que alcanza por una cadena unitaria, y la plantilla rehace esa cadena.
+    porIzquierda = agrupar(P)
+    if not any(len(der) == 1 and der[0] in Vxt for ders in porIzquierda.values() for der in ders):
+        return Vt, Vxt, S, P, None
+    producciones = {}
+    for A in porIzquierda:
+        cadenas = {A: ('hijo', 0)}  # B -> plantilla de A a partir del subárbol de B (hijo 0)
+        orden = [A]
+        for B in orden:  # Búsqueda en anchura por las producciones unitarias
+            for der in porIzquierda.get(B, ()):
+                if len(der) == 1 and der[0] in Vxt and der[0] not in cadenas:
+                    cadenas[der[0]] = sustituir(cadenas[B], 0, identidad(B, der), 1)
+                    orden.append(der[0])
+        lista, vistas = [], set()
+        for B in orden:
+            for der in porIzquierda.get(B, ()):
+                if (len(der) == 1 and der[0] in Vxt) or der in vistas:
+                    continue
+                vistas.add(der)
+                lista.append((der, sustituir(cadenas[B], 0, identidad(B, der), len(der))))
+        producciones[A] = lista
+    P, etapa = cerrarEtapa('unitarias', producciones)
+    return Vt, Vxt, S, P, etapa
+
+
+def alcancesIzquierda(Vxt, P):
+    # Función para calcular, por cada no terminal, los no terminales que pueden quedar al inicio de sus derivaciones.
+    anulables = calcularAnulables(Vxt, P)
+    esquinas = {A: set() for A in Vxt}
+    for izq, der in P:
+        for s in der:
+            if s in Vxt:
+                esquinas[izq].add(s)
+            if s not in anulables:
+                break
+    alcances = {}
+    for A in Vxt:
+        vistos, pendientes = set(), [A]
+        while pendientes:
+            for B in esquinas[pendientes.pop()]:
+                if B not in vistos:
+                    vistos.add(B)
+                    pendientes.append(B)
+        alcances[A] = vistos
+    return alcances
+
+
+def hayCicloUnitario(Vxt, P):
+    # Función para saber si alguna cadena de producciones unitarias vuelve a su inicio (A =>+ A).
+    unitarias = {}
+    for izq, der in P:
+        if len(der) == 1 and der[0] in Vxt:
+            unitarias.setdefault(izq, set()).add(der[0])
+    for A in unitarias:
+        vistos, pendientes = set(), [A]
+        while pendientes:
+            for B in unitarias.get(pendientes.pop(), ()):
+                if B == A:
+                    return True
+                if B not in vistos:
+                    vistos.add(B)
+                    pendientes.append(B)
+    return False
+
+
+def eliminarRecursionIzquierda(Vt, Vxt, S, P):
+    # Función para quitar la recursión por la izquierda con el algoritmo de Paull: en el orden de los
+    # no terminales se sustituyen los anteriores del mismo ciclo y la recursión directa A -> A α | β
+    # se reescribe como A -> β A', A' -> α A' | ε. Los árboles de A' se vuelven a plegar a la izquierda.
+    # Requiere una gramática sin ε ni ciclos unitarios en los ciclos izquierdos (normalizarGramatica lo asegura).
+    alcances = alcancesIzquierda(Vxt, P)
+    recursivos = {A for A in Vxt if A in alcances[A]}
+    if not recursivos:
+        return Vt, Vxt, S, P, None
+    porIzquierda = agrupar(P)
+    producciones = {A: [(der, identidad(A, der)) for der in ders] for A, ders in porIzquierda.items()}
+    orden = sorted(recursivos, key=lambda A: (A != S, list(porIzquierda).index(A)))  # S primero, luego el archivo
+    usados = set(Vt) | set(Vxt)
+    dependientes = set()
+    for i, Ai in enumerate(orden):
+        for Aj in orden[:i]:
+            if Ai not in alcances[Aj] or Aj not in alcances[Ai]:  # Solo se sustituye dentro del mismo ciclo
+                continue
+            lista = []
+            for der, plantilla in producciones[Ai]:
+                if der[0] != Aj:
+                    lista.append((der, plantilla))
+                    continue
+                for derJ, plantillaJ in producciones[Aj]:
+                    if derJ == VACIO:
+                        nueva = der[1:] or VACIO
+                        lista.append((nueva, sustituir(plantilla, 0, constanteVacia(plantillaJ), 0)))
+                    else:
+                        lista.append((derJ + der[1:], sustituir(plantilla, 0, plantillaJ, len(derJ))))
+            producciones[Ai] = lista
+
+        recursivas = [(der[1:], plantilla) for der, plantilla in producciones[Ai] if der[0] == Ai and len(der) > 1]
+        if not recursivas:
+            continue
+        base = [(der, plantilla) for der, plantilla in producciones[Ai] if der[0] != Ai]
+        cola = nuevoSimbolo(Ai, usados)
+        dependientes.add(cola)
+        lista = []
+        for der, plantilla in base:
+            if der == VACIO:  # Ai -> ε pasa a Ai -> Ai': la hoja ε desaparece
+                lista.append(((cola,), ('aplicarCola', 0, constanteVacia(plantilla))))
+            else:
+                lista.append((der + (cola,), ('aplicarCola', len(der), plantilla)))
+        producciones[Ai] = lista
+        producciones[cola] = [(alfa + (cola,), ('cola', sustituir(plantilla, 0, ('izquierda',), 0), len(alfa)))
+                              for alfa, plantilla in recursivas]
+        producciones[cola].append((VACIO, ('colaFin',)))
+    P, etapa = cerrarEtapa('recursionIzquierda', producciones, dependientes)
+    return Vt, Vxt | dependientes, S, P, etapa
+
+
+def factorizarIzquierda(Vt, Vxt, S, P):
+    # Función para factorizar por la izquierda: A -> α β1 | α β2 pasa a A -> α A', A' -> β1 | β2,
+    # con el prefijo común más largo y repitiendo sobre los nuevos auxiliares.
+    porIzquierda = agrupar(P)
+    producciones = {A: [(der, identidad(A, der)) for der in ders] for A, ders in porIzquierda.items()}
+    prefijo = {A: 0 for A in producciones}  # Hijos que el auxiliar recibe de sus ancestros
+    usados = set(Vt) | set(Vxt)
+    dependientes = set()
+    pendientes = list(producciones)
+    while pendientes:
+        A = pendientes.pop(0)
+        grupos = {}  # Primer símbolo -> producciones que empiezan con él, en orden
+        for der, plantilla in producciones[A]:
+            if der != VACIO:
+                grupos.setdefault(der[0], []).append((der, plantilla))
+        lista = []
+        for der, plantilla in producciones[A]:
+            grupo = grupos.get(der[0]) if der != VACIO else None
+            if not grupo or len(grupo) == 1:
+                lista.append((der, plantilla))
+                continue
+            if grupo[0][0] != der:  # El grupo ya se reemplazó en la posición de su primera producción
+                continue
+            k = 1
+            while all(len(d) > k and d[k] == grupo[0][0][k] for d, _ in grupo):
+                k += 1
+            auxiliar = nuevoSimbolo(A, usados)
+            dependientes.add(auxiliar)
+            prefijo[auxiliar] = prefijo[A] + k
+            producciones[auxiliar] = [(d[k:] or VACIO, p) for d, p in grupo]
+            lista.append((der[:k] + (auxiliar,), ('delegar', prefijo[A] + k)))
+            pendientes.append(auxiliar)
+        producciones[A] = lista
+    P, etapa = cerrarEtapa('factorizacion', producciones, dependientes)
+    if not dependientes:
+        return Vt, Vxt, S, P, None
+    return Vt, Vxt | dependientes, S, P, etapa
+
+
+def inicioNuevo(Vt, Vxt, S, P):
+    # Función para agregar S0 -> S cuando S aparece en algún lado derecho (primer paso de la FNC).
+    if not any(S in der for _, der in P):
+        return Vt, Vxt, S, P, None
+    inicial = nuevoSimbolo(S, set(Vt) | set(Vxt))
+    producciones = {inicial: [((S,), ('hijo', 0))]}
+    producciones.update((A, [(der, None) for der in ders]) for A, ders in agrupar(P).items())
+    P, etapa = cerrarEtapa('inicio', producciones)
+    return Vt, Vxt | {inicial}, inicial, P, etapa
+
+
+def convertirFNC(Vt, Vxt, S, P):
+    # Función para llevar a la FNC una gramática sin ε (salvo S -> ε), sin unitarias y sin inútiles:
+    # los terminales dentro de lados derechos largos pasan por auxiliares T -> a y los lados derechos
+    # de más de dos símbolos se parten en cadenas A -> X1 A', A' -> X2 A'', ...
+    usados = set(Vt) | set(Vxt)
+    envolturas = {}  # Terminal -> auxiliar que lo produce
+    producciones = {}
+    dependientes = set()
+    for izq, der in P:
+        der = tuple(der)
+        if len(der) < 2:  # A -> a y S -> ε ya están en FNC
+            producciones.setdefault(izq, []).append((der, None))
+            continue
+        simbolos = []
+        for s in der:
+            if s in Vt:
+                if s not in envolturas:
+                    envolturas[s] = nuevoSimbolo(f"T[{s}]", usados)
+                    producciones[envolturas[s]] = [((s,), ('hijo', 0))]  # Transparente: reporta solo la hoja
+                s = envolturas[s]
+            simbolos.append(s)
+        plantilla = identidad(izq, der)
+        actual = izq
+        for k in range(len(simbolos) - 2):
+            auxiliar = nuevoSimbolo(izq, usados)
+            dependientes.add(auxiliar)
+            producciones.setdefault(actual, []).append(((simbolos[k], auxiliar), ('delegar', k + 1)))
+            actual = auxiliar
+        producciones.setdefault(actual, []).append((tuple(simbolos[-2:]), plantilla))
+    P, etapa = cerrarEtapa('fnc', producciones, dependientes)
+    return Vt, Vxt | set(envolturas.values()) | dependientes, S, P, etapa
+
+
+def normalizarGramatica(Vt, Vxt, S, P, inutiles=False, epsilon=False, unitarias=False, recursionIzquierda=True,
+                        factorizar=True, fnc=False):
+    # Función para aplicar las transformaciones pedidas; retorna una GramaticaNormalizada.
+    # Si hay recursión por la izquierda oculta detrás de anulables o de ciclos unitarios se quitan antes
+    # las producciones ε y unitarias, porque Paull no termina con ellas. fnc incluye ε, unitarias e inútiles.
+    actual = (set(Vt), set(Vxt), S, [(izq, list(der)) for izq, der in P])
+    etapas = []
+
+    def aplicar(transformacion):
+        nonlocal actual
+        *actual, etapa = transformacion(*actual)
+        if etapa is not None:
+            etapas.append(etapa)
+
+    if fnc:
+        for transformacion in (inicioNuevo, eliminarEpsilon, eliminarUnitarias, eliminarInutiles, convertirFNC):
+            aplicar(transformacion)
+    else:
+        if inutiles:
+            aplicar(eliminarInutiles)
+        if epsilon:
+            aplicar(eliminarEpsilon)
+        if unitarias:
+            aplicar(eliminarUnitarias)
+        if recursionIzquierda:
+            Vxt_, P_ = actual[1], actual[3]
+            if any(A in alcance for A, alcance in alcancesIzquierda(Vxt_, P_).items()):
+                if calcularAnulables(Vxt_, P_):
+                    aplicar(eliminarEpsilon)
+                if hayCicloUnitario(actual[1], actual[3]):
+                    aplicar(eliminarUnitarias)
+            aplicar(eliminarRecursionIzquierda)
+        if factorizar:
+            aplicar(factorizarIzquierda)
+    Vt_, Vxt_, S_, P_ = actual
+    return GramaticaNormalizada(Vt_, Vxt_, S_, P_, (Vt, Vxt, S, P), etapas)
@@ -0,0 +1,294 @@
+# Sesión de análisis incremental para expresiones que se editan poco a poco (por ejemplo en un editor).
+# Guarda el árbol de la última versión de la cadena y, ante una edición, vuelve a analizar solo un
+# subárbol pequeño que contiene la zona dañada; el resto del árbol se reutiliza tal cual.
+#
+# Funciona con gramáticas LL(1), donde cada no terminal elige su producción con el token en el que empieza.
+# Un no terminal que contiene la zona editada y empieza antes de ella tomó todas sus decisiones dentro de sí
+# mismo; si empieza justo en ella, basta con que la tabla siga eligiendo lo mismo para los nodos de afuera
+# que miraban ese token. Si su nuevo análisis termina justo donde terminaba antes (desplazado por la edición),
+# el resto del árbol sigue siendo válido. Al reanalizarlo, pasada la zona editada, cada no terminal que el
+# árbol viejo ya tenía en la misma posición se reutiliza en lugar de analizarlo otra vez (su subárbol depende
+# solo de los tokens que le siguen, que no cambiaron), así que en una lista recursiva por la derecha como E'
+# se analiza la zona editada y no toda la cola de la lista.
+# Los candidatos se buscan subiendo desde la hoja del token editado; actualizar las longitudes de los ancestros
+# cuando cambia la cantidad de tokens sigue costando lo que mide el camino hasta la raíz, sin analizar nada.
+#
+# Los tokens también se recalculan por partes: el léxico vuelve a empezar unos caracteres antes de la edición
+# (un terminal largo pudo empezar antes y llegar hasta ella) y se detiene en cuanto un token nuevo empieza
+# después de la zona editada justo donde empezaba uno viejo; desde ahí la tokenización es la misma.
+
+from array import array  # Longitud en tokens de cada nodo
+from bisect import bisect_left  # Búsqueda de tokens por posición en el texto
+
+from .analizadorLL1 import FIN, derivarLL1  # Análisis LL(1) de un símbolo desde una posición
+from .arbolCompacto import NINGUNO, ArbolCompacto  # Árbol de derivación en arreglos paralelos
+from .lexico import ErrorLexico  # Carácter que no forma ningún terminal
+
+INTENTOS = 4  # Subárboles que se prueban antes de volver a analizar toda la cadena
+
+
+class SesionIncremental:
+    # Sesión con el texto actual, sus tokens, el árbol de derivación y la longitud en tokens de cada nodo.
+
+    def __init__(self, gramatica, texto=''):
+        # gramatica es una GramaticaCompilada (ver gramaticaCompilada.py) que debe ser LL(1).
+        if gramatica.tabla is None:
+            raise gramatica.errorLL1()  # Sin tabla LL(1) no se puede reanalizar por partes
+        self.gramatica = gramatica
+        self.texto = texto  # Texto completo de la expresión
+        self.alcance = max(map(len, gramatica.Vt), default=1)  # Largo del terminal más largo
+        self.reanalizados = 0  # Tokens que se volvieron a analizar en la última operación
+        self._analizarTodo()
+
+    def _analizarTodo(self):
+        # Función para separar y analizar la cadena completa y reconstruir el árbol.
+        g = self.gramatica
+        self.tokens, self.inicios = [], []  # Tipo y posición en el texto de cada token
+        try:
+            for tipo, inicio, _ in g.lexico.tokenizar(self.texto):
+                self.tokens.append(tipo)
+                self.inicios.append(inicio)
+        except ErrorLexico as e:
+            self.valida, self.posicionError = False, e.posicion  # Sin tokens no hay árbol
+            self.arbol, self.longitudes, self.hojas, self.vivos = ArbolCompacto(g.simbolos), array('i'), array('i'), 0
+            self.reanalizados = 0
+            return
+        self.arbol = ArbolCompacto(g.simbolos)  # La raíz siempre es el nodo 0
+        self.longitudes = array('i')  # Tokens que cubre cada nodo
+        self.hojas = array('i')  # Nodo de cada token, para ubicar una edición sin recorrer el árbol desde la raíz
+        valida, posicion, _ = derivarLL1(self.tokens, 0, g.S, g.tabla, g.Vt, self.arbol, self.longitudes,
+                                         None, None, self.hojas)
+        self.valida = valida and posicion == len(self.tokens)  # Debe consumir toda la cadena
+        self.posicionError = None if self.valida else self._posicionEnTexto(posicion)
+        self.vivos = len(self.arbol)  # Nodos que pertenecen al árbol (el resto es basura de reemplazos)
+        self.reanalizados = len(self.tokens)
+
+    def _posicionEnTexto(self, indiceToken):
+        # Función para convertir un índice de token en una posición de carácter del texto.
+        if indiceToken < len(self.inicios):
+            return self.inicios[indiceToken]
+        return len(self.texto)  # Error al final de la cadena
+
+    def editar(self, desplazamiento, eliminados, insertado):
+        # Función para aplicar una edición: borrar eliminados caracteres desde desplazamiento e insertar el texto dado.
+        # Retorna si la nueva cadena es válida; el árbol queda en self.arbol.
+        self.texto = self.texto[:desplazamiento] + insertado + self.texto[desplazamiento + eliminados:]
+        if not self.valida:
+            self._analizarTodo()  # No hay árbol que reutilizar
+            return self.valida
+        try:
+            a, b, delta = self._retokenizar(desplazamiento, eliminados, len(insertado))
+        except ErrorLexico:
+            self._analizarTodo()  # Registra el error léxico
+            return self.valida
+        if not self._reanalizarSubarbol(a, b, delta):
+            self._analizarTodo()  # Ningún subárbol pudo absorber la edición
+        return self.valida
+
+    def _retokenizar(self, desplazamiento, eliminados, insertados):
+        # Función para volver a separar solo los tokens que toca la edición (el texto ya está editado).
+        # Retorna (a, b, delta): los tokens viejos a..b-1 se reemplazaron y la cantidad de tokens cambió en delta.
+        tokens, inicios = self.tokens, self.inicios
+        corrimiento = insertados - eliminados  # Cambio de posición del texto posterior a la edición
+        finEdicion = desplazamiento + insertados  # Desde aquí el texto es el de antes, corrido
+        a = bisect_left(inicios, desplazamiento - self.alcance + 1)  # Primer token que pudo leer la zona editada
+        desde = inicios[a - 1] + len(tokens[a - 1]) if a else 0  # Fin del último token intacto
+        b, nuevos, nuevosInicios = len(tokens), [], []
+        for tipo, inicio, _ in self.gramatica.lexico.tokenizar(self.texto, desde):
+            if inicio >= finEdicion:
+                j = bisect_left(inicios, inicio - corrimiento, a)
+                if j < len(inicios) and inicios[j] == inicio - corrimiento:
+                    b = j  # Se reencontró la tokenización vieja
+                    break
+            nuevos.append(tipo)
+            nuevosInicios.append(inicio)
+        tokens[a:b] = nuevos
+        inicios[a:b] = nuevosInicios
+        resto = a + len(nuevos)
+        inicios[resto:] = [inicio + corrimiento for inicio in inicios[resto:]]  # Tokens corridos por la edición
+        return a, b, len(nuevos) - (b - a)
+
+    def _reanalizarSubarbol(self, a, b, delta):
+        # Función para reanalizar un subárbol que contiene los tokens viejos a..b-1 (empieza en a o antes y
+        # termina en b o después) y reemplazarlo; retorna False si ninguno de los candidatos lo logra.
+        arbol, longitudes, g = self.arbol, self.longitudes, self.gramatica
+        intentos = 0
+        for nodo, inicio, fuera in self._candidatos(a, b):
+            if fuera and not self._mismasDecisiones(fuera, a):
+                continue  # El token nuevo cambia una decisión fuera del subárbol
+            intentos += 1
+            if intentos > INTENTOS:
+                break
+            fin = inicio + longitudes[nodo]  # Fin del subárbol antes de la edición
+            marca = len(arbol)
+            injertos = []  # (nodo nuevo, nodo viejo) intercambiados al reutilizar subárboles viejos
+            hojas = array('i')  # Nodos de los tokens del subárbol nuevo
+            reutilizar = self._reutilizador(nodo, inicio, b, delta, injertos, hojas)
+            valido, posicion, nuevo = derivarLL1(self.tokens, inicio, arbol.etiqueta(nodo), g.tabla, g.Vt,
+                                                 arbol, longitudes, None, reutilizar, hojas)
+            if valido and posicion == fin + delta:  # Absorbe la edición y termina donde debe
+                for nuevoNodo, viejo in injertos:
+                    if viejo == nodo:
+                        nodo = nuevoNodo  # El subárbol viejo quedó dentro del nuevo; su lugar lo ocupa el nodo intercambiado
+                descartados = self._contarNodos(nodo)  # Los subárboles reutilizados ya no cuelgan de él
+                if nodo == 0:
+                    self._ponerEnRaiz(nuevo)  # La raíz sigue siendo el nodo 0
+                else:
+                    arbol.reemplazar(nodo, nuevo)  # El resto del árbol se conserva
+                self.hojas[inicio:fin] = hojas
+                if delta:
+                    padre = arbol.padre[nuevo]
+                    while padre != NINGUNO:
+                        longitudes[padre] += delta  # Los ancestros cambian de longitud
+                        padre = arbol.padre[padre]
+                self.vivos += len(arbol) - marca - descartados
+                self.reanalizados = posicion - inicio - sum(longitudes[viejo] for _, viejo in injertos)
+                if len(arbol) > 2 * self.vivos:
+                    self._compactar()  # La basura supera a los nodos vivos
+                return True
+            for nuevoNodo, viejo in reversed(injertos):
+                arbol.intercambiar(nuevoNodo, viejo)  # Devuelve los subárboles viejos a su lugar
+            arbol.truncar(marca)  # Descarta el intento fallido
+            del longitudes[marca:]
+        return False
+
+    def _ponerEnRaiz(self, nuevo):
+        # Función para que la raíz (nodo 0) tome los hijos y la longitud de la raíz reanalizada nuevo.
+        arbol = self.arbol
+        arbol.primerHijo[0], arbol.ultimoHijo[0] = arbol.primerHijo[nuevo], arbol.ultimoHijo[nuevo]
+        for hijo in arbol.hijos(0):
+            arbol.padre[hijo] = 0
+        arbol.primerHijo[nuevo] = arbol.ultimoHijo[nuevo] = NINGUNO
+        self.longitudes[0] = self.longitudes[nuevo]
+
+    def _candidatos(self, a, b):
+        # Función para listar los subárboles que se pueden reanalizar, como (nodo, inicio, nodos de afuera que
+        # miraban el token a). Se sube desde la hoja del token a; si la edición solo inserta entre dos tokens,
+        # también desde la del anterior, y se prueban primero los nodos que no son ancestros comunes.
+        derecha = self._subir(self.hojas[a], a, a, b) if a < len(self.hojas) else []
+        if a < b or a == 0:
+            return derecha
+        izquierda = self._subir(self.hojas[a - 1], a - 1, a, b)
+        comunes = {nodo for nodo, _, _ in derecha} & {nodo for nodo, _, _ in izquierda}
+        return ([c for c in izquierda if c[0] not in comunes] + [c for c in derecha if c[0] not in comunes] +
+                [c for c in izquierda if c[0] in comunes])
+
+    def _subir(self, hoja, desde, a, b):
+        # Función para listar de abajo hacia arriba los no terminales (hasta la raíz) que contienen la hoja, que
+        # empieza en el token desde, y que terminan en b o después. Los que empiezan en a llevan los nodos de
+        # afuera que eligieron su producción mirando ese token: sus ancestros que también empiezan en a y los
+        # no terminales vacíos de los hermanos anteriores. Se sube hasta reunir INTENTOS nodos que empiezan antes de a.
+        arbol, longitudes = self.arbol, self.longitudes
+        padres, primerHijo, siguienteHermano = arbol.padre, arbol.primerHijo, arbol.siguienteHermano
+        camino, enA = [], []  # (nodo, inicio, cantidad de enA antes de subir desde él); nodos que miraban el token a
+        nodo, antes = hoja, 0
+        while padres[nodo] != NINGUNO and antes < INTENTOS:
+            padre = padres[nodo]
+            hermanos, hijo = [], primerHijo[padre]
+            while hijo != nodo:  # Hermanos anteriores
+                hermanos.append(hijo)
+                hijo = siguienteHermano[hijo]
+            for hermano in reversed(hermanos):
+                desde -= longitudes[hermano]
+                if desde + longitudes[hermano] == a:
+                    enA.extend(self._nodosEn(hermano, desde, a))  # Terminó leyendo el token a
+            nodo = padre
+            if padres[nodo] == NINGUNO:
+                camino.append((nodo, desde, len(enA)))  # La raíz contiene todo y no deja nada afuera
+                break
+            if desde == a:
+                enA.append(nodo)  # Ancestro que empieza en a de los candidatos que están debajo
+            if desde + longitudes[nodo] >= b:
+                camino.append((nodo, desde, len(enA)))  # Lo que se agregue desde aquí queda fuera de él
+                antes += desde < a
+        return [(nodo, desde, enA[cantidad:] if desde == a else None) for nodo, desde, cantidad in camino]
+
+    def _nodosEn(self, nodo, inicio, a):
+        # Función para obtener los no terminales de un subárbol que termina en el token a y que empiezan en a
+        # (los vacíos del final, que se eligieron mirando el token a).
+        arbol, longitudes = self.arbol, self.longitudes
+        encontrados, pila = [], [(nodo, inicio)]
+        while pila:
+            actual, desde = pila.pop()
+            if desde == a and arbol.primerHijo[actual] != NINGUNO:
+                encontrados.append(actual)
+            for hijo in arbol.hijos(actual):
+                hasta = desde + longitudes[hijo]
+                if hasta == a:
+                    pila.append((hijo, desde))
+                desde = hasta
+        return encontrados
+
+    def _mismasDecisiones(self, nodos, a):
+        # Función para saber si la tabla elige, con el token que ahora está en a, las mismas producciones que
+        # usaron los nodos dados.
+        arbol, tabla = self.arbol, self.gramatica.tabla
+        actual = self.tokens[a] if a < len(self.tokens) else FIN
+        for nodo in nodos:
+            usada = [arbol.etiqueta(hijo) for hijo in arbol.hijos(nodo)]
+            if tabla.get((arbol.etiqueta(nodo), actual)) != usada:
+                return False
+        return True
+
+    def _reutilizador(self, raiz, inicio, b, delta, injertos, hojas):
+        # Función para crear reutilizar(simbolo, nodo, posicion) para derivarLL1 al reanalizar el subárbol raiz.
+        # Desde el token b los tokens son los de antes, corridos en delta, y en LL(1) el subárbol de un símbolo
+        # depende solo de los tokens que le siguen: si el árbol viejo tiene ese símbolo en la posición
+        # correspondiente, su subárbol se intercambia con el nodo nuevo en lugar de volver a analizarlo.
+        arbol, longitudes = self.arbol, self.longitudes
+        primerHijo, siguienteHermano = arbol.primerHijo, arbol.siguienteHermano
+        camino = [(raiz, inicio)]  # Nodos viejos que contienen la última posición consultada (crece en orden)
+
+        def reutilizar(simbolo, nodo, posicion):
+            p = posicion - delta  # Posición en el árbol viejo
+            if p < b or arbol.padre[nodo] == NINGUNO:
+                return 0  # Todavía dentro de la zona editada, o es la raíz del reanálisis
+            while camino and camino[-1][1] + longitudes[camino[-1][0]] <= p:
+                camino.pop()  # Las consultas avanzan: los nodos que terminan antes ya no sirven
+            codigo = arbol.simbolos.internar(simbolo)
+            while camino:
+                actual, desde = camino[-1]
+                if desde == p and arbol.simbolo[actual] == codigo and longitudes[actual] and actual != 0:
+                    injertos.append((nodo, actual))
+                    arbol.intercambiar(nodo, actual)
+                    longitudes[nodo] = longitudes[actual]  # Las próximas consultas pasan por su lugar en el árbol viejo
+                    camino.pop()
+                    hojas.extend(self.hojas[p:p + longitudes[actual]])  # Sus tokens conservan sus nodos
+                    return longitudes[actual]
+                hijo = primerHijo[actual]  # Baja al hijo que contiene p
+                while hijo != NINGUNO and desde + longitudes[hijo] <= p:
+                    desde += longitudes[hijo]
+                    hijo = siguienteHermano[hijo]
+                if hijo == NINGUNO or desde > p or primerHijo[hijo] == NINGUNO:
+                    return 0
+                camino.append((hijo, desde))
+            return 0
+        return reutilizar
+
+    def _contarNodos(self, nodo):
+        # Función para contar los nodos de un subárbol.
+        total, pila = 0, [nodo]
+        while pila:
+            actual = pila.pop()
+            total += 1
+            pila.extend(self.arbol.hijos(actual))
+        return total
+
+    def _compactar(self):
+        # Función para copiar solo los nodos vivos a un árbol nuevo (costo amortizado por los reemplazos previos).
+        viejo, longitudes = self.arbol, self.longitudes
+        self.arbol = ArbolCompacto(viejo.simbolos)
+        self.longitudes = array('i')
+        self.hojas = array('i')
+        Vt = self.gramatica.Vt
+        pila = [(0, NINGUNO)]  # Preorden de izquierda a derecha desde la raíz: las hojas salen en el orden de los tokens
+        while pila:
+            nodo, padre = pila.pop()
+            simbolo = viejo.etiqueta(nodo)
+            copia = self.arbol.agregarNodo(simbolo, padre)
+            self.longitudes.append(longitudes[nodo])
+            if simbolo in Vt:
+                self.hojas.append(copia)
+            for hijo in reversed(list(viejo.hijos(nodo))):
+                pila.append((hijo, copia))
+        self.vivos = len(self.arbol)
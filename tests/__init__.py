@@ -0,0 +1 @@
+# Pruebas del núcleo de análisis. Se ejecutan desde la raíz del repositorio con: python -m pytest -q
@@ -0,0 +1,127 @@
+# Utilidades compartidas por las pruebas: gramáticas del repositorio, gramáticas y cadenas aleatorias,
+# un reconocedor de referencia por fuerza bruta y la verificación de árboles de derivación.
+
+import os  # Ubicación de los archivos de gramática del repositorio
+
+from nucleo.analizadorLL1 import EPSILON  # Símbolo vacío
+from nucleo.lectorGramatica import cargarGramatica  # Lectura de los archivos de gramática (ambos formatos)
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Raíz del repositorio
+
+
+def gramaticaRepositorio(nombre):
+    # Función para leer una de las gramáticas incluidas en el repositorio; retorna (Vt, Vxt, S, P).
+    return cargarGramatica(os.path.join(RAIZ, nombre))
+
+
+def gramaticaTexto(Vt, S, texto):
+    # Función para armar una gramática a partir de producciones 'A -> x y | z' separadas por ';'.
+    P = []
+    for regla in texto.split(';'):
+        izquierda, derecha = regla.split('->')
+        for alternativa in derecha.split('|'):
+            P.append((izquierda.strip(), alternativa.split()))
+    return set(Vt), {izq for izq, _ in P}, S, P
+
+
+def reglasPackrat(P):
+    # Función para convertir P al formato de reglas del analizador packrat (lados derechos como texto).
+    reglas = {}
+    for izq, der in P:
+        reglas.setdefault(izq, []).append(' '.join(der))
+    return reglas
+
+
+def reconocer(tokens, Vxt, S, P):
+    # Función de referencia: la cadena es válida si S deriva el tramo completo.
+    return (S, 0, len(tokens)) in tramosDerivables(tokens, Vxt, P)
+
+
+def tramosDerivables(tokens, Vxt, P):
+    # Función para calcular por punto fijo qué tramos de tokens deriva cada no terminal; retorna {(A, inicio, fin)}.
+    # Es cúbica o peor, pero no depende de ninguno de los analizadores que se prueban.
+    n = len(tokens)
+    deriva = set()  # (no terminal, inicio, fin)
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in P:
+            for inicio in range(n + 1):
+                fines = {inicio}  # Posiciones alcanzables después de cada prefijo del lado derecho
+                for s in der:
+                    if s == EPSILON:
+                        continue
+                    if s in Vxt:
+                        fines = {fin for medio in fines for fin in range(medio, n + 1) if (s, medio, fin) in deriva}
+                    else:
+                        fines = {medio + 1 for medio in fines if medio < n and tokens[medio] == s}
+                for fin in fines:
+                    if (izq, inicio, fin) not in deriva:
+                        deriva.add((izq, inicio, fin))
+                        cambio = True
+    return deriva
+
+
+def hojasDerivacion(arbol, Vxt, P):
+    # Función para verificar que cada nodo interno use una producción de P; retorna los terminales del árbol.
+    producciones = {(izq, tuple(der)) for izq, der in P}
+    hojas, pila = [], [arbol]
+    while pila:
+        simbolo, hijos = pila.pop()
+        if simbolo in Vxt:
+            usada = (simbolo, tuple(hijo[0] for hijo in hijos))
+            assert usada in producciones, f"Producción inexistente {usada}"
+        elif simbolo != EPSILON:
+            assert not hijos, f"El terminal {simbolo} tiene hijos"
+            hojas.append(simbolo)
+        pila.extend(reversed(hijos))
+    return hojas
+
+
+def generarCadena(Vxt, S, P, aleatorio, profundidad=8):
+    # Función para derivar una cadena al azar desde S; pasada la profundidad se prefieren las producciones
+    # con menos no terminales para que termine.
+    porIzquierda = {}
+    for izq, der in P:
+        porIzquierda.setdefault(izq, []).append(der)
+    tokens, pila = [], [(S, 0)]
+    while pila:
+        simbolo, nivel = pila.pop()
+        if simbolo == EPSILON:
+            continue
+        if simbolo not in Vxt:
+            tokens.append(simbolo)
+            continue
+        opciones = porIzquierda[simbolo]
+        if nivel > profundidad:
+            menor = min(sum(s in Vxt for s in der) for der in opciones)
+            opciones = [der for der in opciones if sum(s in Vxt for s in der) == menor]
+        pila.extend((s, nivel + 1) for s in reversed(aleatorio.choice(opciones)))
+        if len(tokens) + len(pila) > 60:  # Gramáticas sin salida corta: se corta la cadena
+            return None
+    return tokens
+
+
+def gramaticaAleatoria(aleatorio):
+    # Función para crear una gramática pequeña con recursión izquierda, ε, unitarias y ambigüedad posibles.
+    # Todos sus no terminales generan alguna cadena.
+    Vt, Vxt = ['a', 'b', 'c'], ['S', 'A', 'B']
+    simbolos = Vt + Vxt
+    P = []
+    for A in Vxt:
+        P.append((A, [aleatorio.choice(Vt)]))  # Garantiza que A sea productivo
+        for _ in range(aleatorio.randint(1, 3)):
+            largo = aleatorio.choice([0, 1, 1, 2, 2, 3])
+            der = [aleatorio.choice(simbolos) for _ in range(largo)] or [EPSILON]
+            if (A, der) not in P:
+                P.append((A, der))
+    return set(Vt), set(Vxt), 'S', P
+
+
+def cadenasPrueba(Vt, Vxt, S, P, aleatorio, cantidad=12):
+    # Función para mezclar cadenas generadas por la gramática con cadenas al azar que quizá no lo sean.
+    cadenas = [generarCadena(Vxt, S, P, aleatorio) for _ in range(cantidad)]
+    cadenas = [c for c in cadenas if c is not None and len(c) <= 8]
+    cadenas += [[aleatorio.choice(sorted(Vt)) for _ in range(aleatorio.randint(0, 5))] for _ in range(cantidad)]
+    return cadenas
+
@@ -0,0 +1,170 @@
+# Pruebas del conteo y la enumeración de derivaciones: total() y los árboles de Derivaciones coinciden con
+# una enumeración por fuerza bruta de los árboles de la cadena, y los ciclos A =>+ A dan INFINITO.
+
+import itertools  # Producto de los subárboles de cada símbolo
+import math  # Números de Catalan exactos
+import random  # Gramáticas y cadenas aleatorias reproducibles
+
+import pytest
+
+from nucleo.analizadorEarley import analizarEarley
+from nucleo.analizadorLL1 import EPSILON
+from nucleo.derivaciones import INFINITO, Derivaciones
+
+from .referencia import cadenasPrueba, gramaticaAleatoria, gramaticaTexto, hojasDerivacion, tramosDerivables
+
+LIMITE = 2000  # Árboles como máximo en la enumeración de referencia
+
+
+def particiones(der, inicio, fin, deriva, Vxt, tokens):
+    # Generador de los tramos [(símbolo, inicio, fin)] en que los símbolos de der cubren tokens[inicio:fin].
+    if not der:
+        if inicio == fin:
+            yield []
+        return
+    simbolo, resto = der[0], der[1:]
+    for medio in range(inicio, fin + 1):
+        if simbolo in Vxt:
+            if (simbolo, inicio, medio) not in deriva:
+                continue
+        elif medio != inicio + 1 or tokens[inicio] != simbolo:
+            continue
+        for cola in particiones(resto, medio, fin, deriva, Vxt, tokens):
+            yield [(simbolo, inicio, medio)] + cola
+
+
+def referencia(tokens, Vxt, S, P):
+    # Función para enumerar por fuerza bruta los árboles de tokens; retorna (cíclica, árboles).
+    # Si un tramo derivable se alcanza a sí mismo hay infinitos árboles; los árboles que se enumeran son
+    # entonces los que no repiten un tramo en un camino de la raíz a una hoja.
+    deriva = tramosDerivables(tokens, Vxt, P)
+    porIzquierda = {}
+    for izq, der in P:
+        porIzquierda.setdefault(izq, []).append([s for s in der if s != EPSILON])
+
+    def hijos(A, inicio, fin):
+        # Función para obtener las particiones de cada producción de A sobre el tramo.
+        return [tramos for der in porIzquierda[A] for tramos in particiones(der, inicio, fin, deriva, Vxt, tokens)]
+
+    def arboles(clave, enCurso):
+        # Generador de los árboles del tramo clave que no vuelven a un tramo de enCurso.
+        A, inicio, fin = clave
+        if A not in Vxt:
+            yield (A, ())
+            return
+        if clave in enCurso:
+            return
+        enCurso = enCurso | {clave}
+        for tramos in hijos(A, inicio, fin):
+            if not tramos:
+                yield (A, ((EPSILON, ()),))  # Producción vacía
+                continue
+            for combinacion in itertools.product(*[list(arboles(tramo, enCurso)) for tramo in tramos]):
+                yield (A, combinacion)
+
+    raiz = (S, 0, len(tokens))
+    if raiz not in deriva:
+        return False, set()
+    # Ciclo alcanzable desde la raíz en el grafo de tramos derivables (búsqueda en profundidad iterativa)
+    estado, ciclica = {raiz: 1}, False  # 1: en el camino actual, 2: terminado
+    pila = [(raiz, iter([t for tramos in hijos(*raiz) for t in tramos if t[0] in Vxt]))]
+    while pila and not ciclica:
+        clave, pendientes = pila[-1]
+        for hijo in pendientes:
+            if estado.get(hijo) == 1:
+                ciclica = True
+            elif hijo not in estado:
+                estado[hijo] = 1
+                pila.append((hijo, iter([t for tramos in hijos(*hijo) for t in tramos if t[0] in Vxt])))
+            else:
+                continue
+            break
+        else:
+            estado[clave] = 2
+            pila.pop()
+    return ciclica, set(itertools.islice(arboles(raiz, frozenset()), LIMITE + 1))
+
+
+def derivaciones(gramatica, tokens):
+    # Función para obtener las Derivaciones de tokens a partir del bosque de Earley (None si no es válida).
+    aceptada, bosque, _ = analizarEarley(tokens, *gramatica)
+    return Derivaciones(bosque) if aceptada else None
+
+
+def comprobar(gramatica, tokens):
+    # Función para comparar total(), arboles() y muestra() con la enumeración de referencia.
+    Vt, Vxt, S, P = gramatica
+    ciclica, esperados = referencia(tokens, Vxt, S, P)
+    resultado = derivaciones(gramatica, tokens)
+    if resultado is None:
+        assert not esperados, tokens
+        return
+    obtenidos = list(resultado.arboles())
+    assert len(obtenidos) == resultado.cantidadRecorrible()
+    assert len(set(obtenidos)) == len(obtenidos), tokens  # Cada número de orden da un árbol distinto
+    for arbol in obtenidos:
+        assert hojasDerivacion(arbol, Vxt, P) == tokens
+    if ciclica:
+        assert resultado.total() == INFINITO, tokens
+        assert obtenidos and set(obtenidos) <= esperados, tokens
+    else:
+        assert resultado.total() != INFINITO, tokens
+        if len(esperados) <= LIMITE:
+            assert set(obtenidos) == esperados, tokens
+        assert resultado.ambigua() == (resultado.total() > 1)
+    semilla = len(tokens)
+    assert resultado.muestra(random.Random(semilla)) == resultado.muestra(random.Random(semilla))
+    assert resultado.muestra(random.Random(semilla)) in obtenidos
+
+
+@pytest.mark.parametrize('n, esperado', [(1, 1), (2, 1), (3, 2), (5, 14), (8, 429), (12, 58786)])
+def test_numerosDeCatalan(n, esperado):
+    # S -> S S | a tiene tantos árboles para a^n como el número de Catalan C(n - 1)
+    resultado = derivaciones(gramaticaTexto('a', 'S', 'S -> S S | a'), ['a'] * n)
+    assert resultado.total() == esperado
+    assert resultado.ambigua() == (esperado > 1)
+    arbol = resultado.arbol(esperado - 1)
+    assert hojasDerivacion(arbol, {'S'}, [('S', ['S', 'S']), ('S', ['a'])]) == ['a'] * n
+    with pytest.raises(IndexError):
+        resultado.arbol(esperado)
+
+
+def test_catalanContraFuerzaBruta():
+    gramatica = gramaticaTexto('a', 'S', 'S -> S S | a')
+    for n in range(1, 7):
+        comprobar(gramatica, ['a'] * n)
+
+
+def test_conteoGrande():
+    # El conteo usa enteros exactos aunque supere cualquier tipo de tamaño fijo
+    resultado = derivaciones(gramaticaTexto('a', 'S', 'S -> S S | a'), ['a'] * 40)
+    assert resultado.total() == math.comb(78, 39) // 40 > 2 ** 64  # C(39)
+    assert len(resultado.muestra(random.Random(0))[1]) == 2
+
+
+@pytest.mark.parametrize('texto, tokens', [
+    ('S -> S | a', ['a']),
+    ('S -> A S | a; A -> ε | a', ['a', 'a']),
+    ('S -> A; A -> B; B -> A | a', ['a']),
+    ('S -> S S | a | ε', ['a', 'a']),
+])
+def test_ciclosDanInfinito(texto, tokens):
+    gramatica = gramaticaTexto('a', 'S', texto)
+    assert derivaciones(gramatica, tokens).total() == INFINITO
+    comprobar(gramatica, tokens)
+
+
+def test_epsilonSinCiclo():
+    gramatica = gramaticaTexto('a', 'S', 'S -> A a A; A -> ε | a')
+    assert derivaciones(gramatica, ['a', 'a']).total() == 2
+    comprobar(gramatica, ['a', 'a'])
+    comprobar(gramatica, ['a', 'a', 'a'])
+
+
+@pytest.mark.parametrize('semilla', range(40))
+def test_gramaticasAleatorias(semilla):
+    generador = random.Random(semilla)
+    gramatica = gramaticaAleatoria(generador)
+    for tokens in cadenasPrueba(*gramatica, generador, cantidad=8):
+        if len(tokens) <= 6:
+            comprobar(gramatica, tokens)
@@ -0,0 +1,57 @@
+# Pruebas del analizador de Earley: el veredicto coincide con el reconocedor de referencia en gramáticas
+# arbitrarias (recursivas por la izquierda, ambiguas, con ε), el árbol extraído es una derivación válida
+# y la recursión por la derecha no hace crecer los conjuntos de forma cuadrática.
+
+import random  # Gramáticas y cadenas aleatorias reproducibles
+
+import pytest
+
+from nucleo.analizadorEarley import analizarEarley, extraerArbol
+from nucleo.medicion import Medidor, SumideroMemoria
+
+from .referencia import cadenasPrueba, gramaticaAleatoria, gramaticaRepositorio, gramaticaTexto, hojasDerivacion, reconocer
+
+
+def comprobar(gramatica, cadenas):
+    # Función para comparar Earley con la referencia y verificar el árbol de cada cadena aceptada.
+    Vt, Vxt, S, P = gramatica
+    for tokens in cadenas:
+        aceptada, bosque, posicionError = analizarEarley(tokens, Vt, Vxt, S, P)
+        assert aceptada == reconocer(tokens, Vxt, S, P), tokens
+        if aceptada:
+            assert posicionError is None
+            assert hojasDerivacion(extraerArbol(bosque).aTuplas(), Vxt, P) == tokens
+        else:
+            assert 0 <= posicionError <= len(tokens)
+
+
+@pytest.mark.parametrize('archivo', ['aritmetica.txt', 'gramatica.txt', 'pruebas.txt', 'pruebas2.txt'])
+def test_gramaticasRepositorio(archivo):
+    gramatica = gramaticaRepositorio(archivo)
+    comprobar(gramatica, cadenasPrueba(*gramatica, random.Random(archivo), cantidad=20))
+
+
+@pytest.mark.parametrize('semilla', range(60))
+def test_gramaticasAleatorias(semilla):
+    generador = random.Random(semilla)
+    gramatica = gramaticaAleatoria(generador)
+    comprobar(gramatica, cadenasPrueba(*gramatica, generador))
+
+
+def test_recursionIzquierdaYAmbiguedad():
+    gramatica = gramaticaTexto(['a', '+'], 'S', 'S -> S S | S + S | a | ε')
+    comprobar(gramatica, [[], ['a'], ['a', 'a', 'a'], ['a', '+', 'a', '+', 'a'], ['+'], ['a', '+']])
+
+
+def test_recursionDerechaLineal():
+    # Con los ítems de Leo cada conjunto tiene una cantidad acotada de ítems en E' -> + T E'.
+    Vt, Vxt, S, P = gramaticaRepositorio('aritmetica.txt')
+    memoria = SumideroMemoria()
+    medidor = Medidor(memoria)
+    for terminos in (500, 2000):
+        tokens = ['1', '+'] * terminos + ['2']
+        aceptada, bosque, _ = analizarEarley(tokens, Vt, Vxt, S, P, medidor=medidor)
+        assert aceptada
+        assert hojasDerivacion(extraerArbol(bosque).aTuplas(), Vxt, P) == tokens
+    pequena, grande = memoria.mediciones
+    assert grande.extras['items'] / grande.tokens < 1.2 * pequena.extras['items'] / pequena.tokens
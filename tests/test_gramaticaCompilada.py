@@ -0,0 +1,82 @@
+# Pruebas de la caché de gramáticas compiladas: la segunda carga sale del archivo y las cachés dañadas,
+# de otra versión, de otro código o con un objeto que no es una GramaticaCompilada se recompilan.
+
+import os  # Rutas de la gramática y de los archivos de caché
+import pickle  # Archivos de caché escritos a mano
+
+import pytest
+
+from nucleo import gramaticaCompilada
+from nucleo.gramaticaCompilada import GramaticaCompilada, cargarGramaticaCompilada
+
+from .referencia import RAIZ
+
+ARCHIVO = os.path.join(RAIZ, 'aritmetica.txt')  # Gramática LL(1) del repositorio
+
+
+def archivoCache(directorio):
+    # Función para obtener la única entrada escrita en el directorio de caché.
+    [nombre] = os.listdir(directorio)
+    return os.path.join(directorio, nombre)
+
+
+def comprobarRecompilada(gramatica, directorio):
+    # Función para verificar que se compiló de nuevo y que la caché quedó reparada.
+    assert isinstance(gramatica, GramaticaCompilada) and gramatica.tabla is not None
+    with open(archivoCache(directorio), 'rb') as f:
+        version, guardada = pickle.load(f)
+    assert version == gramaticaCompilada.VERSION_CACHE and isinstance(guardada, GramaticaCompilada)
+
+
+@pytest.mark.parametrize('normalizar', [None, {}])
+def test_aciertoDeCache(tmp_path, normalizar):
+    primera = cargarGramaticaCompilada(ARCHIVO, str(tmp_path), normalizar=normalizar)
+    assert len(os.listdir(tmp_path)) == 1
+    primera.conflictos = ['marca']  # Solo una carga desde el archivo puede devolver la marca
+    with open(archivoCache(tmp_path), 'wb') as f:
+        pickle.dump((gramaticaCompilada.VERSION_CACHE, primera), f)
+    segunda = cargarGramaticaCompilada(ARCHIVO, str(tmp_path), normalizar=normalizar)
+    assert segunda.conflictos == ['marca']
+    assert (segunda.S, segunda.P, segunda.tabla) == (primera.S, primera.P, primera.tabla)
+    assert (segunda.normalizacion is None) == (normalizar is None)
+
+
+@pytest.mark.parametrize('contenido', [b'', b'no es un pickle', pickle.dumps('texto'), pickle.dumps((1, 2, 3)),
+                                       pickle.dumps((gramaticaCompilada.VERSION_CACHE, {'S': 'E'}))],
+                         ids=['vacio', 'basura', 'cadena', 'tupla', 'otroObjeto'])
+def test_cacheDanada(tmp_path, contenido):
+    cargarGramaticaCompilada(ARCHIVO, str(tmp_path))
+    with open(archivoCache(tmp_path), 'wb') as f:
+        f.write(contenido)
+    comprobarRecompilada(cargarGramaticaCompilada(ARCHIVO, str(tmp_path)), tmp_path)
+
+
+def test_otraVersion(tmp_path):
+    gramatica = cargarGramaticaCompilada(ARCHIVO, str(tmp_path))
+    gramatica.tabla = 'vieja'  # Si se usara esta entrada se notaría
+    with open(archivoCache(tmp_path), 'wb') as f:
+        pickle.dump((gramaticaCompilada.VERSION_CACHE - 1, gramatica), f)
+    comprobarRecompilada(cargarGramaticaCompilada(ARCHIVO, str(tmp_path)), tmp_path)
+
+
+def test_normalizadaNoSeConfundeConLaOriginal(tmp_path):
+    # Una entrada sin normalización guardada donde se espera la normalizada se descarta.
+    original = cargarGramaticaCompilada(ARCHIVO, str(tmp_path / 'original'))
+    cargarGramaticaCompilada(ARCHIVO, str(tmp_path / 'normalizada'), normalizar={})
+    with open(archivoCache(tmp_path / 'normalizada'), 'wb') as f:
+        pickle.dump((gramaticaCompilada.VERSION_CACHE, original), f)
+    normalizada = cargarGramaticaCompilada(ARCHIVO, str(tmp_path / 'normalizada'), normalizar={})
+    assert normalizada.normalizacion is not None
+
+
+def test_otroCodigo(tmp_path, monkeypatch):
+    # Con otra huella del código la entrada anterior no se lee: se escribe una nueva.
+    cargarGramaticaCompilada(ARCHIVO, str(tmp_path))
+    monkeypatch.setattr(gramaticaCompilada, '_huella', '0' * 16)
+    cargarGramaticaCompilada(ARCHIVO, str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_sinCacheNoEscribe(tmp_path):
+    cargarGramaticaCompilada(ARCHIVO, str(tmp_path), usarCache=False)
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,99 @@
+# Pruebas de la instrumentación: cada sumidero recibe una medición por análisis, también cuando el
+# analizador lanza una excepción, y el perfil de cProfile se detiene antes de que los demás sumideros
+# trabajen (la escritura de JSON no aparece en el perfil).
+
+import io  # Archivo en memoria para el sumidero JSON
+import json  # Lectura de las líneas escritas
+
+import pytest
+
+from nucleo.analizadorEarley import analizarEarley
+from nucleo.analizadorLL1 import analizarLL1
+from nucleo.gramaticaCompilada import GramaticaCompilada
+from nucleo.medicion import Medidor, SumideroJSON, SumideroMemoria, SumideroPerfil
+
+from .referencia import gramaticaRepositorio
+
+
+def aritmetica():
+    # Función para obtener la gramática aritmética compilada (es LL(1)).
+    gramatica = GramaticaCompilada(*gramaticaRepositorio('aritmetica.txt'))
+    assert gramatica.tabla is not None
+    return gramatica
+
+
+def analizarLL1Con(medidor, tokens):
+    # Función para analizar con la tabla LL(1) de la gramática aritmética; retorna el veredicto.
+    g = aritmetica()
+    return analizarLL1(tokens, g.tabla, g.Vt, g.S, medidor=medidor)[0]
+
+
+def funcionesPerfiladas(perfil):
+    # Función para obtener los nombres de las funciones que registró el perfil.
+    return {funcion for _, _, funcion in perfil.estadisticas().stats}
+
+
+def test_memoriaYResumen():
+    memoria = SumideroMemoria()
+    medidor = Medidor(memoria)
+    medidor.etiqueta = 7
+    assert analizarLL1Con(medidor, ['1', '+', '2'])
+    assert not analizarLL1Con(medidor, ['1', '+'])
+    valida, invalida = memoria.mediciones
+    assert (valida.motor, valida.etiqueta, valida.valido, valida.tokens, valida.consumidos) == ('ll1', 7, True, 3, 3)
+    assert (invalida.valido, invalida.consumidos) == (False, 2)
+    resumen = memoria.resumen()
+    assert resumen['analisis'] == 2
+    assert resumen['segundos'] == valida.segundos + invalida.segundos
+    assert dict(resumen['expansiones']) == {clave: valida.expansiones.get(clave, 0) + invalida.expansiones.get(clave, 0)
+                                            for clave in valida.expansiones.keys() | invalida.expansiones.keys()}
+
+
+def test_jsonUnaLineaPorAnalisis(tmp_path):
+    ruta = tmp_path / 'mediciones.jsonl'
+    sumidero = SumideroJSON(str(ruta))
+    medidor = Medidor(sumidero)
+    g = aritmetica()
+    analizarLL1Con(medidor, ['1', '*', '2'])
+    analizarEarley(['1', '+'], g.Vt, g.Vxt, g.S, g.P, g.earley, medidor=medidor)
+    medidor.cerrar()
+    assert sumidero.archivo.closed  # Cierra el archivo que abrió
+    lineas = [json.loads(linea) for linea in ruta.read_text(encoding='utf-8').splitlines()]
+    assert [(d['motor'], d['valido'], d['tokens']) for d in lineas] == [('ll1', True, 3), ('earley', False, 2)]
+
+    abierto = io.StringIO()
+    Medidor(SumideroJSON(abierto)).cerrar()
+    assert not abierto.closed  # Un archivo recibido abierto lo cierra el llamador
+
+
+def test_perfilNoIncluyeLosOtrosSumideros(tmp_path):
+    # El sumidero JSON va antes que el perfil, como en validarLote: su escritura no debe quedar perfilada.
+    perfil = SumideroPerfil(str(tmp_path / 'perfil.prof'))
+    medidor = Medidor(SumideroJSON(io.StringIO()), perfil)
+    assert analizarLL1Con(medidor, ['(', '1', '+', '2', ')'])
+    funciones = funcionesPerfiladas(perfil)
+    assert 'derivarLL1' in funciones
+    assert not {'dumps', 'encode', 'aDiccionario'} & funciones
+    medidor.cerrar()
+    assert (tmp_path / 'perfil.prof').stat().st_size > 0  # Guardado en el formato de cProfile -o
+
+
+def fueraDelAnalisis():
+    # Función llamada después de un análisis: no debe aparecer en el perfil.
+    return None
+
+
+@pytest.mark.parametrize('motor', ['ll1', 'earley'])
+def test_excepcionSeRegistraYDetieneElPerfil(motor):
+    memoria, perfil = SumideroMemoria(), SumideroPerfil()
+    medidor = Medidor(perfil, memoria)
+    g = aritmetica()
+    with pytest.raises((AttributeError, TypeError)):
+        if motor == 'll1':
+            analizarLL1(['1'], None, g.Vt, g.S, medidor=medidor)  # Sin tabla: falla dentro del análisis
+        else:
+            analizarEarley(['1'], g.Vt, g.Vxt, g.S, g.P, object(), medidor=medidor)  # Gramática preparada inválida
+    fueraDelAnalisis()
+    [medicion] = memoria.mediciones
+    assert (medicion.motor, medicion.valido) == (motor, None)
+    assert 'fueraDelAnalisis' not in funcionesPerfiladas(perfil)
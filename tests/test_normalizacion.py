@@ -0,0 +1,77 @@
+# Pruebas de la normalización: los árboles de la gramática normalizada se reportan como derivaciones
+# válidas de la gramática original, con las mismas hojas y el mismo árbol cuando la gramática no es ambigua.
+
+import random  # Gramáticas y cadenas aleatorias reproducibles
+
+import pytest
+
+from nucleo.analizadorEarley import analizarEarley, extraerArbol
+from nucleo.analizadorLL1 import construirTablaLL1
+from nucleo.normalizacion import normalizarGramatica
+
+from .referencia import cadenasPrueba, gramaticaAleatoria, gramaticaRepositorio, gramaticaTexto, hojasDerivacion
+
+CONFIGURACIONES = [{}, {'fnc': True}, {'epsilon': True}, {'unitarias': True},
+                   {'inutiles': True, 'epsilon': True, 'unitarias': True}, {'factorizar': False}]
+
+
+def arbolEarley(tokens, Vxt, S, P):
+    # Función para obtener un árbol de Earley como tuplas, o None si la cadena no pertenece al lenguaje.
+    valido, bosque, _ = analizarEarley(tokens, None, Vxt, S, P)
+    return extraerArbol(bosque).aTuplas() if valido else None
+
+
+def comprobarIdaVuelta(gramatica, normalizada, tokens):
+    # Función para analizar con la gramática normalizada y verificar el árbol reportado en la original.
+    Vt, Vxt, S, P = gramatica
+    arbol = arbolEarley(tokens, normalizada.Vxt, normalizada.S, normalizada.P)
+    assert (arbol is not None) == (arbolEarley(tokens, Vxt, S, P) is not None)
+    if arbol is None:
+        return None
+    assert hojasDerivacion(arbol, normalizada.Vxt, normalizada.P) == tokens
+    original = normalizada.arbolOriginal(arbol)
+    assert hojasDerivacion(original, Vxt, P) == tokens
+    return original
+
+
+@pytest.mark.parametrize('opciones', CONFIGURACIONES)
+def test_subarbolVacioCompartido(opciones):
+    # Las constantes ε quedan compartidas en dos niveles distintos del árbol reconstruido.
+    gramatica = gramaticaTexto('a', 'S', 'S -> A B; A -> B B; B -> ε | S a')
+    normalizada = normalizarGramatica(*gramatica, **opciones)
+    assert comprobarIdaVuelta(gramatica, normalizada, ['a']) is not None
+    assert comprobarIdaVuelta(gramatica, normalizada, ['a', 'a', 'a']) is not None
+
+
+def test_aritmeticaSinAmbiguedad():
+    # En una gramática no ambigua el árbol reportado es el mismo que da el análisis de la original.
+    gramatica = gramaticaTexto(['+', '*', '(', ')', 'n'], 'E', 'E -> E + T | T; T -> T * F | F; F -> ( E ) | n')
+    normalizada = normalizarGramatica(*gramatica)
+    construirTablaLL1(normalizada.Vt, normalizada.Vxt, normalizada.S, normalizada.P)  # Queda LL(1)
+    for cadena in ('n', 'n + n * n', '( n + n ) * n + n', 'n * ( ( n ) )'):
+        tokens = cadena.split()
+        assert comprobarIdaVuelta(gramatica, normalizada, tokens) == arbolEarley(tokens, *gramatica[1:])
+
+
+@pytest.mark.parametrize('archivo', ['aritmetica.txt', 'gramatica.txt'])
+def test_gramaticasRepositorio(archivo):
+    gramatica = gramaticaRepositorio(archivo)
+    generador = random.Random(archivo)
+    for opciones in CONFIGURACIONES:
+        normalizada = normalizarGramatica(*gramatica, **opciones)
+        for tokens in cadenasPrueba(*gramatica, generador):
+            original = comprobarIdaVuelta(gramatica, normalizada, tokens)
+            if original is not None and archivo == 'aritmetica.txt':  # No ambigua: el mismo árbol
+                assert original == arbolEarley(tokens, *gramatica[1:])
+
+
+@pytest.mark.parametrize('semilla', range(40))
+def test_idaVueltaAleatoria(semilla):
+    generador = random.Random(semilla)
+    gramatica = gramaticaAleatoria(generador)
+    cadenas = cadenasPrueba(*gramatica, generador)
+    for opciones in CONFIGURACIONES:
+        normalizada = normalizarGramatica(*gramatica, **opciones)
+        for tokens in cadenas:
+            comprobarIdaVuelta(gramatica, normalizada, tokens)
+
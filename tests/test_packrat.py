@@ -0,0 +1,105 @@
+# Pruebas del analizador packrat: el veredicto coincide con el reconocedor de referencia sobre gramáticas
+# sin recursión por la izquierda, los árboles son derivaciones válidas y las entradas largas no agotan la pila.
+
+import random  # Gramáticas y cadenas aleatorias reproducibles
+import sys  # Límite de recursión del intérprete
+
+import pytest
+
+from generarArbolDG import derivarArbol
+from nucleo.analizadorPackrat import RecursionIzquierda, derivarMemorizado
+from nucleo.gramaticaCompilada import GramaticaCompilada
+from nucleo.medicion import Medidor, SumideroMemoria
+from nucleo.normalizacion import normalizarGramatica
+
+from .referencia import (cadenasPrueba, gramaticaAleatoria, gramaticaRepositorio, gramaticaTexto, hojasDerivacion,
+                         reconocer, reglasPackrat)
+
+
+def comprobar(gramatica, cadenas, tamanoCache=None):
+    # Función para comparar el packrat sobre la gramática normalizada con la referencia sobre la original.
+    # Si la normalizada es LL(1) también se compara la derivación guiada por su tabla.
+    Vt, Vxt, S, P = gramatica
+    normalizada = normalizarGramatica(Vt, Vxt, S, P)
+    reglas = reglasPackrat(normalizada.P)
+    tabla = GramaticaCompilada(normalizada.Vt, normalizada.Vxt, normalizada.S, normalizada.P).tabla
+    for tokens in cadenas:
+        finales = derivarMemorizado(reglas, normalizada.S, tokens, tamanoCache)
+        assert (len(tokens) in finales) == reconocer(tokens, Vxt, S, P), tokens
+        for fin, arbol in finales.items():  # Cada derivación cubre exactamente el prefijo que indica
+            assert hojasDerivacion(arbol, normalizada.Vxt, normalizada.P) == tokens[:fin]
+        if tabla is not None:
+            guiados = derivarMemorizado(reglas, normalizada.S, tokens, tamanoCache, None, tabla)
+            assert len(guiados) <= 1 and set(guiados) <= set(finales), tokens
+            assert (len(tokens) in guiados) == (len(tokens) in finales), tokens
+            for fin, arbol in guiados.items():
+                assert hojasDerivacion(arbol, normalizada.Vxt, normalizada.P) == tokens[:fin]
+
+
+@pytest.mark.parametrize('archivo', ['aritmetica.txt', 'gramatica.txt', 'pruebas2.txt'])
+def test_gramaticasRepositorio(archivo):
+    gramatica = gramaticaRepositorio(archivo)
+    comprobar(gramatica, cadenasPrueba(*gramatica, random.Random(archivo), cantidad=20))
+
+
+@pytest.mark.parametrize('semilla', range(40))
+def test_gramaticasAleatorias(semilla):
+    generador = random.Random(semilla)
+    gramatica = gramaticaAleatoria(generador)
+    cadenas = cadenasPrueba(*gramatica, generador)
+    comprobar(gramatica, cadenas)
+    comprobar(gramatica, cadenas, tamanoCache=2)  # Descartar entradas solo cuesta recalcularlas
+
+
+def test_entradaLargaSinRecursion():
+    # Más pares anidados que el límite de recursión de Python.
+    Vt, Vxt, S, P = gramaticaRepositorio('aritmetica.txt')
+    reglas = reglasPackrat(P)
+    anidamiento = sys.getrecursionlimit()
+    tokens = ['('] * anidamiento + ['1'] + [')'] * anidamiento
+    assert len(tokens) in derivarMemorizado(reglas, S, tokens)
+    tokens = ['1', '+'] * anidamiento + ['2']  # Una cola E' anidada por término
+    assert len(tokens) in derivarMemorizado(reglas, S, tokens)
+    assert len(tokens) not in derivarMemorizado(reglas, S, tokens[:-1])
+
+
+def test_tablaLL1Lineal():
+    # Sin tabla cada E' de la lista guarda una posición final por término que le sigue (cuadrático); con la
+    # tabla LL(1) de la gramática normalizada cada par llega a una sola posición.
+    Vt, Vxt, S, P = gramaticaRepositorio('pruebas2.txt')
+    normalizada = normalizarGramatica(Vt, Vxt, S, P)
+    tabla = GramaticaCompilada(normalizada.Vt, normalizada.Vxt, normalizada.S, normalizada.P).tabla
+    assert tabla is not None
+    reglas = reglasPackrat(normalizada.P)
+    memoria = SumideroMemoria()
+    medidor = Medidor(memoria)
+    for terminos in (100, 400):
+        tokens = ['1', '+'] * terminos + ['2']
+        derivarMemorizado(reglas, normalizada.S, tokens, None, medidor)
+        finales = derivarMemorizado(reglas, normalizada.S, tokens, None, medidor, tabla)
+        assert list(finales) == [len(tokens)]
+        arbol, valida = derivarArbol(reglas, normalizada.S, tokens, tabla=tabla, normalizacion=normalizada)
+        assert valida and hojasDerivacion(arbol, Vxt, P) == tokens
+    sinTabla, conTabla = memoria.mediciones[0::2], memoria.mediciones[1::2]
+    porToken = lambda m: m.extras['finalesMemorizados'] / m.tokens
+    assert porToken(sinTabla[1]) > 3 * porToken(sinTabla[0])  # Crece con la entrada
+    assert porToken(conTabla[1]) < 1.1 * porToken(conTabla[0])  # Constante: lineal en total
+
+
+@pytest.mark.parametrize('S, texto, tokens', [
+    ('E', 'E -> E + T | T; T -> n', ['n', '+', 'n']),
+    ('S', 'S -> S S | a', ['a', 'a', 'a']),
+    ('S', 'S -> A S b | a; A -> ε | c', ['a', 'b']),  # Recursión oculta detrás de un anulable
+])
+def test_recursionIzquierdaSeRechaza(S, texto, tokens):
+    # Con recursión por la izquierda el par pendiente no tiene sus derivaciones: se lanza un error en lugar
+    # de dar un veredicto incompleto, y la gramática normalizada da el veredicto correcto
+    Vt, Vxt, S, P = gramaticaTexto('abcn+', S, texto)
+    with pytest.raises(RecursionIzquierda):
+        derivarMemorizado(reglasPackrat(P), S, tokens)
+    with pytest.raises(ValueError):
+        derivarArbol(reglasPackrat(P), S, tokens)
+    normalizada = normalizarGramatica(Vt, Vxt, S, P)
+    arbol, valida = derivarArbol(reglasPackrat(normalizada.P), normalizada.S, tokens, normalizacion=normalizada)
+    assert valida and reconocer(tokens, Vxt, S, P)
+    assert hojasDerivacion(arbol, Vxt, P) == tokens
@@ -0,0 +1,134 @@
+# Pruebas de la sesión incremental: después de cada edición el veredicto, la posición del error y el árbol
+# son los mismos que da un análisis completo del texto editado, y editar una lista larga solo reanaliza
+# la zona que cambió, esté donde esté.
+
+import os  # Ruta de la gramática del repositorio
+import random  # Textos y ediciones aleatorias reproducibles
+
+import pytest
+
+from nucleo.gramaticaCompilada import GramaticaCompilada, cargarGramaticaCompilada
+from nucleo.sesionIncremental import SesionIncremental
+
+from .referencia import RAIZ, gramaticaTexto
+
+
+def aritmetica():
+    # Función para compilar aritmetica.txt sin tocar la caché del usuario.
+    return cargarGramaticaCompilada(os.path.join(RAIZ, 'aritmetica.txt'), usarCache=False)
+
+
+def preorden(sesion):
+    # Función para aplanar el árbol en preorden como (símbolo, cantidad de hijos, tokens que cubre); comparar
+    # tuplas anidadas de una lista larga agotaría la recursión.
+    arbol, resultado, pila = sesion.arbol, [], [0]
+    while pila:
+        nodo = pila.pop()
+        hijos = list(arbol.hijos(nodo))
+        resultado.append((arbol.etiqueta(nodo), len(hijos), sesion.longitudes[nodo]))
+        pila.extend(reversed(hijos))
+    return resultado
+
+
+def hojasVivas(sesion):
+    # Función para obtener los nodos terminales del árbol actual en el orden de los tokens.
+    arbol, hojas, pila = sesion.arbol, [], [0]
+    while pila:
+        nodo = pila.pop()
+        if arbol.etiqueta(nodo) in sesion.gramatica.Vt:
+            hojas.append(nodo)
+        pila.extend(reversed(list(arbol.hijos(nodo))))
+    return hojas
+
+
+def comprobarIgualACompleto(sesion):
+    # Función para comparar la sesión con una sesión nueva sobre el mismo texto.
+    completa = SesionIncremental(sesion.gramatica, sesion.texto)
+    assert sesion.tokens == completa.tokens, sesion.texto
+    assert sesion.inicios == completa.inicios, sesion.texto
+    assert (sesion.valida, sesion.posicionError) == (completa.valida, completa.posicionError), sesion.texto
+    if sesion.valida:
+        assert preorden(sesion) == preorden(completa), sesion.texto
+        assert list(sesion.hojas) == hojasVivas(sesion)  # El índice de hojas apunta al árbol actual
+
+
+def expresionAleatoria(aleatorio, profundidad=0):
+    # Función para generar una expresión aritmética válida, con espacios al azar.
+    if profundidad > 3 or aleatorio.random() < 0.4:
+        texto = aleatorio.choice('0123456789')
+    elif aleatorio.random() < 0.3:
+        texto = '(' + expresionAleatoria(aleatorio, profundidad + 1) + ')'
+    else:
+        texto = expresionAleatoria(aleatorio, profundidad + 1) + aleatorio.choice('+-*/') + \
+            expresionAleatoria(aleatorio, profundidad + 1)
+    return texto + ' ' * (aleatorio.random() < 0.2)
+
+
+def editarAlAzar(sesion, aleatorio, alfabeto):
+    # Función para aplicar una edición al azar: insertar, borrar o reemplazar unos pocos caracteres.
+    desplazamiento = aleatorio.randint(0, len(sesion.texto))
+    eliminados = aleatorio.randint(0, min(3, len(sesion.texto) - desplazamiento))
+    insertado = ''.join(aleatorio.choice(alfabeto) for _ in range(aleatorio.randint(0, 3)))
+    sesion.editar(desplazamiento, eliminados, insertado)
+
+
+@pytest.mark.parametrize('semilla', range(40))
+def test_edicionesAleatoriasComoAnalisisCompleto(semilla):
+    # 40 semillas por 100 ediciones: 4000 ediciones comparadas con el análisis completo
+    aleatorio = random.Random(semilla)
+    gramatica = aritmetica()
+    sesion = SesionIncremental(gramatica, expresionAleatoria(aleatorio))
+    for _ in range(100):
+        if aleatorio.random() < 0.7:  # Ediciones que suelen dejar el texto válido
+            editarAlAzar(sesion, aleatorio, '0123456789+*')
+        else:
+            editarAlAzar(sesion, aleatorio, '0123456789+-*/() x')
+        comprobarIgualACompleto(sesion)
+        if len(sesion.texto) > 80 or not sesion.texto:
+            sesion = SesionIncremental(gramatica, expresionAleatoria(aleatorio))
+
+
+@pytest.mark.parametrize('semilla', range(10))
+def test_terminalesLargos(semilla):
+    # Con terminales de varios caracteres el léxico debe volver a empezar antes de la edición
+    Vt, Vxt, S, P = gramaticaTexto(['x', 'xy', 'xyz', '+', '(', ')'], 'E',
+                                   "E -> T R; R -> + T R | ε; T -> x | xy | xyz | ( E )")
+    gramatica = GramaticaCompilada(Vt, Vxt, S, P)
+    aleatorio = random.Random(semilla)
+    sesion = SesionIncremental(gramatica, 'x+xy+(xyz+x)')
+    for _ in range(100):
+        editarAlAzar(sesion, aleatorio, 'xyz+() ')
+        comprobarIgualACompleto(sesion)
+        if len(sesion.texto) > 60 or not sesion.texto:
+            sesion = SesionIncremental(gramatica, 'x+xy+(xyz+x)')
+
+
+@pytest.mark.parametrize('posicion', [0.0, 0.5, 0.999])
+def test_edicionEnListaLargaSoloReanalizaLaZona(posicion):
+    # En la lista recursiva por la derecha 1+1+...+1 cambiar un dígito reanaliza unos pocos tokens,
+    # sea al principio, en el medio o al final
+    terminos = 5000
+    sesion = SesionIncremental(aritmetica(), '+'.join(['1'] * terminos))
+    desplazamiento = 2 * int(posicion * terminos)  # Un dígito
+    assert sesion.editar(desplazamiento, 1, '7')
+    assert sesion.reanalizados <= 3
+    assert sesion.editar(desplazamiento, 1, '(2*3)')  # Reemplazar un término por una expresión
+    assert sesion.reanalizados <= 8
+    assert sesion.editar(desplazamiento + 5, 0, '-4')  # Insertar un término nuevo después de él
+    assert sesion.reanalizados <= 8
+    comprobarIgualACompleto(sesion)
+    assert sesion.editar(desplazamiento, 8, '')  # Borrar los dos términos y el signo que los sigue
+    assert sesion.reanalizados <= 8
+    comprobarIgualACompleto(sesion)
+
+
+def test_errorYRecuperacion():
+    sesion = SesionIncremental(aritmetica(), '1+2*3')
+    assert not sesion.editar(1, 1, '*+')
+    assert sesion.posicionError == 2
+    assert sesion.editar(2, 1, '')
+    comprobarIgualACompleto(sesion)
+    assert not sesion.editar(0, 0, 'x')  # Error léxico
+    assert sesion.posicionError == 0
+    assert sesion.editar(0, 1, '')
+    comprobarIgualACompleto(sesion)
@@ -0,0 +1,86 @@
+# Pruebas del modo por lotes: una línea que falla no detiene el resto del lote, la línea de comandos
+# escribe una línea JSON por entrada y el modo paralelo da la misma salida que el secuencial.
+
+import json  # Lectura de la salida JSON por líneas
+import os  # Ruta de la gramática del repositorio
+import subprocess  # Ejecución de validarLote.py como programa
+import sys  # Intérprete actual
+
+import pytest
+
+from nucleo.gramaticaCompilada import cargarGramaticaCompilada
+import validarLote
+from validarLote import compilarMotor, crearAnalizador, crearLexico, main, validarLineas
+
+from .referencia import RAIZ
+
+
+def analizadorAritmetica():
+    # Función para cargar aritmetica.txt (sin tocar la caché del usuario) y su analizador LL(1).
+    compilado = compilarMotor(cargarGramaticaCompilada(os.path.join(RAIZ, 'aritmetica.txt'), usarCache=False))
+    return crearAnalizador(compilado), crearLexico(compilado)
+
+
+def test_errorEnUnaLineaNoDetieneElLote():
+    analizar, lexico = analizadorAritmetica()
+
+    def analizarConFallo(tokens, arbol, conArbol):
+        # Función que falla solo con la segunda línea, como lo haría un error interno del motor.
+        if '+' in tokens:
+            raise RuntimeError('fallo interno')
+        return analizar(tokens, arbol, conArbol)
+
+    resultados = list(validarLineas(['1\n', '1 + 2\n', '( 3 )\n', '2 *\n'], analizarConFallo, lexico, conArbol=True))
+    assert [r['linea'] for r in resultados] == [1, 2, 3, 4]
+    assert resultados[1] == {'linea': 2, 'cadena': '1 + 2', 'valida': None, 'posicionError': None,
+                             'error': 'RuntimeError: fallo interno'}
+    assert 'error' not in resultados[0] and resultados[0]['valida']
+    assert resultados[2]['valida'] and 'arbol' in resultados[2]  # El árbol reutilizado sigue sirviendo
+    assert resultados[3]['valida'] is False
+
+
+def test_lineaSinErroresTalCual():
+    analizar, lexico = analizadorAritmetica()
+    resultados = list(validarLineas(['1 + 2', '1 +'], analizar, lexico, inicio=5))
+    assert [(r['linea'], r['valida']) for r in resultados] == [(5, True), (6, False)]
+    assert all('error' not in r for r in resultados)
+
+
+def test_loteDesdeLaLineaDeComandos():
+    salida = subprocess.run([sys.executable, 'validarLote.py', 'aritmetica.txt', '--procesos', '1', '--sin-cache'],
+                            input='1 + 2\n1 +\n', capture_output=True, text=True, cwd=RAIZ)
+    assert salida.returncode == 0, salida.stderr
+    assert [json.loads(l)['valida'] for l in salida.stdout.splitlines()] == [True, False]
+
+
+def test_paraleloIgualQueSecuencial():
+    # Bloques de una línea repartidos entre dos procesos: la salida debe ser la misma y en el mismo orden.
+    entrada = ''.join(f"{'( ' * (k % 4)}{k} + {k % 7} * 2{' )' * (k % 4)}\n" for k in range(40)) + '1 +\n1 ? 2\n\n( 3 )\n'
+    salidas = []
+    for opciones in (['--procesos', '1'], ['--procesos', '2', '--tamano-bloque', '1']):
+        salida = subprocess.run([sys.executable, 'validarLote.py', 'aritmetica.txt', '--arbol', '--sin-cache', *opciones],
+                                input=entrada, capture_output=True, text=True, cwd=RAIZ)
+        assert salida.returncode == 0, salida.stderr
+        salidas.append(salida.stdout)
+    secuencial, paralelo = salidas
+    assert paralelo == secuencial
+    assert len(secuencial.splitlines()) == 44
+
+
+@pytest.mark.parametrize('procesos', ['-1', 'dos'])
+def test_procesosInvalidosSeRechazan(procesos, capsys):
+    with pytest.raises(SystemExit) as salida:
+        main([os.path.join(RAIZ, 'aritmetica.txt'), '--procesos', procesos])
+    assert salida.value.code == 2
+    assert '--procesos' in capsys.readouterr().err
+
+
+def test_pngSinMatplotlibSeRechazaAlInicio(tmp_path, monkeypatch, capsys):
+    # Sin matplotlib el lote termina antes de leer la entrada en lugar de reportar un error por cada línea.
+    monkeypatch.setattr(validarLote, 'pngDisponible', lambda: False)
+    imagenes = tmp_path / 'arboles'
+    with pytest.raises(SystemExit) as salida:
+        main([os.path.join(RAIZ, 'aritmetica.txt'), '--imagenes', str(imagenes), '--formato', 'png', '--sin-cache'])
+    assert salida.value.code == 2
+    assert 'matplotlib' in capsys.readouterr().err
+    assert not imagenes.exists()
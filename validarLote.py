@@ -0,0 +1,244 @@
+# Modo por lotes: valida expresiones línea por línea desde un archivo o desde la entrada estándar.
+# Carga la gramática una sola vez, no importa matplotlib ni NetworkX y escribe una línea JSON por entrada,
+# por lo que la memoria no depende del tamaño de la entrada. Si una línea falla, su JSON lleva un campo "error" y el lote sigue.
+#
+# Uso: python validarLote.py aritmetica.txt expresiones.txt --arbol > resultados.jsonl
+#      cat expresiones.txt | python validarLote.py gramatica.txt
+#      python validarLote.py aritmetica.txt expresiones.txt --procesos 0 --tamano-bloque 5000
+#      python validarLote.py aritmetica.txt expresiones.txt --imagenes arboles/ --formato png
+#      python validarLote.py gramatica.txt expresiones.txt --normalizar recursionIzquierda factorizar --arbol
+#      python validarLote.py gramatica.txt expresiones.txt --medicion medicion.jsonl --perfil analisis.prof
+
+import argparse  # Lectura de los argumentos de la línea de comandos
+import json  # Salida en formato JSON por líneas
+import os  # Rutas de las imágenes de los árboles
+import sys  # Entrada y salida estándar
+
+from nucleo.analizadorEarley import analizarEarley, extraerArbol  # Analizador general
+from nucleo.analizadorLL1 import analizarLL1  # Analizador predictivo
+from nucleo.arbolCompacto import ArbolCompacto  # Árbol reutilizable entre líneas
+from nucleo.disenoArbol import desdeArbolCompacto, guardarImagen, pngDisponible  # Dibujo de árboles sin ventana
+from nucleo.gramaticaCompilada import cargarGramaticaCompilada  # Gramática compilada con caché en disco
+from nucleo.lexico import ErrorLexico, obtenerLexico  # Léxico compartido de coincidencia más larga
+from nucleo.medicion import Medidor, SumideroJSON, SumideroPerfil  # Instrumentación opcional de los análisis
+from nucleo.normalizacion import OPCIONES  # Transformaciones que se pueden pedir con --normalizar
+
+
+def tokenizar(cadena, lexico):
+    # Función para dividir la cadena en terminales; retorna los tokens y la posición de cada uno en la cadena.
+    # Lanza ErrorLexico si algún carácter no forma parte de ningún terminal.
+    tokens, posiciones = [], []
+    for tipo, inicio, _ in lexico.tokenizar(cadena):
+        tokens.append(tipo)
+        posiciones.append(inicio)
+    return tokens, posiciones
+
+
+def compilarMotor(gramatica, motor='auto'):
+    # Función para elegir el analizador y tomar sus tablas de la gramática compilada.
+    # Retorna una tupla de datos simples (se puede enviar a otros procesos) cuyo primer elemento es el motor elegido
+    # y el último la normalización con la que se vuelve a la gramática del archivo (o None).
+    if motor in ('auto', 'll1'):
+        if gramatica.tabla is not None:
+            return ('ll1', gramatica.Vt, gramatica.S, gramatica.tabla, gramatica.normalizacion)
+        if motor == 'll1':
+            raise gramatica.errorLL1()  # Se pidió explícitamente el motor LL(1)
+        print(f"{gramatica.errorLL1()}\nSe usará el analizador de Earley.", file=sys.stderr)  # Reporta los conflictos
+    return ('earley', gramatica.Vt, gramatica.Vxt, gramatica.S, gramatica.P, gramatica.earley, gramatica.normalizacion)
+
+
+def crearLexico(compilado):
+    # Función para obtener el léxico de los terminales del motor compilado (Vt es el segundo elemento en ambos motores).
+    return obtenerLexico(compilado[1])
+
+
+def crearAnalizador(compilado, medidor=None):
+    # Función para crear analizar(tokens, arbol, conArbol) -> (valida, arbol, posicionError) a partir del motor compilado.
+    # Con un Medidor cada análisis queda registrado en sus sumideros.
+    # La posición de error se da en tokens y el árbol usa las producciones del archivo aunque se analice la normalizada.
+    normalizacion = compilado[-1]
+    if compilado[0] == 'll1':
+        _, Vt, S, tabla, _ = compilado
+
+        def analizarMotor(tokens, arbol, conArbol):
+            return analizarLL1(tokens, tabla, Vt, S, arbol, medidor)
+    else:
+        _, Vt, Vxt, S, P, gramatica, _ = compilado
+
+        def analizarMotor(tokens, arbol, conArbol):
+            aceptada, bosque, posicionError = analizarEarley(tokens, Vt, Vxt, S, P, gramatica, conArbol, medidor)
+            return aceptada, extraerArbol(bosque, arbol) if bosque else None, posicionError
+    if normalizacion is None:
+        return analizarMotor
+
+    def analizar(tokens, arbol, conArbol):
+        valida, arbol, posicionError = analizarMotor(tokens, arbol, conArbol)
+        if valida and conArbol:
+            arbol = normalizacion.arbolOriginal(arbol)  # Árbol con las producciones del archivo
+        return valida, arbol, posicionError
+    return analizar
+
+
+def validarLinea(cadena, analizar, lexico, arbol=None, conArbol=False, imagen=None):
+    # Función para validar una cadena; retorna el diccionario que se escribe como JSON.
+    # Si se da la ruta imagen (.svg o .png), el árbol de las cadenas válidas se dibuja en ese archivo.
+    try:
+        tokens, posiciones = tokenizar(cadena, lexico)
+    except ErrorLexico as e:
+        return {'cadena': cadena, 'valida': False, 'posicionError': e.posicion}  # Carácter que no forma ningún terminal
+    valida, arbol, posicionError = analizar(tokens, arbol, conArbol or imagen is not None)
+    if posicionError is not None:
+        posicionError = posiciones[posicionError] if posicionError < len(posiciones) else len(cadena)  # Posición en caracteres
+    resultado = {'cadena': cadena, 'valida': valida, 'posicionError': posicionError}
+    if conArbol and valida:
+        resultado['arbol'] = arbol.aListas()  # Árbol como listas anidadas [simbolo, hijos]
+    if imagen is not None and valida:
+        guardarImagen(*desdeArbolCompacto(arbol), imagen, titulo=cadena)
+        resultado['imagen'] = imagen
+    return resultado
+
+
+def validarLineas(lineas, analizar, lexico, conArbol=False, inicio=1, imagenes=None, formato='svg', medidor=None):
+    # Generador que valida cada línea a medida que se lee; un solo árbol se reutiliza para todas.
+    # Con imagenes (un directorio) se dibuja el árbol de cada línea válida en linea<numero>.<formato>.
+    # Con medidor (el mismo que recibió crearAnalizador) cada medición lleva el número de línea como etiqueta.
+    # Un error inesperado en una línea se reporta en su campo 'error' y el lote sigue con la siguiente.
+    arbol = ArbolCompacto()
+    for numero, linea in enumerate(lineas, inicio):
+        if medidor is not None:
+            medidor.etiqueta = numero
+        cadena = linea.rstrip('\r\n')  # Quita solo el salto de línea
+        imagen = os.path.join(imagenes, f'linea{numero}.{formato}') if imagenes else None
+        try:
+            resultado = validarLinea(cadena, analizar, lexico, arbol, conArbol, imagen)
+        except Exception as e:
+            resultado = {'cadena': cadena, 'valida': None, 'posicionError': None, 'error': f"{type(e).__name__}: {e}"}
+            arbol = ArbolCompacto()  # El árbol reutilizado pudo quedar a medio construir
+        yield {'linea': numero, **resultado}
+
+
+_analizador = None  # Analizador de cada proceso trabajador, creado una vez por proceso
+_opciones = None  # (lexico, conArbol) de cada proceso trabajador
+_imagenes = None  # (directorio, formato) de las imágenes de cada proceso trabajador
+
+
+def _iniciarTrabajador(compilado, conArbol, imagenes=None, formato='svg'):
+    # Inicializa un proceso trabajador con el motor ya compilado por el proceso principal.
+    global _analizador, _opciones, _imagenes
+    _analizador = crearAnalizador(compilado)
+    _opciones = (crearLexico(compilado), conArbol)
+    _imagenes = (imagenes, formato)
+
+
+def _validarBloque(bloque):
+    # Valida un bloque (numeroInicial, lineas) en un trabajador; retorna las líneas JSON ya serializadas.
+    inicio, lineas = bloque
+    return [json.dumps(resultado, ensure_ascii=False)
+            for resultado in validarLineas(lineas, _analizador, *_opciones, inicio, *_imagenes)]
+
+
+def leerBloques(lineas, tamanoBloque):
+    # Generador que agrupa las líneas en bloques (numeroInicial, lineas) sin leer toda la entrada.
+    if tamanoBloque < 1:  # Con bloques sin límite toda la entrada terminaría en memoria
+        raise ValueError(f"El tamaño de bloque debe ser al menos 1 (se recibió {tamanoBloque}).")
+    bloque, inicio = [], 1
+    for numero, linea in enumerate(lineas, 1):
+        bloque.append(linea)
+        if len(bloque) == tamanoBloque:
+            yield inicio, bloque
+            bloque, inicio = [], numero + 1
+    if bloque:
+        yield inicio, bloque
+
+
+def validarEnParalelo(lineas, compilado, procesos=None, tamanoBloque=1000, conArbol=False, imagenes=None, formato='svg'):
+    # Generador de líneas JSON en el orden de la entrada, validando bloques en un grupo de procesos.
+    # Solo hay a la vez unos pocos bloques por proceso en vuelo, así la memoria no crece con la entrada.
+    import multiprocessing  # Solo se necesita en el modo paralelo
+    from collections import deque
+
+    procesos = procesos or multiprocessing.cpu_count()
+    enVuelo = deque()  # Resultados pendientes en el orden de la entrada
+    with multiprocessing.Pool(procesos, _iniciarTrabajador, (compilado, conArbol, imagenes, formato)) as grupo:
+        for bloque in leerBloques(lineas, tamanoBloque):
+            enVuelo.append(grupo.apply_async(_validarBloque, (bloque,)))
+            if len(enVuelo) >= 2 * procesos:  # Ventana llena: espera el bloque más antiguo
+                yield from enVuelo.popleft().get()
+        while enVuelo:
+            yield from enVuelo.popleft().get()
+
+
+def enteroPositivo(texto, minimo=1):
+    # Función para leer un argumento entero mayor o igual que minimo (1 por omisión).
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{texto}' no es un número entero")
+    if valor < minimo:
+        raise argparse.ArgumentTypeError(f"debe ser al menos {minimo} (se recibió {valor})")
+    return valor
+
+
+def enteroNoNegativo(texto):
+    # Función para leer un argumento entero mayor o igual que 0.
+    return enteroPositivo(texto, 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Valida expresiones por lotes y escribe una línea JSON por entrada.")
+    parser.add_argument('gramatica', help="archivo de gramática (formato Vt/Vxt/S/P o reglas con '|')")
+    parser.add_argument('entrada', nargs='?', default='-', help="archivo de expresiones, una por línea ('-' para la entrada estándar)")
+    parser.add_argument('--motor', choices=('auto', 'll1', 'earley'), default='auto',
+                        help="analizador a usar; 'auto' usa LL(1) si la gramática lo permite y si no Earley")
+    parser.add_argument('--arbol', action='store_true', help="incluir el árbol de derivación de las cadenas válidas")
+    parser.add_argument('--imagenes', help="directorio donde se dibuja el árbol de cada cadena válida (linea<numero>.svg)")
+    parser.add_argument('--formato', choices=('svg', 'png'), default='svg', help="formato de las imágenes (png requiere matplotlib)")
+    parser.add_argument('--procesos', type=enteroNoNegativo, default=1, help="procesos de trabajo (0 usa todos los núcleos; 1 no usa procesos)")
+    parser.add_argument('--tamano-bloque', type=enteroPositivo, default=1000, help="líneas por bloque enviado a cada proceso")
+    parser.add_argument('--sin-cache', action='store_true', help="no leer ni escribir la caché de gramáticas compiladas")
+    parser.add_argument('--medicion', help="archivo donde se agrega una línea JSON con los contadores de cada análisis")
+    parser.add_argument('--perfil', help="archivo donde se guarda el perfil de cProfile de los análisis (se lee con pstats)")
+    parser.add_argument('--normalizar', nargs='*', choices=OPCIONES, metavar='OPCION',
+                        help="analizar sobre la gramática transformada (sin opciones: recursionIzquierda y factorizar; "
+                             f"disponibles: {', '.join(OPCIONES)}); los árboles se reportan con la gramática del archivo")
+    args = parser.parse_args(argv)
+    if (args.medicion or args.perfil) and args.procesos != 1:
+        parser.error("--medicion y --perfil requieren --procesos 1")
+    if args.imagenes and args.formato == 'png' and not pngDisponible():  # Si no, cada línea válida daría el mismo error
+        parser.error("--formato png requiere matplotlib (pip install matplotlib); use --formato svg para dibujar sin él")
+    normalizar = None  # Gramática tal cual
+    if args.normalizar is not None:
+        normalizar = {opcion: opcion in args.normalizar for opcion in OPCIONES} if args.normalizar else {}
+
+    medidor = None  # Sin instrumentación salvo que se pida
+    try:
+        sumideros = ([SumideroJSON(args.medicion)] if args.medicion else []) + ([SumideroPerfil(args.perfil)] if args.perfil else [])
+        if sumideros:
+            medidor = Medidor(*sumideros)
+        gramatica = cargarGramaticaCompilada(args.gramatica, usarCache=not args.sin_cache,
+                                             normalizar=normalizar)  # Tablas listas o calculadas una vez
+        compilado = compilarMotor(gramatica, args.motor)
+        if args.imagenes:
+            os.makedirs(args.imagenes, exist_ok=True)
+        entrada = sys.stdin if args.entrada == '-' else open(args.entrada, 'r', encoding='utf-8')
+        with entrada:
+            if args.procesos == 1:
+                resultados = (json.dumps(resultado, ensure_ascii=False)
+                              for resultado in validarLineas(entrada, crearAnalizador(compilado, medidor), crearLexico(compilado),
+                                                            args.arbol, 1, args.imagenes, args.formato, medidor))
+            else:
+                resultados = validarEnParalelo(entrada, compilado, args.procesos, args.tamano_bloque,
+                                               args.arbol, args.imagenes, args.formato)
+            for resultado in resultados:
+                sys.stdout.write(resultado + '\n')  # Una línea JSON por entrada
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)  # Maneja errores de lectura o de gramática
+        return 1
+    finally:
+        if medidor is not None:
+            medidor.cerrar()  # Escribe el perfil y cierra el archivo de mediciones
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())